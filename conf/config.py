@@ -1,7 +1,65 @@
-MAIN_URL = 'https://www.saucedemo.com/'
+import os
+
+STAND_IN = os.getenv("STAND_IN", "false").lower() == "true"
+STAND_IN_HOST = os.getenv("STAND_IN_HOST", "127.0.0.1")
+STAND_IN_PORT = int(os.getenv("STAND_IN_PORT", "8765"))
+STAND_IN_DELAY = float(os.getenv("STAND_IN_DELAY", "0"))
+STAND_IN_GLITCH_DELAY = float(os.getenv("STAND_IN_GLITCH_DELAY", "1.5"))
+STAND_IN_URL = f"http://{STAND_IN_HOST}:{STAND_IN_PORT}/"
+
+MAIN_URL = STAND_IN_URL if STAND_IN else 'https://www.saucedemo.com/'
 PAGE_TITLE = "Swag Labs"
 BAD_PASSWORD_ERROR = "Username and password do not match any user in this service"
 LOCKED_USER_ERROR = "Epic sadface: Sorry, this user has been locked out."
 EMPTY_LOGIN_ERROR = "Epic sadface: Username is required"
-URL_AFTER_LOGIN = "https://www.saucedemo.com/inventory.html"
-TIME_TO_WAIT = 15
\ No newline at end of file
+URL_AFTER_LOGIN = f"{MAIN_URL}inventory.html"
+TIME_TO_WAIT = 15
+WINDOW_SIZE = (1920, 1080)
+DEBUG_PORT_BASE = 9222
+DEBUG_PORTS_PER_WORKER = 100
+ALLURE_RESULTS_DIR = "allure-results"
+ALLURE_STREAM_DIR = os.getenv("ALLURE_STREAM_DIR", "")
+ALLURE_STREAM_CHUNK_RECORDS = 1000
+DURATIONS_FILE = ".test_durations.json"
+POLL_INTERVAL = 0.05
+POLL_BACKOFF = 1.5
+POLL_MAX_INTERVAL = 0.5
+WAIT_CALIBRATION = os.getenv("WAIT_CALIBRATION", "on")
+WAIT_CALIBRATION_PERCENTILE = 99
+WAIT_CALIBRATION_FACTOR = 2.0
+WAIT_CALIBRATION_MARGIN = 1.0
+WAIT_CALIBRATION_MIN_SAMPLES = 20
+WAIT_CALIBRATION_MAX_SAMPLES = 200
+ASYNC_SCRIPT_TIMEOUT = 60
+ARTIFACT_POLICY = os.getenv("ARTIFACT_POLICY", "failure")
+ARTIFACT_SAMPLE_RATE = float(os.getenv("ARTIFACT_SAMPLE_RATE", "0.1"))
+ARTIFACT_WRITERS = 2
+ARTIFACT_PNG_COMPRESSION = 9
+SESSION_TTL = int(os.getenv("SESSION_TTL", "600"))
+SESSION_PROBE_TIMEOUT = float(os.getenv("SESSION_PROBE_TIMEOUT", "3"))
+BENCHMARK_BASELINE_FILE = "benchmark_baseline.json"
+BENCHMARK_RUNS = 5
+BENCHMARK_THRESHOLD = 0.2
+BENCHMARK_MIN_DELTA = 0.05
+BENCHMARK_MIN_ROUND_TRIPS_DELTA = 2
+NETWORK_PROFILE = os.getenv("NETWORK_PROFILE", "default")
+SLOW_NETWORK_LATENCY_MS = 400
+SLOW_NETWORK_THROUGHPUT = 50 * 1024
+LOAD_CONCURRENCY = 4
+LOAD_DURATION = 30
+LOAD_MIX = "standard_user=4,locked_out_user=1,performance_glitch_user=2,wrong_password=1"
+RESULT_CACHE_TTL = 24 * 60 * 60
+RESULT_CACHE_MAX_ENTRIES = 1000
+CHROME_PROFILE_SNAPSHOT = os.getenv("CHROME_PROFILE_SNAPSHOT", "")
+CHROME_PROFILE_TMPFS = os.getenv("CHROME_PROFILE_TMPFS", "/dev/shm")
+SELENIUM_REMOTE_URL = os.getenv("SELENIUM_REMOTE_URL", "")
+SELENIUM_NODES = os.getenv("SELENIUM_NODES", "")
+PROTOCOL_TIER = os.getenv("PROTOCOL_TIER", "auto")
+STEP_METRICS_DB = os.getenv("STEP_METRICS_DB", "")
+STEP_METRICS_REPORT_DB = STEP_METRICS_DB or ".step_metrics.sqlite"
+STEP_METRICS_SLOW_STEP = float(os.getenv("STEP_METRICS_SLOW_STEP", "1"))
+PREFLIGHT = os.getenv("PREFLIGHT", "skip")
+PREFLIGHT_TIMEOUT = float(os.getenv("PREFLIGHT_TIMEOUT", "2"))
+PREFLIGHT_MAX_TTFB = float(os.getenv("PREFLIGHT_MAX_TTFB", "1.5"))
+ASYNC_COMMAND_TIMEOUT = 120
+ASYNC_SESSIONS = int(os.getenv("ASYNC_SESSIONS", "4"))
@@ -1,59 +1,522 @@
+import asyncio
+import inspect
+
 import allure
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+
+from conf.config import (
+    ALLURE_STREAM_DIR,
+    ARTIFACT_POLICY,
+    ARTIFACT_SAMPLE_RATE,
+    MAIN_URL,
+    NETWORK_PROFILE,
+    PREFLIGHT,
+    PROTOCOL_TIER,
+    STAND_IN,
+    STEP_METRICS_DB,
+    WAIT_CALIBRATION,
+)
+from pages.protocol_login_page import ProtocolLoginPage
+from utils import (
+    allure_stream,
+    artifacts,
+    network_profiles,
+    preflight,
+    result_cache,
+    stand_in,
+    step_metrics,
+    timeouts,
+)
+from utils.async_webdriver import AsyncHttpClient, create_async_driver
+from utils.driver_factory import create_driver
+from utils.driver_pool import AsyncDriverPool, DriverPool
+from utils.http_browser import HttpBrowser
+from utils.parallel import DurationRecorder
+from utils.scenarios import ScenarioBrowser
+from utils.session_cache import SessionCache
+from utils.startup import PHASES, startup_profiler
+
+
+driver_pool_key = pytest.StashKey[DriverPool]()
+async_driver_pool_key = pytest.StashKey[AsyncDriverPool]()
+artifact_capture_key = pytest.StashKey[artifacts.ArtifactCapture]()
+session_cache_key = pytest.StashKey[SessionCache]()
+result_cache_key = pytest.StashKey[result_cache.ResultCache]()
+step_metrics_key = pytest.StashKey[step_metrics.StepMetrics]()
+allure_stream_key = pytest.StashKey[allure_stream.AllureStream]()
+preflight_key = pytest.StashKey[preflight.ProbeResult]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sauce-demo")
+    group.addoption(
+        "--driver-pool",
+        choices=("session", "off"),
+        default="session",
+        help="session - переиспользовать браузеры между тестами (по умолчанию), "
+             "off - запускать новый браузер на каждый тест",
+    )
+    group.addoption(
+        "--record-durations",
+        metavar="PATH",
+        default=None,
+        help="Сохранить длительности тестов в JSON для распределения по воркерам",
+    )
+    group.addoption(
+        "--wait-calibration",
+        choices=timeouts.MODES,
+        default=WAIT_CALIBRATION,
+        help="on - таймауты ожиданий подбираются по времени прошлых прогонов "
+             "(по умолчанию), learn - только собирать замеры, off - фиксированные "
+             "таймауты",
+    )
+    group.addoption(
+        "--step-metrics",
+        metavar="PATH",
+        default=STEP_METRICS_DB,
+        help="База SQLite, в которую добавляется время шагов allure.step "
+             "(отчеты - python -m utils.step_metrics); по умолчанию не записывается",
+    )
+    group.addoption(
+        "--preflight",
+        choices=("abort", "skip", "off"),
+        default=PREFLIGHT,
+        help="Проверить доступность сайта до запуска браузеров: skip - "
+             "пропустить тесты с браузером, если сайт недоступен или медленный "
+             "(по умолчанию), abort - завершить их с ошибкой, off - не проверять",
+    )
+    group.addoption(
+        "--result-cache",
+        action="store_true",
+        default=False,
+        help="Пропускать тесты, прошедшие ранее с теми же исходниками "
+             "и окружением (по умолчанию выполняются все тесты)",
+    )
+    group.addoption(
+        "--protocol-tier",
+        choices=("auto", "off"),
+        default=PROTOCOL_TIER,
+        help="auto - тесты с маркером non_visual выполняются без браузера через "
+             "HTTP, если сайт заменен локальным сервером (STAND_IN=true); "
+             "off - все тесты выполняются в Chrome",
+    )
+    group.addoption(
+        "--network-profile",
+        choices=tuple(network_profiles.PROFILES),
+        default=NETWORK_PROFILE,
+        help="Сетевой профиль браузера для всех тестов: default, lean - без "
+             "картинок, шрифтов и сторонних сервисов, no-cache - без HTTP-кэша, "
+             "slow - медленная сеть, cached - медленная сеть с ресурсами из "
+             "HTTP-кэша. Тест может задать свой профиль маркером "
+             "network_profile",
+    )
+    group.addoption(
+        "--allure-stream",
+        metavar="DIR",
+        default=ALLURE_STREAM_DIR,
+        help="Писать результаты Allure в сжатые блоки в DIR вместо отдельных "
+             "файлов в --alluredir (выгрузка - python -m utils.allure_stream export)",
+    )
+    group.addoption(
+        "--artifacts",
+        choices=artifacts.POLICIES,
+        default=ARTIFACT_POLICY,
+        help="failure - скриншоты и исходный код страницы только при падении "
+             "(по умолчанию), always - также во всех контрольных точках, "
+             "sampled - также в контрольных точках доли тестов",
+    )
+    group.addoption(
+        "--multi-browser",
+        action="store_true",
+        default=False,
+        help="Запустить тесты с маркером multi_browser, которые открывают "
+             "сразу несколько браузеров (по умолчанию пропускаются)",
+    )
+    group.addoption(
+        "--artifacts-sample-rate",
+        type=float,
+        default=ARTIFACT_SAMPLE_RATE,
+        help="Доля тестов с контрольными точками при --artifacts=sampled",
+    )
+
+
+def pytest_configure(config):
+    path = config.getoption("--record-durations")
+    if path:
+        config.pluginmanager.register(DurationRecorder(path), "duration_recorder")
+
+    stream = allure_stream.install(config, config.getoption("--allure-stream"))
+    if stream:
+        config.stash[allure_stream_key] = stream
+
+    capture = artifacts.install(
+        config,
+        config.getoption("--artifacts"),
+        config.getoption("--artifacts-sample-rate"),
+    )
+    if capture:
+        config.stash[artifact_capture_key] = capture
+
+    timeouts.install(config, config.getoption("--wait-calibration"))
+
+    metrics = step_metrics.install(config, config.getoption("--step-metrics"))
+    if metrics:
+        config.stash[step_metrics_key] = metrics
+
+    cache = result_cache.install(config) if config.getoption("--result-cache") else None
+    if cache:
+        config.stash[result_cache_key] = cache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stand_in_server():
+    """
+    Фикстура локальной замены Sauce Demo на всю сессию.
+
+    Запускается только при STAND_IN=true; если сервер уже поднят
+    другим процессом (например, параллельным запуском), используется он.
+    """
+    if not STAND_IN:
+        yield None
+        return
+
+    server = stand_in.start_or_reuse()
+    yield server
+    if server:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def target_health(request, stand_in_server):
+    """
+    Фикстура проверки доступности сайта перед запуском первого браузера.
+
+    Ее запрашивают фикстуры браузеров (пулы и HttpBrowser), поэтому
+    тесты без браузера сайт не проверяют.
+
+    Результат проверки прикрепляется к отчету Allure. Если сайт недоступен
+    или отвечает медленнее PREFLIGHT_MAX_TTFB, тесты с браузером
+    пропускаются (--preflight=skip) или завершаются с ошибкой
+    (--preflight=abort), не дожидаясь таймаутов ожиданий в браузерах.
+    Результат фикстуры кэшируется на сессию, поэтому сайт проверяется
+    один раз, а тесты без браузера выполняются в любом случае.
+    """
+    mode = request.config.getoption("--preflight")
+    if mode == "off":
+        return None
+
+    with allure.step(f"Проверка доступности {MAIN_URL}"):
+        result = preflight.probe(MAIN_URL)
+        request.config.stash[preflight_key] = result
+        allure.attach(
+            preflight.describe(result),
+            name="preflight",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+    reason = preflight.problem(result)
+    if reason:
+        if mode == "abort":
+            pytest.fail(f"{reason} (--preflight=skip - пропустить тесты)", pytrace=False)
+        pytest.skip(reason)
+    return result
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, target_health):
+    """
+    Фикстура пула браузеров на всю сессию (или на процесс-воркер).
+
+    Возвращает None, если пул отключен опцией --driver-pool=off.
+    """
+    if request.config.getoption("--driver-pool") == "off":
+        yield None
+        return
+
+    pool = DriverPool(create_driver)
+    request.config.stash[driver_pool_key] = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    """
+    Фикстура цикла событий, в котором выполняются тесты async def.
+
+    Один цикл на сессию: асинхронные браузеры живут между тестами.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def async_driver_pool(request, async_loop, target_health):
+    """
+    Фикстура пула AsyncWebDriver на всю сессию (или на процесс-воркер).
+
+    Тест async def получает драйверы через await async_driver_pool.acquire()
+    и возвращает их через await async_driver_pool.release(driver); команды
+    всех браузеров идут через один AsyncHttpClient.
+    """
+    http = AsyncHttpClient()
+    pool = AsyncDriverPool(lambda: create_async_driver(http))
+    request.config.stash[async_driver_pool_key] = pool
+    yield pool
+    async_loop.run_until_complete(pool.close())
+    async_loop.run_until_complete(http.close())
+
+
+def pytest_collection_modifyitems(config, items):
+    multi_browser = config.getoption("--multi-browser")
+    for item in items:
+        # Тестам async def нужен цикл событий, даже если они его не запросили
+        if isinstance(item, pytest.Function) and inspect.iscoroutinefunction(item.obj):
+            if "async_loop" not in item.fixturenames:
+                item.fixturenames.append("async_loop")
+        if not multi_browser and item.get_closest_marker("multi_browser") is not None:
+            item.add_marker(pytest.mark.skip(
+                reason="открывает несколько браузеров - запуск с --multi-browser"
+            ))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Выполняет тест async def в цикле событий фикстуры async_loop."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {
+        name: pyfuncitem.funcargs[name]
+        for name in inspect.signature(pyfuncitem.obj).parameters
+    }
+    pyfuncitem.funcargs["async_loop"].run_until_complete(pyfuncitem.obj(**arguments))
+    return True
+
+
+@pytest.fixture(scope="function")
+def network_profile(request):
+    """
+    Фикстура сетевого профиля теста.
+
+    Берется из маркера @pytest.mark.network_profile("имя"),
+    а без маркера - из опции --network-profile.
+    """
+    marker = request.node.get_closest_marker("network_profile")
+    name = marker.args[0] if marker else request.config.getoption("--network-profile")
+    return network_profiles.get_profile(name)
 
 
 @allure.title("Подготовка драйвера")
 @pytest.fixture(scope="function")
-def chromedriver():
-    """
-    Фикстура для инициализации и закрытия браузера.
-    """
-    chrome_options = Options()
-
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--disable-extensions')
-    chrome_options.add_argument('--disable-infobars')
-    chrome_options.add_argument('--disable-browser-side-navigation')
-    chrome_options.add_argument('--disable-features=VizDisplayCompositor')
-    chrome_options.add_argument('--remote-debugging-port=9222')
-    chrome_options.add_argument('--window-size=1920,1080')
-
-    chrome_options.add_argument('--ignore-certificate-errors-spki-list')
-    chrome_options.add_argument('--ignore-ssl-errors')
-
-    chrome_options.add_argument('--disable-software-rasterizer')
-    chrome_options.add_argument('--disable-features=IsolateOrigins,site-per-process')
-    chrome_options.add_argument('--disable-background-networking')
-    chrome_options.add_argument('--disable-default-apps')
-    chrome_options.add_argument('--disable-sync')
-    chrome_options.add_argument('--metrics-recording-only')
-    chrome_options.add_argument('--disable-client-side-phishing-detection')
-    chrome_options.add_argument('--disable-popup-blocking')
-    chrome_options.add_argument('--disable-hang-monitor')
-    chrome_options.add_argument('--disable-prompt-on-repost')
-    chrome_options.add_argument('--disable-web-resources')
-    chrome_options.add_argument('--enable-automation')
-
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-
-    chrome_options.add_argument(
-        'user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36')
+def chromedriver(driver_pool, network_profile):
+    """
+    Фикстура для выдачи браузера тесту и его освобождения после теста.
 
+    При включенном пуле браузер берется из пула и сбрасывается после теста,
+    иначе запускается и закрывается отдельный экземпляр. К браузеру
+    применяется сетевой профиль теста, который записывается в отчет Allure.
+    """
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.implicitly_wait(10)
+        driver = driver_pool.acquire() if driver_pool else create_driver()
+    except Exception as e:
+        print(f"Ошибка при инициализации драйвера: {e}")
+        raise
 
-        driver.set_window_size(1920, 1080)
+    if network_profiles.apply_profile(driver, network_profile):
+        allure.dynamic.label("network_profile", network_profile.name)
 
-        yield driver
+    yield driver
+
+    if driver_pool:
+        driver_pool.release(driver)
+    else:
         driver.quit()
-    except Exception as e:
-        print(f"Ошибка при инициализации драйвера: {e}")
-        raise
\ No newline at end of file
+
+
+def uses_protocol_tier(item):
+    """
+    Проверяет, выполняется ли тест без браузера.
+
+    Args:
+        item: Тест pytest
+
+    Returns:
+        bool: True для тестов с маркером non_visual при --protocol-tier=auto
+        и локальной замене сайта (вход на настоящем Sauce Demo требует JavaScript).
+    """
+    return (
+        STAND_IN
+        and item.config.getoption("--protocol-tier") == "auto"
+        and item.get_closest_marker("non_visual") is not None
+    )
+
+
+@pytest.fixture(scope="session")
+def chrome_scenario_browser(driver_pool):
+    """
+    Фикстура браузера Chrome, общего для сценариев входа из таблицы.
+
+    Сценарии, завершившиеся на форме входа, оставляют страницу открытой
+    для следующего сценария; в остальных случаях браузер сбрасывается.
+    """
+    driver = driver_pool.acquire() if driver_pool else create_driver()
+    yield ScenarioBrowser(driver)
+    if driver_pool:
+        driver_pool.release(driver)
+    else:
+        driver.quit()
+
+
+@pytest.fixture(scope="session")
+def protocol_scenario_browser(target_health):
+    """Фикстура HttpBrowser, общего для сценариев входа, выполняемых без браузера."""
+    browser = HttpBrowser()
+    yield ScenarioBrowser(browser, page_class=ProtocolLoginPage, reset=HttpBrowser.reset)
+    browser.quit()
+
+
+@pytest.fixture(scope="function")
+def scenario_browser(request):
+    """
+    Фикстура общего браузера для сценария входа.
+
+    Тесты non_visual выполняются через HttpBrowser и ProtocolLoginPage
+    (см. uses_protocol_tier), остальные - в Chrome. Chrome запускается,
+    только если его запросил хотя бы один тест.
+    """
+    if uses_protocol_tier(request.node):
+        allure.dynamic.label("tier", "protocol")
+        return request.getfixturevalue("protocol_scenario_browser")
+    return request.getfixturevalue("chrome_scenario_browser")
+
+
+@pytest.fixture(scope="session")
+def session_cache(request):
+    """Фикстура кэша авторизованных сессий на всю сессию (или на процесс-воркер)."""
+    cache = SessionCache()
+    request.config.stash[session_cache_key] = cache
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture(scope="function")
+def login_as(session_cache, chromedriver):
+    """
+    Фикстура входа без прохождения формы логина.
+
+    Возвращает функцию login_as(username, password), которая открывает
+    страницу товаров от имени пользователя, восстанавливая сессию из кэша.
+    Через интерфейс вход выполняется только при первом обращении.
+    Для тестов, проверяющих сам вход, используйте LoginPage.
+    """
+    def login(username, password):
+        return session_cache.login(chromedriver, username, password)
+
+    return login
+
+
+@pytest.fixture(scope="function")
+def checkpoint(request, chromedriver):
+    """
+    Фикстура контрольных точек теста.
+
+    Возвращает функцию checkpoint(name), которая прикрепляет к отчету
+    скриншот текущего состояния браузера (для HttpBrowser - исходный код
+    страницы), если этого требует политика --artifacts. При политике
+    failure вызов ничего не делает.
+    """
+    capture = request.config.stash.get(artifact_capture_key, None)
+
+    def take(name):
+        if capture and capture.wants_checkpoint(request.node):
+            if isinstance(chromedriver, HttpBrowser):
+                capture.page_source(chromedriver, name)
+            else:
+                capture.screenshot(chromedriver, name)
+
+    return take
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    probe = config.stash.get(preflight_key, None)
+    if probe is not None:
+        terminalreporter.write_sep("-", "проверка доступности")
+        terminalreporter.write_line(preflight.describe(probe))
+
+    pool = config.stash.get(driver_pool_key, None)
+    if pool is not None:
+        terminalreporter.write_sep("-", "пул драйверов")
+        terminalreporter.write_line(
+            f"создано: {pool.created}, переиспользовано: {pool.reused}, "
+            f"пересоздано: {pool.recycled}"
+        )
+
+    async_pool = config.stash.get(async_driver_pool_key, None)
+    if async_pool is not None and async_pool.created:
+        terminalreporter.write_sep("-", "асинхронные браузеры")
+        terminalreporter.write_line(
+            f"создано: {async_pool.created}, переиспользовано: {async_pool.reused}, "
+            f"пересоздано: {async_pool.recycled}"
+        )
+
+    results = config.stash.get(result_cache_key, None)
+    if results is not None and results.hits:
+        terminalreporter.write_sep("-", "кэш результатов")
+        terminalreporter.write_line(
+            f"пропущено тестов, прошедших с теми же исходниками: {results.hits} "
+            f"(без --result-cache - запустить все)"
+        )
+
+    calibration = timeouts.wait_calibration
+    if calibration.shortened:
+        terminalreporter.write_sep("-", "калибровка ожиданий")
+        terminalreporter.write_line(
+            f"ожиданий с сокращенным таймаутом: {calibration.shortened}, "
+            f"из них истекло: {calibration.expired} "
+            f"(--wait-calibration=off - фиксированные таймауты)"
+        )
+
+    cache = config.stash.get(session_cache_key, None)
+    if cache is not None and cache.hits + cache.misses:
+        terminalreporter.write_sep("-", "кэш сессий")
+        terminalreporter.write_line(
+            f"из кэша: {cache.hits}, через интерфейс: {cache.misses}, "
+            f"сброшено: {cache.invalidated}"
+        )
+
+    capture = config.stash.get(artifact_capture_key, None)
+    if capture is not None and capture.captured:
+        terminalreporter.write_sep("-", "артефакты")
+        terminalreporter.write_line(
+            f"прикреплено: {capture.captured}, записано файлов: {capture.written}"
+        )
+
+    phases = startup_profiler.summary()
+    if phases:
+        launches = len(startup_profiler.timings)
+        from_snapshot = sum(t.snapshot for t in startup_profiler.timings)
+        terminalreporter.write_sep("-", "запуск браузеров")
+        terminalreporter.write_line(
+            f"запусков: {launches}, из снимка профиля: {from_snapshot}, "
+            f"в среднем {phases['total']:.2f} с"
+        )
+        terminalreporter.write_line(
+            ", ".join(f"{phase}: {phases[phase]:.3f} с" for phase in PHASES[:-1])
+        )
+
+    metrics = config.stash.get(step_metrics_key, None)
+    if metrics is not None and metrics.records:
+        terminalreporter.write_sep("-", "время шагов")
+        terminalreporter.write_line(
+            f"записано шагов: {len(metrics.records)} в {metrics.path} "
+            f"(отчет: python -m utils.step_metrics slowest)"
+        )
+
+    stream = config.stash.get(allure_stream_key, None)
+    if stream is not None and stream.logger.records:
+        terminalreporter.write_sep("-", "поток результатов allure")
+        terminalreporter.write_line(
+            f"записей: {stream.logger.records}, новых вложений: {stream.logger.blobs} "
+            f"в {stream.logger.directory} "
+            f"(выгрузка: python -m utils.allure_stream export {stream.logger.directory})"
+        )
@@ -0,0 +1,161 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.keys import Keys
+
+from pages.login_page import LoginPage
+from utils.waits import AsyncWaiter
+
+# Очистка поля и ввод текста одной командой, как в LoginPage
+_SELECT_ALL_AND_DELETE = Keys.CONTROL + "a" + Keys.NULL + Keys.DELETE
+
+
+class AsyncLoginPage:
+    """
+    Страница авторизации Sauce Demo для utils.async_webdriver.AsyncWebDriver.
+
+    Повторяет интерфейс LoginPage, но все методы - корутины: пока одна
+    страница ждет ответа браузера, цикл событий ведет другие. Локаторы
+    и таймауты - те же, что у LoginPage; форма находится одним скриптом
+    и переиспользуется до отправки.
+
+    Attributes:
+        driver: Экземпляр AsyncWebDriver
+        waiter: Объект AsyncWaiter
+    """
+
+    login_field = LoginPage.login_field
+    password_field = LoginPage.password_field
+    login_button = LoginPage.login_button
+    error_head = LoginPage.error_head
+    products_title = LoginPage.products_title
+    form = LoginPage.form
+    timeout = LoginPage.timeout
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Экземпляр AsyncWebDriver с открытой страницей логина
+        """
+        self.driver = driver
+        self.waiter = AsyncWaiter(self.driver)
+        self._form_elements = None
+
+    async def send_text(self, login, password):
+        """
+        Вводит данные в поля логина и пароля.
+
+        Args:
+            login: Имя пользователя для входа
+            password: Пароль для входа
+        """
+        # Время ожиданий после входа зависит от пользователя
+        self.waiter.context = login
+        try:
+            await self._fill(login, password)
+        except StaleElementReferenceException:
+            self._form_elements = None
+            await self._fill(login, password)
+
+    async def send_text_only_password(self, password):
+        """
+        Вводит только пароль, оставляя поле логина пустым.
+
+        Args:
+            password: Пароль для ввода
+        """
+        self.waiter.context = ""
+        try:
+            await self._fill(None, password)
+        except StaleElementReferenceException:
+            self._form_elements = None
+            await self._fill(None, password)
+
+    async def click_login_button(self):
+        """Нажимает на кнопку входа (Login)."""
+        try:
+            _, _, login_button = await self._find_form()
+            await login_button.click()
+        except StaleElementReferenceException:
+            self._form_elements = None
+            _, _, login_button = await self._find_form()
+            await login_button.click()
+        self._form_elements = None
+
+    async def is_error_displayed(self, timeout=10):
+        """
+        Returns:
+            bool: True если сообщение об ошибке появилось за timeout.
+        """
+        try:
+            await self.waiter.element(self.error_head, "visible", timeout)
+            return True
+        except Exception:
+            return False
+
+    async def get_error_text(self, timeout=10):
+        """
+        Returns:
+            str: Текст сообщения об ошибке или пустая строка, если оно
+                 не появилось за timeout.
+        """
+        try:
+            error_element = await self.waiter.element(self.error_head, "visible", timeout)
+            return await error_element.text()
+        except Exception:
+            return ""
+
+    async def wait_for_error_text(self, expected, timeout=10):
+        """
+        Ожидает сообщение об ошибке с указанным текстом.
+
+        Args:
+            expected: Ожидаемый фрагмент текста ошибки
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            bool: True если сообщение с таким текстом появилось за timeout.
+        """
+        async def has_text(driver):
+            error = await driver.find_element(*self.error_head)
+            return expected in await error.text()
+
+        try:
+            await self.waiter.until(has_text, timeout, f"ошибка: {expected}")
+            return True
+        except Exception:
+            return False
+
+    async def is_products_displayed(self, timeout=30):
+        """
+        Returns:
+            bool: True если заголовок 'Products' появился за timeout.
+        """
+        try:
+            await self.waiter.element(self.products_title, "visible", timeout)
+            return True
+        except Exception:
+            return False
+
+    async def is_login_button_clickable(self, timeout=30):
+        """
+        Returns:
+            bool: True если поля формы и кнопка Login стали доступны за timeout.
+        """
+        try:
+            await self._find_form(timeout)
+            return True
+        except Exception as e:
+            print(f"Поле логина не стало кликабельным за {timeout} секунд: {e}")
+            return False
+
+    async def _fill(self, login, password):
+        username_field, password_field, _ = await self._find_form()
+        if login is not None:
+            await username_field.send_keys(_SELECT_ALL_AND_DELETE, login)
+        await password_field.send_keys(_SELECT_ALL_AND_DELETE, password)
+
+    async def _find_form(self, timeout=None):
+        if self._form_elements is None:
+            self._form_elements = await self.waiter.elements(
+                self.form, "clickable", timeout or self.timeout
+            )
+        return self._form_elements
@@ -1,6 +1,41 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import functools
+
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from utils.waits import Waiter
+
+
+# Выделить все, отпустить модификатор и удалить: очистка поля и ввод
+# текста выполняются одной командой send_keys вместо clear() + send_keys().
+_SELECT_ALL_AND_DELETE = Keys.CONTROL + "a" + Keys.NULL + Keys.DELETE
+
+# Закрывает сообщение об ошибке кнопкой-крестиком, как пользователь; если
+# кнопки нет (страница без скриптов), удаляет сообщение из DOM.
+_DISMISS_ERROR_SCRIPT = """
+const error = document.querySelector(arguments[0]);
+if (!error) return;
+const button = error.querySelector("[data-test='error-button']");
+if (button) button.click(); else error.remove();
+"""
+
+
+def _replace_text(field, text):
+    field.send_keys(_SELECT_ALL_AND_DELETE, text)
+
+
+def _retry_on_stale(method):
+    """Повторяет действие с заново найденной формой, если элементы устарели."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except StaleElementReferenceException:
+            self._form_elements = None
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class LoginPage:
@@ -11,22 +46,31 @@ class LoginPage:
     предоставляя методы для ввода данных, нажатия кнопок и проверки состояния
     элементов.
 
+    Поля формы и кнопка входа находятся одним обращением к браузеру
+    и переиспользуются до перехода со страницы; если страница перерисовалась
+    и элементы устарели, форма находится заново.
+
     Attributes:
         driver: Экземпляр WebDriver для управления браузером
-        wait: Объект WebDriverWait для явных ожиданий
+        waiter: Объект Waiter для ожиданий без implicit wait
+        timeout: Таймаут ожидания полей формы в секундах
         login_field: Локатор поля для ввода имени пользователя
         password_field: Локатор поля для ввода пароля
         login_button: Локатор кнопки входа
         error_head: Локатор элемента с сообщением об ошибке
         products_title: Локатор заголовка страницы товаров
+        form: Локаторы формы входа, которые находятся вместе
 
     """
 
-    login_field = (By.XPATH, "//input[@placeholder='Username']")
-    password_field = (By.XPATH, "//input[@placeholder='Password']")
-    login_button = (By.XPATH, "//input[@type='submit']")
-    error_head = (By.XPATH, "//h3[@data-test='error']")
-    products_title = (By.XPATH, "//span[@class='title' and text()='Products']")
+    login_field = (By.ID, "user-name")
+    password_field = (By.ID, "password")
+    login_button = (By.ID, "login-button")
+    error_head = (By.CSS_SELECTOR, "h3[data-test='error']")
+    # Совпадение по тексту есть только в XPath
+    products_title = (By.XPATH, "//span[@data-test='title' and text()='Products']")
+    form = (login_field, password_field, login_button)
+    timeout = 10
 
     def __init__(self, driver):
         """
@@ -40,8 +84,10 @@ class LoginPage:
                               в течение заданного времени ожидания
         """
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = Waiter(self.driver)
+        self._form_elements = None
 
+    @_retry_on_stale
     def send_text(self, login, password):
         """
         Вводит данные в поля логина и пароля.
@@ -56,18 +102,13 @@ class LoginPage:
         Returns:
             None
         """
-        username_field = self.wait.until(
-            EC.visibility_of_element_located(self.login_field)
-        )
-        username_field.clear()
-        username_field.send_keys(login)
-
-        password_field = self.wait.until(
-            EC.visibility_of_element_located(self.password_field)
-        )
-        password_field.clear()
-        password_field.send_keys(password)
+        # Время ожиданий после входа зависит от пользователя
+        self.waiter.context = login
+        username_field, password_field, _ = self._find_form()
+        _replace_text(username_field, login)
+        _replace_text(password_field, password)
 
+    @_retry_on_stale
     def send_text_only_password(self, password):
         """
         Вводит только пароль, оставляя поле логина пустым.
@@ -80,12 +121,11 @@ class LoginPage:
         Returns:
             None
         """
-        password_field = self.wait.until(
-            EC.visibility_of_element_located(self.password_field)
-        )
-        password_field.clear()
-        password_field.send_keys(password)
+        self.waiter.context = ""
+        _, password_field, _ = self._find_form()
+        _replace_text(password_field, password)
 
+    @_retry_on_stale
     def click_login_button(self):
         """
         Нажимает на кнопку входа (Login).
@@ -96,10 +136,10 @@ class LoginPage:
         Returns:
             None
         """
-        login_button = self.wait.until(
-            EC.element_to_be_clickable(self.login_button)
-        )
+        _, _, login_button = self._find_form()
         login_button.click()
+        # После отправки формы страница меняется - найденные элементы не нужны
+        self._form_elements = None
 
     def is_error_displayed(self, timeout=10):
         """
@@ -117,11 +157,8 @@ class LoginPage:
                   или если элемент не появился в течение timeout.
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            error_element = wait.until(
-                EC.presence_of_element_located(self.error_head)
-            )
-            return error_element.is_displayed()
+            self.waiter.element(self.error_head, "visible", timeout)
+            return True
         except Exception:
             return False
 
@@ -141,14 +178,58 @@ class LoginPage:
                  не найден или не стал видимым в течение timeout.
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            error_element = wait.until(
-                EC.visibility_of_element_located(self.error_head)
-            )
+            error_element = self.waiter.element(self.error_head, "visible", timeout)
             return error_element.text
         except Exception:
             return ""
 
+    def wait_for_error_text(self, expected, timeout=10):
+        """
+        Ожидает сообщение об ошибке с указанным текстом.
+
+        Сообщение, оставшееся от предыдущей попытки входа на той же
+        странице, неотличимо от нового, поэтому перед повторной попыткой
+        его нужно закрыть через dismiss_error.
+
+        Args:
+            expected: Ожидаемый фрагмент текста ошибки
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            bool: True если сообщение с таким текстом появилось,
+                  False если его не было в течение timeout.
+        """
+        try:
+            self.waiter.until(
+                lambda driver: expected in driver.find_element(*self.error_head).text,
+                timeout,
+                f"ошибка: {expected}",
+            )
+            return True
+        except Exception:
+            return False
+
+    def dismiss_error(self, timeout=10):
+        """
+        Закрывает сообщение об ошибке, оставшееся от предыдущей попытки входа.
+
+        Sauce Demo при повторной ошибке с тем же текстом не заменяет элемент
+        сообщения, поэтому без закрытия wait_for_error_text сразу принял бы
+        старое сообщение за ответ на новую попытку.
+
+        Args:
+            timeout: Максимальное время ожидания исчезновения сообщения в секундах
+
+        Raises:
+            TimeoutException: Если сообщение не исчезло в течение timeout
+        """
+        self.driver.execute_script(_DISMISS_ERROR_SCRIPT, self.error_head[1])
+        self.waiter.until(
+            lambda driver: not driver.find_elements(*self.error_head),
+            timeout,
+            "ошибка закрыта",
+        )
+
     def is_products_displayed(self, timeout=30):
         """
         Проверяет, отображается ли заголовок 'Products' после успешного входа.
@@ -166,11 +247,8 @@ class LoginPage:
                   или если элемент не появился в течение timeout.
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            product_element = wait.until(
-                EC.presence_of_element_located(self.products_title)
-            )
-            return product_element.is_displayed()
+            self.waiter.element(self.products_title, "visible", timeout)
+            return True
         except Exception:
             return False
 
@@ -178,8 +256,9 @@ class LoginPage:
         """
         Проверяет, отображается ли и доступно ли поле логина для ввода.
 
-        Ожидает, пока кнопка входа (Login) станет кликабельной, что является
-        индикатором готовности страницы к взаимодействию.
+        Ожидает, пока кнопка входа (Login) и поля формы станут доступны, что
+        является индикатором готовности страницы к взаимодействию. Найденные
+        элементы сохраняются для последующего ввода данных.
 
         Args:
             timeout: Максимальное время ожидания кликабельности элемента в секундах.
@@ -193,14 +272,18 @@ class LoginPage:
             Exception: Логирует информацию об ошибке, если таймаут истек
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            login_btn = wait.until(
-                EC.element_to_be_clickable(self.login_button)
-            )
-            return login_btn.is_displayed() and login_btn.is_enabled()
+            self._find_form(timeout)
+            return True
         except Exception as e:
             print(
                 f"Поле логина не стало кликабельным за {timeout} секунд: {e}"
             )
             return False
 
+    def _find_form(self, timeout=None):
+        if self._form_elements is None:
+            self._form_elements = self.waiter.elements(
+                self.form, "clickable", timeout or self.timeout
+            )
+        return self._form_elements
+
@@ -0,0 +1,155 @@
+from selenium.common.exceptions import NoSuchElementException
+
+
+class ProtocolLoginPage:
+    """
+    Страница авторизации Sauce Demo без браузера (протокольный уровень).
+
+    Повторяет интерфейс LoginPage поверх utils.http_browser.HttpBrowser,
+    поэтому один и тот же тест выполняется с любой из двух страниц.
+    Годится только для проверок того, что видно по ответу сервера: адрес
+    страницы, текст ошибки, заголовок страницы товаров. Вход должен быть
+    обычной отправкой HTML-формы, как в utils/stand_in.py.
+
+    Ответ сервера уже содержит итоговую страницу, поэтому аргументы
+    timeout принимаются для совместимости с LoginPage и не используются.
+
+    Attributes:
+        driver: Экземпляр HttpBrowser
+        login_field: id поля для ввода имени пользователя
+        password_field: id поля для ввода пароля
+        login_button: id кнопки входа
+    """
+
+    login_field = "user-name"
+    password_field = "password"
+    login_button = "login-button"
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Экземпляр HttpBrowser с открытой страницей логина
+        """
+        self.driver = driver
+        self._form = None
+
+    def send_text(self, login, password):
+        """
+        Вводит данные в поля логина и пароля.
+
+        Args:
+            login: Имя пользователя для входа
+            password: Пароль для входа
+
+        Raises:
+            NoSuchElementException: Если на странице нет формы входа
+        """
+        form = self._require_form()
+        form.fill(form.field(self.login_field), login)
+        form.fill(form.field(self.password_field), password)
+
+    def send_text_only_password(self, password):
+        """
+        Вводит только пароль, оставляя поле логина пустым.
+
+        Args:
+            password: Пароль для ввода
+
+        Raises:
+            NoSuchElementException: Если на странице нет формы входа
+        """
+        form = self._require_form()
+        form.fill(form.field(self.password_field), password)
+
+    def click_login_button(self):
+        """
+        Отправляет форму входа кнопкой Login.
+
+        Raises:
+            NoSuchElementException: Если на странице нет формы входа
+        """
+        form = self._require_form()
+        self.driver.submit(form, form.field(self.login_button))
+        self._form = None
+
+    def is_error_displayed(self, timeout=10):
+        """
+        Returns:
+            bool: True если на странице есть сообщение об ошибке.
+        """
+        return self._error() is not None
+
+    def get_error_text(self, timeout=10):
+        """
+        Returns:
+            str: Текст сообщения об ошибке или пустая строка.
+        """
+        error = self._error()
+        return error.text if error is not None else ""
+
+    def wait_for_error_text(self, expected, timeout=10):
+        """
+        Args:
+            expected: Ожидаемый фрагмент текста ошибки
+
+        Returns:
+            bool: True если сообщение об ошибке содержит этот текст.
+        """
+        return expected in self.get_error_text()
+
+    def dismiss_error(self, timeout=10):
+        """
+        Ничего не делает: каждая отправка формы заменяет документ целиком,
+        и сообщение предыдущей попытки на странице не остается.
+        """
+
+    def is_products_displayed(self, timeout=30):
+        """
+        Returns:
+            bool: True если открыта страница товаров с заголовком 'Products'.
+        """
+        title = self.driver.document.find(
+            "span", {"data-test": "title"}, text="Products"
+        )
+        return title is not None
+
+    def is_login_button_clickable(self, timeout=30):
+        """
+        Проверяет, что на странице есть форма входа с активной кнопкой Login.
+
+        Returns:
+            bool: True если форму можно отправить.
+        """
+        form = self._find_form()
+        if form is None:
+            print("Форма входа не найдена на странице")
+            return False
+        button = form.field(self.login_button)
+        return "disabled" not in button.attrs and "hidden" not in button.attrs
+
+    def _find_form(self):
+        if self._form is None:
+            self._form = next(
+                (
+                    form for form in self.driver.forms()
+                    if all(
+                        form.field(element_id) is not None
+                        for element_id in (
+                            self.login_field, self.password_field, self.login_button
+                        )
+                    )
+                ),
+                None,
+            )
+        return self._form
+
+    def _require_form(self):
+        form = self._find_form()
+        if form is None:
+            raise NoSuchElementException(
+                f"Форма входа не найдена на странице {self.driver.current_url}"
+            )
+        return form
+
+    def _error(self):
+        return self.driver.document.find("h3", {"data-test": "error"})
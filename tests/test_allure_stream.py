@@ -0,0 +1,132 @@
+import glob
+import json
+import os
+import threading
+
+import allure
+from allure_commons import model2
+
+from utils.allure_stream import (
+    BLOBS_DIR,
+    CHUNKS_DIR,
+    AllureStreamLogger,
+    export,
+    read_records,
+)
+
+
+def result(uuid, *attachments):
+    return model2.TestResult(
+        uuid=uuid,
+        name=f"test_{uuid}",
+        status="passed",
+        attachments=[
+            model2.Attachment(source=source, name=source, type="text/plain")
+            for source in attachments
+        ],
+    )
+
+
+def chunks(directory):
+    return sorted(glob.glob(os.path.join(directory, CHUNKS_DIR, "*.jsonl.gz")))
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Поток результатов Allure")
+class TestAllureStreamLogger:
+    def test_new_chunk_after_chunk_records(self, tmp_path):
+        """Каждые chunk_records записей начинается новый блок, записи не теряются."""
+        logger = AllureStreamLogger(str(tmp_path), chunk_records=3)
+        for index in range(7):
+            logger.report_result(result(f"r{index}"))
+        logger.close()
+
+        assert len(chunks(tmp_path)) == 3
+        assert [r["item"]["uuid"] for r in read_records(str(tmp_path))] == [
+            f"r{index}" for index in range(7)
+        ]
+
+    def test_identical_attachments_share_one_blob(self, tmp_path):
+        """Одинаковые вложения хранятся одним blob по sha256, ссылки - в каждой записи."""
+        logger = AllureStreamLogger(str(tmp_path))
+        logger.report_attached_data(b"screenshot", "a-attachment.png")
+        logger.report_attached_data("screenshot", "b-attachment.png")
+        logger.report_attached_data(b"other", "c-attachment.png")
+        logger.close()
+
+        blobs = glob.glob(os.path.join(tmp_path, BLOBS_DIR, "*", "*"))
+        records = list(read_records(str(tmp_path)))
+        assert (logger.blobs, len(blobs)) == (2, 2)
+        assert [r["attachment"] for r in records] == [
+            "a-attachment.png", "b-attachment.png", "c-attachment.png",
+        ]
+        assert records[0]["sha256"] == records[1]["sha256"] != records[2]["sha256"]
+
+    def test_interrupted_chunk_is_read_up_to_last_record(self, tmp_path):
+        """Незакрытый блок прерванного прогона читается до последней сброшенной записи."""
+        logger = AllureStreamLogger(str(tmp_path))
+        logger.report_result(result("r1"))
+        logger.report_result(result("r2"))
+
+        assert [r["item"]["uuid"] for r in read_records(str(tmp_path))] == ["r1", "r2"]
+        logger.close()
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Поток результатов Allure")
+class TestExport:
+    def test_export_builds_allure_results(self, tmp_path):
+        """export создает те же файлы, что AllureFileLogger: результаты, контейнеры, вложения."""
+        stream, target = tmp_path / "stream", tmp_path / "allure-results"
+        logger = AllureStreamLogger(str(stream))
+        logger.report_attached_data(b"page", "p1-attachment.html")
+        logger.report_result(result("r1", "p1-attachment.html"))
+        logger.report_attached_data(b"page", "p2-attachment.html")
+        logger.report_result(result("r2", "p2-attachment.html"))
+        logger.report_container(model2.TestResultContainer(uuid="c1", children=["r1", "r2"]))
+        logger.close()
+        target.mkdir()
+        (target / "stale-result.json").write_text("{}")
+
+        assert export(str(stream), str(target)) == (3, 2)
+
+        assert sorted(os.listdir(target)) == [
+            "c1-container.json", "p1-attachment.html", "p2-attachment.html",
+            "r1-result.json", "r2-result.json",
+        ]
+        first = json.loads((target / "r1-result.json").read_text(encoding="utf-8"))
+        assert (first["uuid"], first["name"], first["status"]) == ("r1", "test_r1", "passed")
+        assert first["attachments"][0]["source"] == "p1-attachment.html"
+        container = json.loads((target / "c1-container.json").read_text(encoding="utf-8"))
+        assert container["children"] == ["r1", "r2"]
+        assert (target / "p2-attachment.html").read_bytes() == b"page"
+
+    def test_concurrent_writers_share_directory(self, tmp_path):
+        """Два логгера, пишущих одновременно в один каталог, не портят записи друг друга."""
+        loggers = [AllureStreamLogger(str(tmp_path), chunk_records=5) for _ in range(2)]
+        start = threading.Barrier(len(loggers))
+
+        def write(index, logger):
+            start.wait()
+            for number in range(40):
+                logger.report_attached_data(b"shared", f"w{index}-{number}-attachment.txt")
+                logger.report_result(result(f"w{index}-{number}"))
+            logger.close()
+
+        threads = [
+            threading.Thread(target=write, args=(index, logger))
+            for index, logger in enumerate(loggers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        target = tmp_path / "allure-results"
+        assert export(str(tmp_path), str(target)) == (80, 80)
+        assert len(glob.glob(os.path.join(tmp_path, BLOBS_DIR, "*", "*"))) == 1
+        uuids = {
+            json.loads(path.read_text(encoding="utf-8"))["uuid"]
+            for path in target.glob("*-result.json")
+        }
+        assert uuids == {f"w{i}-{n}" for i in range(2) for n in range(40)}
@@ -0,0 +1,188 @@
+import base64
+import struct
+import threading
+import zlib
+from types import SimpleNamespace
+
+import allure
+import pytest
+from allure_commons import model2
+
+from utils import artifacts
+from utils.artifacts import PNG_SIGNATURE, ArtifactCapture, recompress_png
+
+
+def make_png(width=64, height=64, level=0):
+    """PNG в оттенках серого со слабо сжатыми данными, как у скриншотов Chrome."""
+    def chunk(kind, data):
+        return (
+            struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    raw = b"".join(b"\x00" + bytes([y % 256]) * width for y in range(height))
+    return PNG_SIGNATURE + chunk(b"IHDR", header) + chunk(
+        b"IDAT", zlib.compress(raw, level)
+    ) + chunk(b"IEND", b"")
+
+
+def read_chunks(png):
+    position, chunks = len(PNG_SIGNATURE), []
+    while position < len(png):
+        length, kind = struct.unpack(">I4s", png[position:position + 8])
+        data = png[position + 8:position + 8 + length]
+        (crc,) = struct.unpack(">I", png[position + 8 + length:position + 12 + length])
+        assert crc == zlib.crc32(kind + data)
+        chunks.append((kind, data))
+        position += 12 + length
+    return chunks
+
+
+class FakeDriver:
+    def __init__(self, png=None, source="<html></html>"):
+        self.png = png or make_png()
+        self.page_source = source
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(self.png).decode("ascii")
+
+
+class RecordingHook:
+    """Вместо логгера Allure записывает вложения в каталог, медленно при delay."""
+
+    def __init__(self, directory, delay=None):
+        self.directory = directory
+        self.delay = delay
+        self.writes = []
+
+    def report_attached_data(self, body, file_name):
+        if self.delay:
+            self.delay.wait(5)
+        (self.directory / file_name).write_bytes(body)
+        self.writes.append(file_name)
+
+
+@pytest.fixture
+def step():
+    return model2.TestStepResult(name="шаг")
+
+
+@pytest.fixture
+def make_capture(monkeypatch, tmp_path, step):
+    """Создает ArtifactCapture с поддельными listener allure-pytest и хуком записи."""
+    listener = SimpleNamespace(
+        allure_logger=SimpleNamespace(get_last_item=lambda kind: step)
+    )
+    config = SimpleNamespace(
+        pluginmanager=SimpleNamespace(getplugin=lambda name: listener)
+    )
+    captures = []
+
+    def make(policy="failure", sample_rate=0.1, delay=None):
+        hook = RecordingHook(tmp_path, delay)
+        monkeypatch.setattr(
+            artifacts, "allure_commons",
+            SimpleNamespace(plugin_manager=SimpleNamespace(hook=hook)),
+        )
+        capture = ArtifactCapture(config, policy, sample_rate)
+        captures.append(capture)
+        return capture, hook
+
+    yield make
+    for capture in captures:
+        capture.close()
+
+
+def item(nodeid):
+    return SimpleNamespace(nodeid=nodeid)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Артефакты")
+class TestCheckpointPolicy:
+    @pytest.mark.parametrize("policy, expected", [("failure", False), ("always", True)])
+    def test_fixed_policies(self, make_capture, policy, expected):
+        """failure не снимает контрольные точки, always - снимает всегда."""
+        capture, _ = make_capture(policy)
+
+        assert capture.wants_checkpoint(item("t::a")) is expected
+
+    def test_sampled_decision_is_made_once_per_test(self, make_capture, monkeypatch):
+        """Для sampled доля тестов выбирается случайно, но один раз на тест."""
+        rolls = iter([0.05, 0.5])
+        monkeypatch.setattr(artifacts.random, "random", lambda: next(rolls))
+        capture, _ = make_capture("sampled", sample_rate=0.1)
+
+        assert [capture.wants_checkpoint(item("t::a")) for _ in range(3)] == [True] * 3
+        assert [capture.wants_checkpoint(item("t::b")) for _ in range(3)] == [False] * 3
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Артефакты")
+class TestArtifactWrites:
+    def test_identical_screenshots_are_written_once(self, make_capture, step):
+        """Одинаковые скриншоты: два вложения ссылаются на один файл по sha256."""
+        capture, hook = make_capture()
+        driver = FakeDriver()
+
+        capture.screenshot(driver, "до")
+        capture.screenshot(driver, "после")
+        capture.flush()
+
+        assert (capture.captured, capture.written) == (2, 1)
+        assert len(hook.writes) == 1
+        sources = {attachment.source for attachment in step.attachments}
+        assert sources == set(hook.writes)
+        assert len(next(iter(sources)).split("-")[0]) == 64
+
+    def test_flush_waits_for_pending_writes(self, make_capture, tmp_path):
+        """flush() возвращается только после записи всех поставленных артефактов."""
+        release = threading.Event()
+        capture, hook = make_capture(delay=release)
+        capture.page_source(FakeDriver(), "страница")
+        assert capture.written == 0
+
+        threading.Timer(0.1, release.set).start()
+        capture.flush()
+
+        assert capture.written == 1
+        assert (tmp_path / hook.writes[0]).read_bytes() == b"<html></html>"
+
+    def test_screenshot_is_recompressed(self, make_capture, tmp_path):
+        """Скриншот пересжимается в фоне без изменения изображения."""
+        png = make_png()
+        capture, hook = make_capture()
+
+        capture.screenshot(FakeDriver(png), "скриншот")
+        capture.flush()
+
+        written = (tmp_path / hook.writes[0]).read_bytes()
+        assert len(written) < len(png)
+        assert written == recompress_png(png)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Артефакты")
+class TestRecompressPng:
+    def test_image_data_is_unchanged(self):
+        """Пересжатие без потерь: заголовок и пиксели те же, контрольные суммы верны."""
+        png = make_png()
+
+        result = recompress_png(png)
+
+        original, packed = read_chunks(png), read_chunks(result)
+        assert [kind for kind, _ in packed] == [b"IHDR", b"IDAT", b"IEND"]
+        assert packed[0] == original[0]
+        assert zlib.decompress(packed[1][1]) == zlib.decompress(original[1][1])
+        assert len(result) < len(png)
+
+    def test_well_compressed_png_is_kept(self):
+        """Если пересжатие не уменьшает размер, возвращается исходный файл."""
+        png = make_png(level=9)
+
+        assert recompress_png(png) is png
+
+    def test_not_png_is_kept(self):
+        """Данные не в формате PNG возвращаются без изменений."""
+        assert recompress_png(b"GIF89a") == b"GIF89a"
@@ -0,0 +1,230 @@
+import asyncio
+import json
+
+import allure
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from utils.async_webdriver import AsyncElement, AsyncHttpClient, AsyncWebDriver
+
+
+class FakeW3CServer:
+    """
+    Сервер с ответами в формате W3C WebDriver для AsyncHttpClient.
+
+    Путь запроса выбирает ответ: /chunked - тело частями, /close - Connection: close,
+    /drop - закрыть соединение после ответа без предупреждения, /error/<код> -
+    ошибка W3C; на остальные пути возвращается метод, путь и тело запроса.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self._server = None
+
+    @property
+    def url(self):
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                method, path, _ = request.decode().split()
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((method, path))
+                if not await self._respond(writer, method, path, body):
+                    break
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, method, path, body):
+        status, extra = 200, ""
+        value = {"method": method, "path": path, "body": json.loads(body) if body else None}
+        if path.startswith("/error/"):
+            status = 404
+            value = {"error": path[len("/error/"):].replace("-", " "), "message": "сбой"}
+        payload = json.dumps({"value": value}).encode()
+
+        if path == "/chunked":
+            middle = len(payload) // 2
+            chunks = b"".join(
+                f"{len(part):x}\r\n".encode() + part + b"\r\n"
+                for part in (payload[:middle], payload[middle:])
+            )
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + chunks + b"0\r\n\r\n"
+            )
+        else:
+            if path == "/close":
+                extra = "Connection: close\r\n"
+            writer.write(
+                f"HTTP/1.1 {status} X\r\nContent-Length: {len(payload)}\r\n{extra}\r\n".encode()
+                + payload
+            )
+        await writer.drain()
+        return path not in ("/close", "/drop")
+
+
+def run(scenario):
+    """Выполняет scenario(server, client) с новым сервером и клиентом."""
+    async def main():
+        async with FakeW3CServer() as server:
+            client = AsyncHttpClient(timeout=5)
+            try:
+                return server, client, await scenario(server, client)
+            finally:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Асинхронный WebDriver")
+class TestAsyncHttpClient:
+    def test_keep_alive_connection_is_reused(self):
+        """Последовательные команды идут через одно соединение."""
+        async def scenario(server, client):
+            return [await client.request("GET", f"{server.url}/status") for _ in range(3)]
+
+        server, client, values = run(scenario)
+
+        assert [v["path"] for v in values] == ["/status"] * 3
+        assert (client.requests, client.connections, server.connections) == (3, 1, 1)
+
+    def test_concurrent_requests_open_separate_connections(self):
+        """Одновременные команды не делят одно соединение."""
+        async def scenario(server, client):
+            await asyncio.gather(*(client.request("GET", f"{server.url}/a") for _ in range(3)))
+            await client.request("GET", f"{server.url}/b")
+
+        server, client, _ = run(scenario)
+
+        assert client.connections == 3
+        assert server.connections == 3
+
+    def test_payload_is_sent_as_json(self):
+        async def scenario(server, client):
+            return await client.request("POST", f"{server.url}/url?x=1", {"url": "about:blank"})
+
+        _, _, value = run(scenario)
+
+        assert value == {"method": "POST", "path": "/url?x=1", "body": {"url": "about:blank"}}
+
+    def test_chunked_body(self):
+        """Тело с Transfer-Encoding: chunked собирается, соединение остается открытым."""
+        async def scenario(server, client):
+            first = await client.request("POST", f"{server.url}/chunked", {"n": 1})
+            await client.request("GET", f"{server.url}/next")
+            return first
+
+        server, client, value = run(scenario)
+
+        assert value["body"] == {"n": 1}
+        assert server.connections == 1
+
+    def test_connection_close_is_not_reused(self):
+        async def scenario(server, client):
+            await client.request("GET", f"{server.url}/close")
+            await client.request("GET", f"{server.url}/next")
+
+        server, client, _ = run(scenario)
+
+        assert (client.connections, server.connections) == (2, 2)
+
+    def test_idle_connection_closed_by_server_is_retried(self):
+        """Соединение, закрытое сервером во время простоя, заменяется новым без ошибки."""
+        async def scenario(server, client):
+            await client.request("GET", f"{server.url}/drop")
+            await asyncio.sleep(0.05)
+            return await client.request("GET", f"{server.url}/next")
+
+        server, client, value = run(scenario)
+
+        assert value["path"] == "/next"
+        assert client.connections == 2
+
+    @pytest.mark.parametrize("error, exception", [
+        ("no-such-element", NoSuchElementException),
+        ("stale-element-reference", StaleElementReferenceException),
+        ("script-timeout", TimeoutException),
+        ("javascript-error", JavascriptException),
+        ("unknown-command", WebDriverException),
+    ])
+    def test_w3c_errors(self, error, exception):
+        """Код ошибки W3C превращается в соответствующее исключение Selenium."""
+        async def scenario(server, client):
+            with pytest.raises(exception) as raised:
+                await client.request("GET", f"{server.url}/error/{error}")
+            return raised.value
+
+        _, _, raised = run(scenario)
+
+        assert type(raised) is exception
+        assert raised.msg.startswith(f"{error.replace('-', ' ')}: сбой")
+
+    def test_unavailable_server(self):
+        """Отказ в соединении - WebDriverException, как у остальных сбоев."""
+        async def main():
+            client = AsyncHttpClient(timeout=5)
+            with pytest.raises(WebDriverException, match="ConnectionRefusedError"):
+                await client.request("GET", "http://127.0.0.1:9/status")
+
+        asyncio.run(main())
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Асинхронный WebDriver")
+class TestAsyncWebDriver:
+    def test_elements_are_wrapped_and_unwrapped(self):
+        """Аргумент AsyncElement уходит ссылкой W3C, ссылка в ответе становится AsyncElement."""
+        async def scenario(server, client):
+            driver = AsyncWebDriver(server.url, "s1", client)
+            element = AsyncElement(driver, "e1")
+            sent = await driver.execute_script("return arguments[0]", element)
+            return sent, server.requests
+
+        _, _, (sent, requests) = run(scenario)
+
+        # Сервер возвращает тело запроса: {ELEMENT_KEY: "e1"} пришло обратно элементом
+        assert requests == [("POST", "/session/s1/execute/sync")]
+        echoed = sent["body"]["args"][0]
+        assert isinstance(echoed, AsyncElement)
+        assert (echoed.id, echoed.driver.session_id) == ("e1", "s1")
+
+    @pytest.mark.parametrize("locator, selector", [
+        ((By.ID, 'a"b'), '[id="a\\"b"]'),
+        ((By.NAME, "a\\b"), '[name="a\\\\b"]'),
+        ((By.CLASS_NAME, "1st"), ".\\31 st"),
+    ])
+    def test_find_element_escapes_locator_value(self, locator, selector):
+        """Кавычки и обратная косая черта в значении локатора не ломают CSS-селектор."""
+        async def scenario(server, client):
+            return await AsyncWebDriver(server.url, "s1", client).find_element(*locator)
+
+        _, _, sent = run(scenario)
+
+        assert sent["body"] == {"using": By.CSS_SELECTOR, "value": selector}
@@ -0,0 +1,75 @@
+import allure
+import pytest
+
+from utils.benchmark import find_regressions, load_baseline, percentile, save_baseline, summarize
+
+
+def p95(value):
+    return {"p50": value, "p95": value, "p99": value}
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Замер скорости входа")
+class TestPercentile:
+    @pytest.mark.parametrize("p, expected", [(0, 1), (50, 2.5), (95, 3.85), (100, 4)])
+    def test_linear_interpolation(self, p, expected):
+        """Перцентиль между соседними значениями интерполируется линейно."""
+        assert percentile([4, 1, 3, 2], p) == pytest.approx(expected)
+
+    def test_single_value(self):
+        """Для одного повтора все перцентили равны его значению."""
+        assert percentile([0.7], 99) == 0.7
+
+    def test_summarize_skips_missing_metrics(self):
+        """Метрика, не сообщенная ни в одном повторе, в сводку не попадает."""
+        samples = [{"total": 1.0, "page_ttfb": None}, {"total": 3.0, "page_ttfb": None}]
+
+        assert summarize(samples) == {"total": {"p50": 2.0, "p95": 2.9, "p99": 2.98}}
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Замер скорости входа")
+class TestFindRegressions:
+    def test_time_regression(self):
+        """Рост p95 больше порога и больше min_delta секунд - регрессия."""
+        regressions = find_regressions(
+            {"standard_user": {"total": p95(1.5)}}, {"standard_user": {"total": p95(1.0)}}, 0.2
+        )
+
+        assert regressions == ["standard_user.total: p95 1.000 с -> 1.500 с"]
+
+    def test_small_absolute_time_growth_is_noise(self):
+        """Двукратный рост метрики в миллисекунды не считается регрессией."""
+        assert not find_regressions(
+            {"s": {"page_ttfb": p95(0.004)}}, {"s": {"page_ttfb": p95(0.002)}}, 0.2
+        )
+
+    def test_round_trips_use_own_threshold(self):
+        """Порог в секундах не применяется к числу обращений к WebDriver."""
+        baseline = {"s": {"round_trips": p95(8)}}
+
+        assert not find_regressions({"s": {"round_trips": p95(10)}}, baseline, 0.2)
+        assert find_regressions({"s": {"round_trips": p95(11)}}, baseline, 0.2) == [
+            "s.round_trips: p95 8 -> 11"
+        ]
+
+    def test_metric_without_baseline_is_skipped(self):
+        """Новый сценарий или метрика без базовой линии не сравниваются."""
+        assert not find_regressions({"new": {"total": p95(9.0)}}, {}, 0.2)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Замер скорости входа")
+class TestBaseline:
+    def test_round_trip(self, tmp_path):
+        """Сохраненная базовая линия загружается без изменений."""
+        path = tmp_path / "baseline.json"
+        results = {"standard_user": {"total": p95(1.2)}}
+
+        save_baseline(results, path)
+
+        assert load_baseline(path) == results
+
+    def test_missing_file(self, tmp_path):
+        """Без файла базовая линия пустая."""
+        assert load_baseline(tmp_path / "missing.json") == {}
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import allure
+from urllib3.exceptions import MaxRetryError
+
+from conf.config import WINDOW_SIZE
+from utils.driver_pool import AsyncDriverPool, DriverPool
+
+
+class FakeDriver:
+    """Драйвер без браузера: после kill() команды падают как у упавшего chromedriver."""
+
+    def __init__(self):
+        self.dead = False
+        self.quit_calls = 0
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def kill(self):
+        self.dead = True
+
+    def _check(self):
+        if self.dead:
+            raise MaxRetryError(None, "/session", "Connection refused")
+
+    @property
+    def window_handles(self):
+        self._check()
+        return ["main"]
+
+    def execute_script(self, script):
+        self._check()
+        return 1
+
+    def delete_all_cookies(self):
+        self._check()
+
+    def get(self, url):
+        self._check()
+
+    def set_window_size(self, width, height):
+        self._check()
+
+    def quit(self):
+        self.quit_calls += 1
+        self._check()
+
+
+class FakeAsyncDriver:
+    """Асинхронный драйвер без браузера с несколькими вкладками."""
+
+    def __init__(self):
+        self.dead = False
+        self.handles = ["main", "popup"]
+        self.current = "popup"
+        self.size = (800, 600)
+        self.url = "https://www.saucedemo.com/inventory.html"
+        self.quit_calls = 0
+
+    def _check(self):
+        if self.dead:
+            raise ConnectionResetError("chromedriver закрыл соединение")
+
+    async def window_handles(self):
+        self._check()
+        return list(self.handles)
+
+    async def switch_to_window(self, handle):
+        self._check()
+        self.current = handle
+
+    async def close(self):
+        self._check()
+        self.handles.remove(self.current)
+
+    async def execute_script(self, script):
+        self._check()
+        return 1
+
+    async def delete_all_cookies(self):
+        self._check()
+
+    async def get(self, url):
+        self._check()
+        self.url = url
+
+    async def set_window_size(self, width, height):
+        self._check()
+        self.size = (width, height)
+
+    async def quit(self):
+        self.quit_calls += 1
+        self._check()
+
+
+async def create_fake_async_driver():
+    return FakeAsyncDriver()
+
+
+def acquire_in_thread(pool, timeout=2):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(pool.acquire()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return result[0] if result else None
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Пул браузеров")
+class TestDriverPool:
+    def test_release_of_dead_driver_frees_slot(self):
+        """Ошибка соединения при сбросе не оставляет занятый слот ограниченного пула."""
+        pool = DriverPool(FakeDriver, max_size=1)
+        driver = pool.acquire()
+        driver.kill()
+
+        pool.release(driver)
+
+        assert pool.recycled == 1
+        assert driver.quit_calls == 1
+        replacement = acquire_in_thread(pool)
+        assert replacement is not None, "Пул не должен блокироваться после сбоя драйвера"
+        assert replacement is not driver
+
+    def test_dead_idle_driver_is_replaced(self):
+        """Простаивающий драйвер, переставший отвечать, пересоздается при выдаче."""
+        pool = DriverPool(FakeDriver, max_size=1)
+        driver = pool.acquire()
+        pool.release(driver)
+        driver.kill()
+
+        replacement = acquire_in_thread(pool)
+
+        assert replacement is not None and replacement is not driver
+        assert (pool.created, pool.recycled) == (2, 1)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Пул браузеров")
+class TestAsyncDriverPool:
+    def test_reset_matches_sync_pool(self):
+        """Сброс закрывает лишние вкладки и восстанавливает размер окна, как в DriverPool."""
+        async def scenario():
+            pool = AsyncDriverPool(create_fake_async_driver, max_size=1)
+            driver = await pool.acquire()
+            await pool.release(driver)
+            return pool, driver, await pool.acquire()
+
+        pool, driver, again = asyncio.run(scenario())
+
+        assert again is driver
+        assert (driver.handles, driver.current) == (["main"], "main")
+        assert (driver.url, driver.size) == ("about:blank", WINDOW_SIZE)
+        assert (pool.created, pool.reused, pool.recycled) == (1, 1, 0)
+
+    def test_release_of_dead_driver_frees_slot(self):
+        """Любая ошибка при сбросе заменяет драйвер и освобождает место в пуле."""
+        async def scenario():
+            pool = AsyncDriverPool(create_fake_async_driver, max_size=1)
+            driver = await pool.acquire()
+            driver.dead = True
+            await pool.release(driver)
+            replacement = await asyncio.wait_for(pool.acquire(), 2)
+            return pool, driver, replacement
+
+        pool, driver, replacement = asyncio.run(scenario())
+
+        assert replacement is not driver
+        assert driver.quit_calls == 1
+        assert (pool.created, pool.recycled) == (2, 1)
+
+    def test_bounded_pool_waits_for_release(self):
+        """В заполненном пуле acquire ждет освобождения драйвера."""
+        async def scenario():
+            pool = AsyncDriverPool(create_fake_async_driver, max_size=1)
+            driver = await pool.acquire()
+            waiting = asyncio.ensure_future(pool.acquire())
+            await asyncio.sleep(0.01)
+            blocked = not waiting.done()
+            await pool.release(driver)
+            return blocked, driver, await asyncio.wait_for(waiting, 2)
+
+        blocked, driver, second = asyncio.run(scenario())
+
+        assert blocked
+        assert second is driver
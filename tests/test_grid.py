@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+
+from utils import grid
+from utils.grid import LOCAL_NODE, assign_slots, node_ready, parse_node
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """/<имя>/status: ready - готовый узел, busy - занятый, broken - не JSON."""
+
+    def do_GET(self):
+        name = self.path.strip("/").split("/")[0]
+        if name == "broken":
+            body = b"<html>502</html>"
+        else:
+            body = json.dumps({"value": {"ready": name == "ready", "message": name}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def status_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def closed_port_url():
+    """Адрес, на котором никто не слушает."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    port = server.server_address[1]
+    server.server_close()
+    return f"http://127.0.0.1:{port}"
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Запуск на узлах Selenium Grid")
+class TestNodeReady:
+    def test_ready_node(self, status_server):
+        """Узел с value.ready=true готов; адрес со слешем в конце тоже."""
+        assert node_ready(f"{status_server}/ready")
+        assert node_ready(f"{status_server}/ready/")
+
+    @pytest.mark.parametrize("name", ["busy", "broken"])
+    def test_not_ready_node(self, status_server, name):
+        """Узел без свободных слотов или с ответом не в JSON не готов."""
+        assert not node_ready(f"{status_server}/{name}")
+
+    def test_unreachable_node(self, closed_port_url):
+        """Недоступный узел не готов, ошибка соединения не выбрасывается."""
+        assert not node_ready(closed_port_url, timeout=1)
+
+    def test_local_node_is_always_ready(self):
+        assert node_ready(LOCAL_NODE)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Запуск на узлах Selenium Grid")
+class TestSlots:
+    def test_equal_slots_alternate_nodes(self):
+        """Слоты узлов чередуются, чтобы при малом числе тестов были заняты все узлы."""
+        assert assign_slots(["a", "b"], 2) == ["a", "b", "a", "b"]
+
+    def test_different_slot_counts(self):
+        """Узел с большим числом слотов продолжает получать слоты после остальных."""
+        assert assign_slots(["a", "b", "c"], {"a": 3, "b": 1, "c": 2}) == [
+            "a", "b", "c", "a", "c", "a",
+        ]
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("http://agent1:4444=4", ("http://agent1:4444", 4)),
+        ("http://agent1:4444", ("http://agent1:4444", 2)),
+        ("local=3", ("local", 3)),
+    ])
+    def test_parse_node(self, spec, expected):
+        """Число слотов после '=' переопределяет --slots для узла."""
+        assert parse_node(spec, 2) == expected
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Запуск на узлах Selenium Grid")
+class TestCoordinator:
+    def test_not_ready_node_slots_are_left_out(
+        self, monkeypatch, tmp_path, status_server, closed_port_url
+    ):
+        """Тесты раздаются только слотам готовых узлов; прогон не ждет неготовые."""
+        ready, busy = f"{status_server}/ready", f"{status_server}/busy"
+        launched = []
+
+        def run_shards(shards, options, workdir, env_for_shard):
+            launched.extend(
+                (env_for_shard(index)["SELENIUM_REMOTE_URL"], shard)
+                for index, shard in enumerate(shards)
+            )
+            return 0, [], []
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(grid, "STAND_IN", False)
+        monkeypatch.setattr(
+            grid, "collect", lambda args: ([f"t::{i}" for i in range(6)], [], "allure-results")
+        )
+        monkeypatch.setattr(grid, "run_shards", run_shards)
+        monkeypatch.setattr(grid, "merge_allure_shards", lambda dirs, target: None)
+
+        started = time.monotonic()
+        code = grid._run(
+            [ready, busy, closed_port_url],
+            {ready: 2, busy: 4, closed_port_url: 4},
+            ["tests/"],
+        )
+
+        assert code == 0
+        assert time.monotonic() - started < 10
+        assert [node for node, _ in launched] == [ready, ready]
+        assert sorted(test for _, shard in launched for test in shard) == [
+            f"t::{i}" for i in range(6)
+        ]
+
+    def test_no_ready_nodes(self, monkeypatch, status_server):
+        """Если готовых узлов нет, тесты не собираются и прогон завершается с ошибкой."""
+        monkeypatch.setattr(grid, "collect", pytest.fail)
+
+        assert grid._run([f"{status_server}/busy"], 1, []) == 1
@@ -0,0 +1,160 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import PAGE_TITLE
+from utils.http_browser import BLANK_URL, HttpBrowser, parse_html
+from utils.stand_in import SESSION_COOKIE, StandInServer
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/loop":
+            self._send(302, headers={"Location": "/loop"})
+        elif self.path == "/logout":
+            self._send(302, headers={
+                "Location": "/echo", "Set-Cookie": "token=; Max-Age=0; Path=/",
+            })
+        else:
+            self._send(200, f"<title>{self.command} {self.path}</title>")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/keep":
+            self._send(307, headers={"Location": "/echo"})
+        elif self.path == "/see-other":
+            self._send(303, headers={"Location": "/echo", "Set-Cookie": "token=abc; Path=/"})
+        else:
+            self._send(200, f"<title>{self.command} {self.path} {body.decode()}</title>")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body="", headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    """Локальная замена Sauce Demo без задержек."""
+    with StandInServer(port=0, delay=0, glitch_delay=0) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def redirects():
+    """Сервер с перенаправлениями разных видов; возвращает базовый адрес."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RedirectHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def browser():
+    browser = HttpBrowser(timeout=5)
+    yield browser
+    browser.quit()
+
+
+def login_form(browser):
+    return next(form for form in browser.forms() if form.field("user-name") is not None)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Браузер без рендеринга")
+class TestParseHtml:
+    def test_unclosed_elements_and_text(self):
+        """Незакрытые элементы закрываются с родителем, пробелы в тексте нормализуются."""
+        document = parse_html(
+            "<div id='a'><p>один<br>  два\n<p>три</div><span data-test='x'>ok</span>"
+        )
+
+        assert document.find("div", {"id": "a"}).text == "один два три"
+        assert document.find(attrs={"data-test": "x"}).text == "ok"
+        assert document.find("span", text="нет") is None
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Браузер без рендеринга")
+class TestHttpBrowser:
+    def test_login_form_submit_follows_redirect(self, browser, stand_in):
+        """Отправка формы входа: 302 на страницу товаров и cookie сессии."""
+        browser.get(stand_in.url)
+        form = login_form(browser)
+        form.fill(form.field("user-name"), "standard_user")
+        form.fill(form.field("password"), "secret_sauce")
+
+        browser.submit(form, form.field("login-button"))
+
+        assert browser.current_url == f"{stand_in.url}inventory.html"
+        assert browser.title == PAGE_TITLE
+        assert browser.cookies == {SESSION_COOKIE: "standard_user"}
+        assert browser.document.find("span", {"data-test": "title"}, text="Products")
+
+    def test_requests_reuse_one_connection(self, browser, stand_in):
+        """Все запросы к одному серверу идут через одно постоянное соединение."""
+        for _ in range(3):
+            browser.get(stand_in.url)
+
+        assert browser.requests == 3
+        assert len(browser._connections) == 1
+
+    def test_reset(self, browser, stand_in):
+        """reset удаляет cookies и открывает пустую страницу."""
+        browser.cookies[SESSION_COOKIE] = "standard_user"
+        browser.get(f"{stand_in.url}inventory.html")
+
+        browser.reset()
+
+        assert browser.cookies == {}
+        assert (browser.current_url, browser.title) == (BLANK_URL, "")
+
+    def test_307_keeps_method_and_body(self, browser, redirects):
+        """307 повторяет POST с тем же телом."""
+        browser._navigate("POST", f"{redirects}/keep", b"a=1")
+
+        assert browser.title == "POST /echo a=1"
+
+    def test_303_switches_to_get(self, browser, redirects):
+        """303 превращает POST в GET, cookies из ответа с перенаправлением сохраняются."""
+        browser._navigate("POST", f"{redirects}/see-other", b"a=1")
+
+        assert browser.title == "GET /echo"
+        assert browser.cookies == {"token": "abc"}
+
+    def test_empty_cookie_deletes_it(self, browser, redirects):
+        """Set-Cookie с пустым значением удаляет cookie."""
+        browser.cookies["token"] = "abc"
+
+        browser.get(f"{redirects}/logout")
+
+        assert browser.cookies == {}
+
+    def test_redirect_loop(self, browser, redirects):
+        """Бесконечное перенаправление - WebDriverException, а не зависание."""
+        with pytest.raises(WebDriverException, match="перенаправлений"):
+            browser.get(f"{redirects}/loop")
+
+    def test_unavailable_server(self, browser):
+        """Недоступный сервер - WebDriverException, как у WebDriver."""
+        with pytest.raises(WebDriverException):
+            browser.get("http://127.0.0.1:9/")
+
+    def test_unsupported_scheme(self, browser):
+        with pytest.raises(WebDriverException, match="схема"):
+            browser.get("ftp://example.com/")
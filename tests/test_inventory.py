@@ -0,0 +1,37 @@
+import allure
+
+from conf.config import URL_AFTER_LOGIN
+
+
+@allure.epic("Сайт Sauce Demo")
+@allure.feature("Вход без формы логина")
+class TestLoginAs:
+    @allure.title("Повторный вход восстанавливает сессию из кэша")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_login_as_restores_session(self, chromedriver, login_as, session_cache):
+        """
+        Тест входа через login_as: первый вход выполняется через форму,
+        второй - восстановлением сохраненной сессии.
+
+        Args:
+            chromedriver: Экземпляр WebDriver
+            login_as: Функция входа без формы логина
+            session_cache: Кэш авторизованных сессий
+        """
+        with allure.step("1. Войти как standard_user"):
+            assert login_as("standard_user", "secret_sauce"), (
+                "Страница товаров должна открыться после входа"
+            )
+
+        with allure.step("2. Удалить cookies и войти повторно"):
+            chromedriver.delete_all_cookies()
+            hits = session_cache.hits
+            assert login_as("standard_user", "secret_sauce"), (
+                "Страница товаров должна открыться после восстановления сессии"
+            )
+            assert session_cache.hits == hits + 1, "Сессия должна быть взята из кэша"
+
+        with allure.step("3. Проверить адрес страницы товаров"):
+            assert chromedriver.current_url == URL_AFTER_LOGIN, (
+                f"URL должен быть '{URL_AFTER_LOGIN}'"
+            )
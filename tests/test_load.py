@@ -0,0 +1,97 @@
+import allure
+import pytest
+
+from tests.test_driver_pool import FakeDriver
+from utils import load
+from utils.load import LoadResult, LoadRunner, build_report, histogram, parse_mix
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Нагрузочный режим")
+class TestParseMix:
+    def test_weights(self):
+        """Веса разбираются как числа, пробелы и пустые части игнорируются."""
+        assert parse_mix(" standard_user=5, performance_glitch_user=0.5,") == {
+            "standard_user": 5.0,
+            "performance_glitch_user": 0.5,
+        }
+
+    def test_default_weight(self):
+        """Сценарий без веса получает вес 1."""
+        assert parse_mix("locked_out_user") == {"locked_out_user": 1.0}
+
+    @pytest.mark.parametrize("text, message", [
+        ("nobody=1", "Неизвестный сценарий"),
+        ("standard_user=0", "положительным"),
+        ("standard_user=-2", "положительным"),
+        ("standard_user=many", "could not convert"),
+        (" , ", "пуста"),
+    ])
+    def test_invalid_mix(self, text, message):
+        """Неизвестный сценарий, неположительный или нечисловой вес и пустая смесь - ошибка."""
+        with pytest.raises(ValueError, match=message):
+            parse_mix(text)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Нагрузочный режим")
+class TestReport:
+    def test_histogram_buckets(self):
+        """Время входа попадает в первую корзину, граница которой не меньше его."""
+        counts = histogram([0.05, 0.1, 0.3, 12])
+
+        assert counts["<= 0.1 с"] == 2
+        assert counts["<= 0.5 с"] == 1
+        assert counts["> 10 с"] == 1
+        assert sum(counts.values()) == 4
+
+    def test_build_report(self):
+        """Ошибочные входы считаются, но не входят в перцентили."""
+        results = [
+            LoadResult("standard_user", 0.0, 1.0, True, ""),
+            LoadResult("standard_user", 0.5, 3.0, True, ""),
+            LoadResult("locked_out_user", 1.0, 0.0, False, "TimeoutException"),
+        ]
+
+        report = build_report(results, elapsed=2.0)
+
+        assert report["total"]["count"] == 3
+        assert report["total"]["errors"] == 1
+        assert report["total"]["throughput"] == 1.5
+        assert report["scenarios"]["standard_user"]["p50"] == 2.0
+        assert "p50" not in report["scenarios"]["locked_out_user"]
+        assert report["errors"] == ["TimeoutException"]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Нагрузочный режим")
+class TestLoadRunner:
+    def test_rate_limits_starts(self, monkeypatch):
+        """С --rate число стартов определяется расписанием, а не числом потоков."""
+        monkeypatch.setattr(load, "run_scenario", lambda *args: None)
+        runner = LoadRunner(
+            {"standard_user": 1}, concurrency=3, duration=0.5, rate=20, factory=FakeDriver
+        )
+
+        results = runner.run()
+
+        assert len(results) == 10
+        assert all(r.ok and r.scenario == "standard_user" for r in results)
+        assert sorted(r.started for r in results)[-1] < 0.5 + 0.2
+
+    def test_scenario_errors_are_recorded(self, monkeypatch):
+        """Исключение сценария записывается в результат, нагрузка продолжается."""
+        def fail(*args):
+            raise AssertionError("Сценарий завершился не так, как ожидалось\nподробности")
+
+        monkeypatch.setattr(load, "run_scenario", fail)
+        runner = LoadRunner(
+            {"locked_out_user": 1}, concurrency=1, duration=0.2, rate=10, factory=FakeDriver
+        )
+
+        results = runner.run()
+
+        assert len(results) == 2
+        assert {r.error for r in results} == {
+            "AssertionError: Сценарий завершился не так, как ожидалось"
+        }
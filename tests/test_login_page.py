@@ -0,0 +1,100 @@
+import allure
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchWindowException
+from selenium.webdriver.chrome.options import Options
+
+from pages.login_page import LoginPage
+from utils import timeouts
+from utils.async_webdriver import ELEMENT_KEY
+from utils.round_trips import count_round_trips
+
+
+class FakeExecutor:
+    """
+    Исполнитель команд webdriver.Remote без браузера.
+
+    Скрипт ожидания сразу возвращает по элементу на каждый локатор,
+    остальные команды выполняются успешно, если для них не задана
+    ошибка в errors. Все команды записываются.
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.errors = {}
+
+    def execute(self, command, params):
+        self.commands.append(command)
+        if command in self.errors:
+            raise self.errors[command]
+        if command == "newSession":
+            return {"value": {"sessionId": "s1", "capabilities": {"browserName": "chrome"}}}
+        if command == "w3cExecuteScriptAsync":
+            targets = params["args"][0]
+            return {"value": [{ELEMENT_KEY: f"e{i}"} for i in range(len(targets))]}
+        return {"value": None}
+
+
+@pytest.fixture
+def driver():
+    executor = FakeExecutor()
+    driver = webdriver.Remote(command_executor=executor, options=Options())
+    executor.commands.clear()
+    return driver
+
+
+@pytest.fixture(autouse=True)
+def no_calibration(monkeypatch):
+    monkeypatch.setattr(timeouts.wait_calibration, "mode", "off")
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Страница логина")
+class TestLoginPageRoundTrips:
+    def test_login_flow_takes_four_round_trips(self, driver):
+        """Проверка кнопки, ввод логина и пароля и нажатие Login - 4 обращения к WebDriver."""
+        page = LoginPage(driver)
+
+        with count_round_trips(driver) as counter:
+            assert page.is_login_button_clickable()
+            page.send_text("standard_user", "secret_sauce")
+            page.click_login_button()
+
+        assert counter.total == 4
+        assert driver.command_executor.commands == [
+            "w3cExecuteScriptAsync",
+            "sendKeysToElement",
+            "sendKeysToElement",
+            "clickElement",
+        ]
+
+    def test_form_is_found_again_after_submit(self, driver):
+        """После отправки формы следующий ввод снова находит поля одним скриптом."""
+        page = LoginPage(driver)
+        page.send_text("standard_user", "secret_sauce")
+        page.click_login_button()
+
+        with count_round_trips(driver) as counter:
+            page.send_text_only_password("secret_sauce")
+
+        assert counter.commands == {"w3cExecuteScriptAsync": 1, "sendKeysToElement": 1}
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Страница логина")
+class TestLoginPageChecks:
+    @pytest.mark.parametrize("check, negative", [
+        (lambda page: page.is_error_displayed(timeout=1), False),
+        (lambda page: page.get_error_text(timeout=1), ""),
+        (lambda page: page.wait_for_error_text("Epic sadface", timeout=1), False),
+        (lambda page: page.is_products_displayed(timeout=1), False),
+        (lambda page: page.is_login_button_clickable(timeout=1), False),
+    ])
+    def test_webdriver_error_is_negative_result(self, driver, check, negative):
+        """Как и до перехода на Waiter, любая ошибка WebDriver в проверке - отрицательный результат."""
+        driver.command_executor.errors = {
+            command: NoSuchWindowException("no such window: target window already closed")
+            for command in ("w3cExecuteScriptAsync", "findElement")
+        }
+
+        assert check(LoginPage(driver)) == negative
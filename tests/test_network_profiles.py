@@ -0,0 +1,108 @@
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import SLOW_NETWORK_LATENCY_MS, SLOW_NETWORK_THROUGHPUT
+from utils.network_profiles import (
+    HEAVY_RESOURCES,
+    PROFILES,
+    THIRD_PARTY_HOSTS,
+    applied_profile,
+    apply_profile,
+    get_profile,
+)
+
+
+class CdpDriver:
+    """Драйвер, записывающий команды CDP; error - ошибка на каждую команду."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        if self.error:
+            raise self.error
+        self.commands.append((command, params))
+        return {}
+
+
+class RemoteDriver:
+    """Драйвер без execute_cdp_cmd, как webdriver.Remote."""
+
+
+def expected_commands(blocked, latency, throughput, cache_disabled):
+    return [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": list(blocked)}),
+        ("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": latency,
+            "downloadThroughput": throughput,
+            "uploadThroughput": throughput,
+        }),
+        ("Network.setCacheDisabled", {"cacheDisabled": cache_disabled}),
+    ]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Сетевые профили")
+class TestNetworkProfiles:
+    def test_get_profile(self):
+        assert get_profile("lean") is PROFILES["lean"]
+
+    def test_unknown_profile(self):
+        """Неизвестное имя - ValueError со списком доступных профилей."""
+        with pytest.raises(ValueError, match="'fast'.*default, lean, no-cache, slow, cached"):
+            get_profile("fast")
+
+    @pytest.mark.parametrize("name, commands", [
+        ("lean", expected_commands(HEAVY_RESOURCES + THIRD_PARTY_HOSTS, 0, -1, False)),
+        ("no-cache", expected_commands((), 0, -1, True)),
+        ("slow", expected_commands(
+            (), SLOW_NETWORK_LATENCY_MS, SLOW_NETWORK_THROUGHPUT, True
+        )),
+        ("cached", expected_commands(
+            (), SLOW_NETWORK_LATENCY_MS, SLOW_NETWORK_THROUGHPUT, False
+        )),
+    ])
+    def test_cdp_commands(self, name, commands):
+        """Профиль выставляет все параметры сети явно и запоминается у драйвера."""
+        driver = CdpDriver()
+
+        assert apply_profile(driver, get_profile(name))
+
+        assert driver.commands == commands
+        assert applied_profile(driver) == name
+
+    def test_switching_back_to_default_resets_everything(self):
+        """default после другого профиля снимает блокировки, задержку и отключение кэша."""
+        driver = CdpDriver()
+        apply_profile(driver, get_profile("slow"))
+        driver.commands.clear()
+
+        assert apply_profile(driver, get_profile("default"))
+
+        assert driver.commands == expected_commands((), 0, -1, False)
+
+    def test_same_profile_is_not_reapplied(self):
+        """Повторное применение действующего профиля не отправляет команд."""
+        driver = CdpDriver()
+        apply_profile(driver, get_profile("lean"))
+        driver.commands.clear()
+
+        assert apply_profile(driver, get_profile("lean"))
+        assert driver.commands == []
+
+    def test_default_on_new_driver_sends_nothing(self):
+        """Новый браузер уже работает с default - команды CDP не нужны."""
+        driver = CdpDriver()
+
+        assert apply_profile(driver, get_profile("default"))
+        assert driver.commands == []
+
+    @pytest.mark.parametrize("driver", [RemoteDriver(), CdpDriver(WebDriverException("no cdp"))])
+    def test_driver_without_cdp(self, driver):
+        """Без CDP профиль не применяется, у драйвера остается default."""
+        assert not apply_profile(driver, get_profile("slow"))
+        assert applied_profile(driver) == "default"
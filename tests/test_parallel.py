@@ -0,0 +1,108 @@
+import allure
+import pytest
+
+from utils import parallel
+from utils.parallel import option_args, run_shards, schedule
+
+
+class _ParserCapture:
+    def __init__(self):
+        self.parser = None
+
+    def pytest_addoption(self, parser):
+        self.parser = parser
+
+
+@pytest.fixture(scope="module")
+def parser(pytestconfig):
+    """Парсер аргументов текущего pytest со всеми опциями плагинов и conftest.py."""
+    capture = _ParserCapture()
+    # pytest_addoption - исторический хук: новый плагин сразу получает парсер
+    pytestconfig.pluginmanager.register(capture, "parser_capture")
+    pytestconfig.pluginmanager.unregister(capture)
+    return capture.parser
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Параллельный запуск")
+class TestSchedule:
+    def test_longest_tests_are_spread_first(self):
+        """Жадный LPT: самые долгие тесты раздаются первыми наименее загруженным воркерам."""
+        durations = {"a": 8, "b": 7, "c": 6, "d": 5, "e": 4}
+
+        shards = schedule(list(durations), durations, 2)
+
+        loads = sorted(sum(durations[n] for n in shard) for shard in shards)
+        assert loads == [13, 17]
+        assert sorted(n for shard in shards for n in shard) == sorted(durations)
+
+    def test_unknown_tests_get_median_duration(self):
+        """Тест без истории весит как медиана известных длительностей."""
+        durations = {"a": 10, "b": 1, "c": 2}
+
+        shards = schedule(["a", "b", "c", "new"], durations, 2)
+
+        assert ["a"] in shards
+        assert sorted(next(s for s in shards if s != ["a"])) == ["b", "c", "new"]
+
+    def test_empty_shards_are_dropped(self):
+        """Воркеров больше, чем тестов, - пустые шарды не запускаются."""
+        assert schedule(["a", "b"], {}, 4) == [["a"], ["b"]]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Параллельный запуск")
+class TestOptionArgs:
+    def test_paths_are_removed(self, parser):
+        """Пути и nodeid убираются, опции остаются."""
+        args = ["tests/", "-m", "not slow", "tests/test_sauce.py::TestLogin", "-q"]
+
+        assert option_args(args, parser) == ["-m", "not slow", "-q"]
+
+    def test_option_value_that_is_a_path_is_kept(self, parser, tmp_path):
+        """Значение опции, совпадающее с существующим путем, остается при опции."""
+        args = ["--basetemp", str(tmp_path), "tests/", "--allure-stream", "tests"]
+
+        assert option_args(args, parser) == [
+            "--basetemp", str(tmp_path), "--allure-stream", "tests",
+        ]
+
+    def test_path_equal_to_option_value(self, parser):
+        """Путь, совпадающий со значением опции, убирается, а значение - нет."""
+        args = ["tests", "--allure-stream", "tests"]
+
+        assert option_args(args, parser) == ["--allure-stream", "tests"]
+
+    def test_inline_values_are_kept(self, parser):
+        """Опции вида --name=value не разбираются на части."""
+        args = ["--alluredir=tests", "-k", "login", "tests"]
+
+        assert option_args(args, parser) == ["--alluredir=tests", "-k", "login"]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Параллельный запуск")
+class TestRunShards:
+    def test_shard_options_override_user_options(self, parser, monkeypatch, tmp_path):
+        """Свой --alluredir пользователя не отменяет отдельные каталоги шардов."""
+        commands = []
+
+        class Process:
+            def __init__(self, command, env):
+                commands.append(command)
+
+            def wait(self):
+                return 0
+
+        monkeypatch.setattr(parallel.subprocess, "Popen", Process)
+        options = ["--alluredir", "my-results", "--record-durations=mine.json", "-q"]
+
+        code, shard_dirs, duration_files = run_shards(
+            [["t::a"], ["t::b"]], options, str(tmp_path)
+        )
+
+        assert code == 0
+        for command, alluredir, durations in zip(commands, shard_dirs, duration_files):
+            parsed = parser.parse(command[3:])
+            assert (parsed.allure_report_dir, parsed.record_durations) == (alluredir, durations)
+        assert len(set(shard_dirs)) == 2
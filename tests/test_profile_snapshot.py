@@ -0,0 +1,102 @@
+import os
+
+import allure
+import pytest
+
+from utils import workers
+from utils.profile_snapshot import TRIMMED, trim_profile
+from utils.workers import new_profile_dir
+
+KEPT = (
+    "Local State",
+    os.path.join("Default", "Preferences"),
+    os.path.join("Default", "Cache", "Cache_Data", "data_0"),
+    os.path.join("Default", "Code Cache", "js", "index"),
+)
+
+
+def make_profile(path, names):
+    for name in names:
+        file_path = path / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(name)
+
+
+def files(path):
+    return sorted(
+        os.path.relpath(os.path.join(root, name), path)
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    """Снимок с кэшами, которые нужны тестам, и файлом блокировки Chrome."""
+    path = tmp_path / "snapshot"
+    make_profile(path, KEPT + ("SingletonLock",))
+    return path
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Запуск браузера")
+class TestTrimProfile:
+    def test_trimmed_entries_are_removed(self, tmp_path):
+        """Из профиля удаляются каталоги и файлы TRIMMED, HTTP-кэш и кэш скриптов остаются."""
+        profile = tmp_path / "profile"
+        history_files = (
+            os.path.join("Default", "History"), os.path.join("Default", "History-journal"),
+        )
+        make_profile(profile, KEPT + history_files + tuple(
+            os.path.join(name, "data") for name in TRIMMED if name not in history_files
+        ))
+
+        trim_profile(str(profile))
+
+        assert files(profile) == sorted(KEPT)
+
+    def test_missing_entries_are_ignored(self, tmp_path):
+        """Профиль без удаляемого содержимого не меняется."""
+        make_profile(tmp_path, KEPT)
+
+        trim_profile(str(tmp_path))
+
+        assert files(tmp_path) == sorted(KEPT)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Запуск браузера")
+class TestProfileCopies:
+    def test_each_browser_gets_own_copy_in_tmpfs(self, monkeypatch, tmp_path, snapshot):
+        """Копии снимка без файлов блокировки - в CHROME_PROFILE_TMPFS, у каждого браузера своя."""
+        tmpfs = tmp_path / "shm"
+        tmpfs.mkdir()
+        monkeypatch.setattr(workers, "CHROME_PROFILE_TMPFS", str(tmpfs))
+
+        first, second = new_profile_dir(str(snapshot)), new_profile_dir(str(snapshot))
+
+        assert first != second
+        for profile in (first, second):
+            assert os.path.commonpath([profile, str(tmpfs)]) == str(tmpfs)
+            assert files(profile) == sorted(KEPT)
+
+    def test_snapshot_is_not_modified(self, monkeypatch, tmp_path, snapshot):
+        """Браузер пишет в свою копию; снимок и копии других браузеров не меняются."""
+        monkeypatch.setattr(workers, "CHROME_PROFILE_TMPFS", str(tmp_path))
+        first, second = new_profile_dir(str(snapshot)), new_profile_dir(str(snapshot))
+
+        with open(os.path.join(first, "Local State"), "w") as f:
+            f.write("changed")
+
+        assert (snapshot / "Local State").read_text() == "Local State"
+        with open(os.path.join(second, "Local State")) as f:
+            assert f.read() == "Local State"
+
+    def test_without_tmpfs_copy_goes_to_temp_dir(self, monkeypatch, tmp_path, snapshot):
+        """Если каталога tmpfs нет, копия создается во временном каталоге системы."""
+        monkeypatch.setattr(workers, "CHROME_PROFILE_TMPFS", str(tmp_path / "missing"))
+
+        profile = new_profile_dir(str(snapshot))
+
+        assert not (tmp_path / "missing").exists()
+        assert files(profile) == sorted(KEPT)
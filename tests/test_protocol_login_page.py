@@ -0,0 +1,65 @@
+import allure
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from conf.config import LOCKED_USER_ERROR
+from pages.protocol_login_page import ProtocolLoginPage
+from utils.http_browser import HttpBrowser
+from utils.stand_in import StandInServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Локальная замена Sauce Demo без задержек."""
+    with StandInServer(port=0, delay=0, glitch_delay=0) as server:
+        yield server
+
+
+@pytest.fixture
+def page(server):
+    """Страница логина, открытая в HttpBrowser."""
+    browser = HttpBrowser(timeout=5)
+    browser.get(server.url)
+    yield ProtocolLoginPage(browser)
+    browser.quit()
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Протокольный уровень")
+class TestProtocolLoginPage:
+    def test_successful_login(self, page, server):
+        """Успешный вход открывает страницу товаров."""
+        assert page.is_login_button_clickable()
+
+        page.send_text("standard_user", "secret_sauce")
+        page.click_login_button()
+
+        assert page.is_products_displayed()
+        assert page.driver.current_url == f"{server.url}inventory.html"
+        assert not page.is_error_displayed()
+
+    def test_error_is_replaced_by_next_submit(self, page):
+        """Каждая отправка формы заменяет страницу, старая ошибка не остается."""
+        page.send_text("locked_out_user", "secret_sauce")
+        page.click_login_button()
+        assert page.wait_for_error_text(LOCKED_USER_ERROR)
+
+        page.dismiss_error()
+        page.send_text("", "secret_sauce")
+        page.click_login_button()
+
+        assert page.is_error_displayed()
+        assert not page.wait_for_error_text(LOCKED_USER_ERROR)
+
+    def test_missing_form(self):
+        """Без формы входа методы ввода сообщают об этом, а не падают с AttributeError."""
+        page = ProtocolLoginPage(HttpBrowser())
+
+        assert not page.is_login_button_clickable()
+        for action in (
+            lambda: page.send_text("standard_user", "secret_sauce"),
+            lambda: page.send_text_only_password("secret_sauce"),
+            page.click_login_button,
+        ):
+            with pytest.raises(NoSuchElementException, match="about:blank"):
+                action()
@@ -0,0 +1,159 @@
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from utils.result_cache import CACHE_KEY, ImportGraph, ResultCache
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Проект из тестового модуля, пакета pkg и не связанного с тестом модуля."""
+    files = {
+        "test_a.py": "from pkg import helper\nimport os\n",
+        "conftest.py": "",
+        "pkg/__init__.py": "",
+        "pkg/helper.py": "from pkg.deep import VALUE\n",
+        "pkg/deep.py": "VALUE = 1\n",
+        "other.py": "",
+    }
+    for name, text in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+class FakeCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+def fake_config(root, network_profile="default"):
+    options = {"--network-profile": network_profile, "--protocol-tier": "auto"}
+    return SimpleNamespace(rootpath=Path(root), cache=FakeCache(), getoption=options.get)
+
+
+class FakeItem:
+    def __init__(self, root, nodeid="test_a.py::test_one", params=None):
+        self.nodeid = nodeid
+        self.path = Path(root) / "test_a.py"
+        self.callspec = SimpleNamespace(params=params) if params is not None else None
+        self.markers = []
+
+    def add_marker(self, marker):
+        self.markers.append(marker)
+
+
+def report(item, outcome, when="call"):
+    return SimpleNamespace(
+        nodeid=item.nodeid, when=when, passed=outcome == "passed", failed=outcome == "failed"
+    )
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Кэш результатов")
+class TestImportGraph:
+    def test_transitive_import_changes_fingerprint(self, project):
+        """Изменение модуля, импортируемого через другой модуль, меняет отпечаток теста."""
+        before = ImportGraph(project).fingerprint(project / "test_a.py")
+
+        (project / "pkg/deep.py").write_text("VALUE = 2\n", encoding="utf-8")
+
+        assert ImportGraph(project).fingerprint(project / "test_a.py") != before
+
+    def test_package_init_is_a_dependency(self, project):
+        """__init__.py пакета выполняется при импорте и входит в отпечаток."""
+        before = ImportGraph(project).fingerprint(project / "test_a.py")
+
+        (project / "pkg/__init__.py").write_text("X = 1\n", encoding="utf-8")
+
+        assert ImportGraph(project).fingerprint(project / "test_a.py") != before
+
+    def test_unrelated_module_is_ignored(self, project):
+        """Модули, которые тест не импортирует, и сторонние пакеты не влияют на отпечаток."""
+        before = ImportGraph(project).fingerprint(project / "test_a.py")
+
+        (project / "other.py").write_text("CHANGED = True\n", encoding="utf-8")
+
+        assert ImportGraph(project).fingerprint(project / "test_a.py") == before
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Кэш результатов")
+class TestResultCacheKey:
+    def test_key_depends_on_inputs(self, project):
+        """Ключ меняется вместе с nodeid, параметрами, conftest.py и окружением."""
+        key = ResultCache(fake_config(project)).key(FakeItem(project, params={"user": "a"}))
+
+        assert ResultCache(fake_config(project)).key(
+            FakeItem(project, params={"user": "a"})
+        ) == key
+        changed = [
+            ResultCache(fake_config(project)).key(FakeItem(project, "test_a.py::test_two")),
+            ResultCache(fake_config(project)).key(FakeItem(project, params={"user": "b"})),
+            ResultCache(fake_config(project, "slow-3g")).key(
+                FakeItem(project, params={"user": "a"})
+            ),
+        ]
+        (project / "conftest.py").write_text("import os\n", encoding="utf-8")
+        changed.append(
+            ResultCache(fake_config(project)).key(FakeItem(project, params={"user": "a"}))
+        )
+
+        assert key not in changed
+
+    def test_passed_test_is_skipped_until_sources_change(self, project):
+        """Прошедший тест пропускается, после изменения зависимости - выполняется снова."""
+        config = fake_config(project)
+        first = ResultCache(config)
+        item = FakeItem(project)
+        first.pytest_collection_modifyitems([item])
+        first.pytest_runtest_logreport(report(item, "passed"))
+        first.pytest_sessionfinish()
+
+        second = ResultCache(config)
+        cached = FakeItem(project)
+        second.pytest_collection_modifyitems([cached])
+        (project / "pkg/helper.py").write_text(
+            "from pkg.deep import VALUE as V\n", encoding="utf-8"
+        )
+        third = ResultCache(config)
+        changed = FakeItem(project)
+        third.pytest_collection_modifyitems([changed])
+
+        assert second.hits == 1 and cached.markers[0].name == "skip"
+        assert third.hits == 0 and not changed.markers
+
+    def test_failed_test_is_removed(self, project):
+        """Падение теста в любой фазе удаляет его запись из кэша."""
+        config = fake_config(project)
+        cache = ResultCache(config)
+        item = FakeItem(project)
+        cache.pytest_collection_modifyitems([item])
+        config.cache.set(CACHE_KEY, {cache.key(item): time.time()})
+
+        cache.pytest_runtest_logreport(report(item, "passed"))
+        cache.pytest_runtest_logreport(report(item, "failed", when="teardown"))
+        cache.pytest_sessionfinish()
+
+        assert config.cache.data[CACHE_KEY] == {}
+
+    def test_stale_entry_is_not_used(self, project):
+        """Результат старше ttl не пропускает тест."""
+        config = fake_config(project)
+        item = FakeItem(project)
+        config.cache.set(CACHE_KEY, {ResultCache(config).key(item): time.time() - 120})
+
+        cache = ResultCache(config, ttl=60)
+        cache.pytest_collection_modifyitems([item])
+
+        assert cache.hits == 0
@@ -1,43 +1,58 @@
+import asyncio
+import os
+
 import allure
 import pytest
 
-from pages.login_page import LoginPage
-from conf.config import (
-    BAD_PASSWORD_ERROR,
-    EMPTY_LOGIN_ERROR,
-    LOCKED_USER_ERROR,
-    MAIN_URL,
-    PAGE_TITLE,
-    URL_AFTER_LOGIN,
-    TIME_TO_WAIT,
+from conf.config import ASYNC_SESSIONS, MAIN_URL, PAGE_TITLE, TIME_TO_WAIT
+from pages.async_login_page import AsyncLoginPage
+from utils import network_profiles
+from utils.http_browser import HttpBrowser
+from utils.scenarios import compile_matrix, load_scenarios
+
+SCENARIOS = load_scenarios(
+    os.path.join(os.path.dirname(__file__), "login_scenarios.json")
 )
 
 
+@pytest.fixture(scope="function")
+def chromedriver(scenario_browser, network_profile):
+    """
+    Сценарии входа выполняются в общем браузере, а не в отдельном из пула.
+
+    Для сценариев non_visual это HttpBrowser, к которому сетевой профиль
+    не применяется.
+    """
+    driver = scenario_browser.driver
+    if isinstance(driver, HttpBrowser):
+        return driver
+    if network_profiles.apply_profile(driver, network_profile):
+        allure.dynamic.label("network_profile", network_profile.name)
+    return driver
+
+
 @allure.epic("Сайт Sauce Demo")
 @allure.feature("Авторизация пользователей")
 class TestLogin:
-    @allure.title("1. Успешная авторизация стандартного пользователя")
-    @allure.severity(allure.severity_level.BLOCKER)
-    @allure.description("""
-    Проверка успешной авторизации с корректными учетными данными.
-    Ожидается переход на страницу товаров и отображение элементов интерфейса.
-    """)
-    @pytest.mark.parametrize(
-        "username,password",
-        [("standard_user", "secret_sauce")]
-    )
-    def test_successful_login(self, chromedriver, username, password):
+    @allure.title("{scenario.title}")
+    @pytest.mark.parametrize("scenario", compile_matrix(SCENARIOS))
+    def test_login(self, scenario_browser, chromedriver, checkpoint, scenario):
         """
-        Тест успешной авторизации пользователя standard_user.
+        Тест авторизации по сценарию из tests/login_scenarios.json.
 
         Args:
-            driver: Экземпляр WebDriver
-            username: Имя пользователя
-            password: Пароль
+            scenario_browser: Браузер, общий для сценариев входа
+            chromedriver: Экземпляр WebDriver этого браузера
+            checkpoint: Функция сохранения контрольной точки
+            scenario: Сценарий входа
         """
+        allure.dynamic.severity(allure.severity_level(scenario.severity))
+        allure.dynamic.description(scenario.description)
+
         with allure.step("1. Открыть главную страницу"):
-            chromedriver.get(MAIN_URL)
-            login_page = LoginPage(chromedriver)
+            login_page = scenario_browser.login_page(
+                fresh=scenario.fill == "password_only"
+            )
             assert chromedriver.title == PAGE_TITLE, (
                 f"Заголовок страницы должен быть '{PAGE_TITLE}'"
             )
@@ -47,194 +62,75 @@ class TestLogin:
                 "Кнопка Login должна быть кликабельной"
             )
 
-        with allure.step(f"3. Ввести логин '{username}' и пароль '{password}'"):
-            login_page.send_text(username, password)
+        if scenario.fill == "password_only":
+            with allure.step(f"3. Ввести только пароль '{scenario.password}'"):
+                login_page.send_text_only_password(scenario.password)
+        else:
+            with allure.step(
+                f"3. Ввести логин '{scenario.username}' и пароль '{scenario.password}'"
+            ):
+                login_page.send_text(scenario.username, scenario.password)
 
         with allure.step("4. Нажать кнопку Login"):
             login_page.click_login_button()
 
-        with allure.step("5. Проверить успешную авторизацию"):
-            current_url = chromedriver.current_url
-            assert current_url == URL_AFTER_LOGIN, (
-                f"После успешного входа URL должен быть '{URL_AFTER_LOGIN}'"
-            )
-
-            assert login_page.is_products_displayed(
-                timeout=TIME_TO_WAIT
-            ), "После успешного входа должен отображаться заголовок 'Products'"
-
-            assert "inventory.html" in chromedriver.current_url, (
-                "URL должен содержать 'inventory.html'"
-            )
-
-            allure.attach(
-                chromedriver.get_screenshot_as_png(),
-                name="successful_login",
-                attachment_type=allure.attachment_type.PNG,
-            )
-
-    @allure.title("2. Авторизация с неверным паролем")
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.description("""
-    Проверка авторизации с правильным логином, но неправильным паролем.
-    Ожидается сообщение об ошибке и отсутствие перехода на страницу товаров.
-    """)
-    @pytest.mark.parametrize(
-        "username,password",
-        [("standard_user", "wrong_password_123")]
-    )
-    def test_wrong_password_login(self, chromedriver, username, password):
-        """Тест авторизации с неверным паролем."""
-        with allure.step("1. Открыть главную страницу"):
-            chromedriver.get(MAIN_URL)
-            login_page = LoginPage(chromedriver)
-
-        with allure.step("2. Ввести правильный логин и неправильный пароль"):
-            login_page.send_text(username, password)
-
-        with allure.step("3. Нажать кнопку Login"):
-            login_page.click_login_button()
-
-        with allure.step("4. Проверить сообщение об ошибке"):
-            assert login_page.is_error_displayed(
-                timeout=TIME_TO_WAIT
-            ), "При неверном пароле должно отображаться сообщение об ошибке"
-
-            error_text = login_page.get_error_text()
-            print(f"Текст ошибки: {error_text}")
-
-            assert BAD_PASSWORD_ERROR in error_text, (
-                f"Текст ошибки должен содержать: '{BAD_PASSWORD_ERROR}'"
-            )
-
-        with allure.step("5. Проверить, что остались на странице логина"):
-            current_url = chromedriver.current_url
-            assert current_url == MAIN_URL, (
-                f"После ошибки должны оставаться на странице логина. "
-                f"URL: {current_url}"
-            )
-
-            allure.attach(
-                chromedriver.get_screenshot_as_png(),
-                name="wrong_password_error",
-                attachment_type=allure.attachment_type.PNG,
-            )
-
-    @allure.title("3. Авторизация заблокированного пользователя")
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.description("""
-    Проверка авторизации пользователя locked_out_user.
-    Ожидается сообщение об ошибке блокировки.
-    """)
-    @pytest.mark.parametrize(
-        "username,password",
-        [("locked_out_user", "secret_sauce")]
-    )
-    def test_locked_user_login(self, chromedriver, username, password):
-        """Тест авторизации заблокированного пользователя."""
-        with allure.step("1. Открыть главную страницу"):
-            chromedriver.get(MAIN_URL)
-            login_page = LoginPage(chromedriver)
-
-        with allure.step("2. Ввести данные заблокированного пользователя"):
-            login_page.send_text(username, password)
-
-        with allure.step("3. Нажать кнопку Login"):
-            login_page.click_login_button()
-
-        with allure.step("4. Проверить сообщение об ошибке блокировки"):
-            assert login_page.is_error_displayed(
-                timeout=TIME_TO_WAIT
-            ), "Для заблокированного пользователя должно отображаться сообщение об ошибке"
-
-            error_text = login_page.get_error_text()
-            print(f"Текст ошибки: {error_text}")
-
-            assert LOCKED_USER_ERROR in error_text, (
-                f"Текст ошибки должен содержать: '{LOCKED_USER_ERROR}'"
-            )
-
-        with allure.step("5. Проверить, что остались на странице логина"):
-            current_url = chromedriver.current_url
-            assert current_url == MAIN_URL, (
-                "После ошибки должны оставаться на странице логина"
-            )
-
-    @allure.title("4. Авторизация с пустым логином")
+        if scenario.outcome == "success":
+            with allure.step("5. Проверить успешную авторизацию"):
+                assert login_page.is_products_displayed(TIME_TO_WAIT), (
+                    "После успешного входа должен отображаться заголовок 'Products'"
+                )
+
+                current_url = chromedriver.current_url
+                assert current_url == scenario.url, (
+                    f"После успешного входа URL должен быть '{scenario.url}'"
+                )
+        else:
+            with allure.step("5. Проверить сообщение об ошибке"):
+                assert login_page.wait_for_error_text(scenario.error, TIME_TO_WAIT), (
+                    f"Текст ошибки должен содержать: '{scenario.error}'"
+                )
+
+            with allure.step("6. Проверить, что остались на странице логина"):
+                current_url = chromedriver.current_url
+                assert current_url == scenario.url, (
+                    f"После ошибки должны оставаться на странице логина. "
+                    f"URL: {current_url}"
+                )
+
+            scenario_browser.keep_login_form()
+
+        checkpoint(scenario.id)
+
+    @allure.title("Одновременный вход в нескольких браузерах")
     @allure.severity(allure.severity_level.NORMAL)
-    @allure.description("""
-    Проверка авторизации с пустым полем логина.
-    Ожидается сообщение об ошибке 'Username is required'.
-    """)
-    @pytest.mark.parametrize("password", ["secret_sauce"])
-    def test_empty_login(self, chromedriver, password):
-        """Тест авторизации с пустым логином."""
-        with allure.step("1. Открыть главную страницу"):
-            chromedriver.get(MAIN_URL)
-            login_page = LoginPage(chromedriver)
-
-        with allure.step("2. Ввести только пароль"):
-            login_page.send_text_only_password(password)
-
-        with allure.step("3. Нажать кнопку Login"):
-            login_page.click_login_button()
-
-        with allure.step("4. Проверить сообщение об ошибке"):
-            assert login_page.is_error_displayed(
-                timeout=TIME_TO_WAIT
-            ), "При пустом логине должно отображаться сообщение об ошибке"
-
-            error_text = login_page.get_error_text()
-            print(f"Текст ошибки: {error_text}")
-
-            assert EMPTY_LOGIN_ERROR in error_text, (
-                f"Текст ошибки должен содержать: '{EMPTY_LOGIN_ERROR}'"
-            )
-
-        with allure.step("5. Проверить, что остались на странице логина"):
-            current_url = chromedriver.current_url
-            assert current_url == MAIN_URL, (
-                "После ошибки должны оставаться на странице логина"
-            )
-
-    @allure.title("5. Авторизация пользователя с задержками")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.description("""
-    Проверка авторизации пользователя performance_glitch_user.
-    Ожидается успешный вход, несмотря на возможные задержки при загрузке.
-    """)
-    @pytest.mark.parametrize(
-        "username,password",
-        [("performance_glitch_user", "secret_sauce")]
-    )
-    def test_performance_glitch_user(self, chromedriver, username, password):
-        """Тест авторизации пользователя с возможными задержками."""
-        with allure.step("1. Открыть главную страницу"):
-            chromedriver.get(MAIN_URL)
-            login_page = LoginPage(chromedriver)
-
-        with allure.step("2. Ввести данные пользователя с задержками"):
-            login_page.send_text(username, password)
-
-        with allure.step("3. Нажать кнопку Login"):
-            login_page.click_login_button()
-
-        with allure.step("4. Проверить успешную авторизацию с учетом задержек"):
-            assert login_page.is_products_displayed(TIME_TO_WAIT), (
-                "Заголовок 'Products' должен отображаться, несмотря на задержки"
-            )
-
-            current_url = chromedriver.current_url
-            assert current_url == URL_AFTER_LOGIN, (
-                f"После успешного входа URL должен быть '{URL_AFTER_LOGIN}'"
-            )
-
-            assert "Products" in chromedriver.page_source, (
-                "На странице должен быть текст 'Products'"
-            )
+    @pytest.mark.multi_browser
+    async def test_concurrent_login(self, async_driver_pool):
+        """
+        Тест входа standard_user одновременно в ASYNC_SESSIONS браузерах,
+        которыми управляет один цикл событий.
 
-            allure.attach(
-                chromedriver.get_screenshot_as_png(),
-                name="performance_glitch_user_login",
-                attachment_type=allure.attachment_type.PNG,
+        Args:
+            async_driver_pool: Пул AsyncWebDriver
+        """
+        async def login(driver):
+            await driver.get(MAIN_URL)
+            login_page = AsyncLoginPage(driver)
+            await login_page.send_text("standard_user", "secret_sauce")
+            await login_page.click_login_button()
+            return await login_page.is_products_displayed(TIME_TO_WAIT)
+
+        with allure.step(f"1. Открыть {ASYNC_SESSIONS} браузеров"):
+            drivers = await asyncio.gather(
+                *(async_driver_pool.acquire() for _ in range(ASYNC_SESSIONS))
+            )
+
+        try:
+            with allure.step("2. Войти как standard_user во всех браузерах"):
+                results = await asyncio.gather(*(login(driver) for driver in drivers))
+        finally:
+            await asyncio.gather(*(async_driver_pool.release(driver) for driver in drivers))
+
+        with allure.step("3. Проверить успешную авторизацию"):
+            assert all(results), (
+                f"Заголовок 'Products' должен отображаться во всех браузерах: {results}"
             )
@@ -0,0 +1,181 @@
+import json
+import os
+
+import allure
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from conf.config import LOCKED_USER_ERROR, MAIN_URL, URL_AFTER_LOGIN
+from pages.login_page import LoginPage
+from utils import timeouts
+from utils.scenarios import ScenarioBrowser, compile_matrix, load_scenarios
+
+
+@pytest.fixture
+def table(tmp_path):
+    """Функция, записывающая таблицу сценариев в JSON-файл и загружающая ее."""
+    def load(*rows):
+        path = tmp_path / "scenarios.json"
+        path.write_text(json.dumps(rows), encoding="utf-8")
+        return load_scenarios(path)
+
+    return load
+
+
+class ErrorPageDriver:
+    """Драйвер страницы логина, на которой осталось сообщение об ошибке."""
+
+    def __init__(self):
+        self.error_shown = True
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def execute_script(self, script, selector):
+        self.error_shown = False
+
+    def find_elements(self, by, selector):
+        assert (by, selector) == LoginPage.error_head
+        return ["error"] if self.error_shown else []
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Таблица сценариев входа")
+class TestLoadScenarios:
+    def test_defaults_and_config_values(self, table):
+        """Значения $ИМЯ берутся из conf.config, url по умолчанию зависит от outcome."""
+        success, error = table(
+            {"id": "ok", "username": "standard_user", "password": "secret_sauce"},
+            {
+                "id": "locked", "username": "locked_out_user", "password": "secret_sauce",
+                "outcome": "error", "error": "$LOCKED_USER_ERROR", "non_visual": True,
+            },
+        )
+
+        assert (success.title, success.severity, success.url) == ("ok", "normal", URL_AFTER_LOGIN)
+        assert (success.fill, success.non_visual) == ("both", False)
+        assert (error.error, error.url, error.non_visual) == (LOCKED_USER_ERROR, MAIN_URL, True)
+
+    def test_list_values_are_expanded(self, table):
+        """Списки username/password разворачиваются во все сочетания с уникальными id."""
+        scenarios = table({
+            "id": "bad", "title": "Неверные данные", "outcome": "error", "error": "x",
+            "username": ["standard_user", ""], "password": ["wrong", "$MAIN_URL"],
+        })
+
+        assert [s.id for s in scenarios] == [
+            "bad-standard_user-wrong",
+            "bad-standard_user-$MAIN_URL",
+            "bad-empty-wrong",
+            "bad-empty-$MAIN_URL",
+        ]
+        assert scenarios[2].title == "Неверные данные (<пусто> / wrong)"
+        assert (scenarios[3].username, scenarios[3].password) == ("", MAIN_URL)
+
+    @pytest.mark.parametrize("rows, message", [
+        ([{"username": "a"}], "нет id"),
+        ([{"id": "a", "outcome": "maybe"}], "неизвестный outcome"),
+        ([{"id": "a", "severity": "urgent"}], "неизвестный severity"),
+        ([{"id": "a", "outcome": "error"}], "нужен error"),
+        ([{"id": "a"}, {"id": "a"}], "повторяется id"),
+        ([{"id": "a", "username": ["x", "x"]}], "повторяется id"),
+        ([{"id": "a", "password": "$NO_SUCH_VALUE"}], "NO_SUCH_VALUE"),
+        ([{"id": "a", "fill": "login_only"}], "неизвестный fill"),
+        ([{"id": "a", "username": "x", "fill": "password_only"}], "username не вводится"),
+    ])
+    def test_invalid_rows(self, table, rows, message):
+        """Некорректная строка таблицы - ValueError с указанием причины."""
+        with pytest.raises(ValueError, match=message):
+            table(*rows)
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Таблица сценариев входа")
+class TestCompileMatrix:
+    def test_error_scenarios_go_first(self, table):
+        """Сценарии с ошибкой идут подряд перед успешными, порядок внутри групп сохраняется."""
+        scenarios = table(
+            {"id": "ok1"},
+            {"id": "err1", "outcome": "error", "error": "x"},
+            {"id": "ok2"},
+            {"id": "err2", "outcome": "error", "error": "x", "non_visual": True},
+        )
+
+        params = compile_matrix(scenarios)
+
+        assert [p.id for p in params] == ["err1", "err2", "ok1", "ok2"]
+        assert [[m.name for m in p.marks] for p in params] == [[], ["non_visual"], [], []]
+        assert params[0].values == (scenarios[1],)
+
+    def test_password_only_scenarios_start_their_group(self, table):
+        """Сценарии с вводом только пароля идут первыми и получают чистую форму."""
+        scenarios = table(
+            {"id": "err", "outcome": "error", "error": "x"},
+            {"id": "empty", "outcome": "error", "error": "x", "fill": "password_only"},
+            {"id": "ok"},
+        )
+
+        assert [p.id for p in compile_matrix(scenarios)] == ["empty", "err", "ok"]
+
+    def test_table_keeps_password_only_coverage(self):
+        """Таблица тестов проверяет вход с одним паролем, как исходный test_empty_login."""
+        scenarios = load_scenarios(
+            os.path.join(os.path.dirname(__file__), "login_scenarios.json")
+        )
+
+        assert [s.id for s in scenarios if s.fill == "password_only"] == ["empty_login"]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Таблица сценариев входа")
+class TestScenarioBrowser:
+    @pytest.fixture(autouse=True)
+    def no_calibration(self, monkeypatch):
+        monkeypatch.setattr(timeouts.wait_calibration, "mode", "off")
+
+    def test_reused_form_has_no_previous_error(self):
+        """На переиспользуемой форме сообщение предыдущего сценария закрывается."""
+        driver = ErrorPageDriver()
+        browser = ScenarioBrowser(driver, base_url=MAIN_URL, reset=lambda d: None)
+        browser.login_page()
+        browser.keep_login_form()
+        driver.error_shown = True
+
+        browser.login_page()
+
+        assert not driver.error_shown
+        assert (browser.navigations, browser.reused) == (1, 1)
+        assert driver.urls == [MAIN_URL]
+
+    def test_fresh_page_is_opened_over_kept_form(self):
+        """fresh=True открывает страницу заново: поля старой формы заполнены."""
+        driver = ErrorPageDriver()
+        browser = ScenarioBrowser(driver, base_url=MAIN_URL, reset=lambda d: None)
+        browser.login_page()
+        browser.keep_login_form()
+
+        browser.login_page(fresh=True)
+
+        assert (browser.navigations, browser.reused) == (2, 0)
+        assert driver.urls == [MAIN_URL, MAIN_URL]
+
+    def test_dirty_browser_is_reset(self):
+        """После сценария, не оставившего форму, браузер сбрасывается и страница открывается заново."""
+        driver = ErrorPageDriver()
+        resets = []
+        browser = ScenarioBrowser(driver, base_url=MAIN_URL, reset=resets.append)
+
+        browser.login_page()
+        browser.login_page()
+
+        assert resets == [driver]
+        assert browser.navigations == 2
+
+    def test_dismiss_error_waits_for_removal(self):
+        """dismiss_error ждет исчезновения сообщения, а не только отправляет команду."""
+        driver = ErrorPageDriver()
+        driver.execute_script = lambda script, selector: None
+
+        with pytest.raises(TimeoutException):
+            LoginPage(driver).dismiss_error(timeout=0.05)
@@ -0,0 +1,178 @@
+import copy
+import time
+
+import allure
+import pytest
+
+from utils import timeouts
+from utils.session_cache import SessionCache
+
+BASE_URL = "http://sauce.test/"
+INVENTORY_URL = f"{BASE_URL}inventory.html"
+PASSWORD = "secret_sauce"
+
+
+class FakeSite:
+    """Сайт-заглушка: выдает сессии при входе и может их все отозвать."""
+
+    def __init__(self):
+        self.sessions = set()
+        self.logins = 0
+
+    def login(self, username, password):
+        if password != PASSWORD:
+            return None
+        self.logins += 1
+        token = f"{username}-{self.logins}"
+        self.sessions.add(token)
+        return token
+
+    def expire_sessions(self):
+        self.sessions.clear()
+
+
+class FakeElement:
+    def __init__(self, browser, name):
+        self.browser = browser
+        self.name = name
+
+    def send_keys(self, *values):
+        self.browser.typed[self.name] = values[-1]
+
+    def click(self):
+        self.browser.submit()
+
+
+class FakeBrowser:
+    """
+    Браузер без Chrome для страниц логина и товаров FakeSite.
+
+    Ожидания Waiter выполняются через execute_async_script: элементы
+    страницы возвращаются сразу, отсутствующие - по истечении таймаута скрипта.
+    """
+
+    def __init__(self, site):
+        self.site = site
+        self.url = "about:blank"
+        self.cookies = []
+        self.storage = {}
+        self.typed = {}
+
+    def get(self, url):
+        self.url = url
+        if url == INVENTORY_URL and not self._logged_in():
+            self.url = BASE_URL
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        if "setItem" in script:
+            self.storage = copy.deepcopy(args[0])
+        elif "getItem" in script:
+            return copy.deepcopy(self.storage)
+        return {}
+
+    def execute_async_script(self, script, targets, state, wait_ms):
+        selectors = [selector for _, selector in targets]
+        if self.url == INVENTORY_URL and any("Products" in s for s in selectors):
+            return ["products"]
+        if self.url == BASE_URL and "Products" not in selectors[0]:
+            return [FakeElement(self, selector) for selector in selectors]
+        time.sleep(wait_ms / 1000)
+        return None
+
+    def submit(self):
+        token = self.site.login(
+            self.typed.get('[id="user-name"]'), self.typed.get('[id="password"]')
+        )
+        if token:
+            self.cookies = [{"name": "session-username", "value": token}]
+            self.storage = {
+                "localStorage": {"cart-contents": "[4]"},
+                "sessionStorage": {"tab-token": token},
+            }
+            self.url = INVENTORY_URL
+
+    def _logged_in(self):
+        return any(cookie["value"] in self.site.sessions for cookie in self.cookies)
+
+
+@pytest.fixture(autouse=True)
+def no_calibration(monkeypatch):
+    """Замеры заглушки не должны попасть в модель таймаутов настоящих прогонов."""
+    monkeypatch.setattr(timeouts.wait_calibration, "mode", "off")
+
+
+def login(cache, browser, password=PASSWORD, **kwargs):
+    return cache.login(
+        browser, "standard_user", password,
+        base_url=BASE_URL, after_login_url=INVENTORY_URL, **kwargs,
+    )
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Кэш сессий")
+class TestSessionCache:
+    def test_second_login_is_restored_from_cache(self):
+        """Первый вход - через форму, второй - восстановлением cookies в новом браузере."""
+        site, cache = FakeSite(), SessionCache()
+
+        assert login(cache, FakeBrowser(site))
+        browser = FakeBrowser(site)
+        assert login(cache, browser)
+
+        assert (cache.hits, cache.misses, site.logins) == (1, 1, 1)
+        assert browser.url == INVENTORY_URL
+
+    def test_local_and_session_storage_are_restored(self):
+        """Восстанавливаются оба хранилища, а не только localStorage."""
+        site, cache = FakeSite(), SessionCache()
+        first = FakeBrowser(site)
+        assert login(cache, first)
+
+        second = FakeBrowser(site)
+        assert login(cache, second)
+
+        assert second.storage == first.storage
+        assert second.storage["sessionStorage"] == {"tab-token": "standard_user-1"}
+
+    def test_wrong_password_is_not_served_from_cache(self):
+        """Вход с неверным паролем идет через форму и не удается, как без кэша."""
+        site, cache = FakeSite(), SessionCache()
+        assert login(cache, FakeBrowser(site))
+
+        assert not login(cache, FakeBrowser(site), password="wrong", timeout=0.2)
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert login(cache, FakeBrowser(site))
+        assert cache.hits == 1
+
+    def test_invalid_session_is_detected_by_short_probe(self):
+        """Отозванная сессия сбрасывается за probe_timeout, а не за полный timeout."""
+        site, cache = FakeSite(), SessionCache()
+        assert login(cache, FakeBrowser(site))
+        site.expire_sessions()
+
+        started = time.monotonic()
+        assert login(cache, FakeBrowser(site), timeout=30, probe_timeout=0.2)
+
+        assert time.monotonic() - started < 5
+        assert (cache.invalidated, cache.misses, site.logins) == (1, 2, 2)
+
+    def test_failed_login_is_not_cached(self):
+        """Неудачный вход через форму не сохраняется в кэш."""
+        site, cache = FakeSite(), SessionCache()
+
+        assert not login(cache, FakeBrowser(site), password="wrong", timeout=0.2)
+        assert cache.get(("standard_user", BASE_URL)) is None
+
+    def test_entry_expires_after_ttl(self):
+        """Запись старше ttl не используется."""
+        site, cache = FakeSite(), SessionCache(ttl=0)
+
+        assert login(cache, FakeBrowser(site))
+
+        assert cache.get(("standard_user", BASE_URL)) is None
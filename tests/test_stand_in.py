@@ -0,0 +1,109 @@
+import html
+import http.client
+from urllib.parse import urlencode
+
+import allure
+import pytest
+
+from conf.config import BAD_PASSWORD_ERROR, EMPTY_LOGIN_ERROR, LOCKED_USER_ERROR
+from utils.stand_in import (
+    EMPTY_PASSWORD_ERROR,
+    NOT_LOGGED_IN_ERROR,
+    SESSION_COOKIE,
+    StandInServer,
+    authenticate,
+    is_stand_in,
+)
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Сервер на свободном порту, без задержек."""
+    with StandInServer(port=0, delay=0, glitch_delay=0) as server:
+        yield server
+
+
+def request(server, method, path, form=None, cookie=None):
+    connection = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    headers = {}
+    body = None
+    if form is not None:
+        body = urlencode(form)
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+    if cookie:
+        headers["Cookie"] = cookie
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    page = response.read().decode("utf-8")
+    connection.close()
+    return response, page
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Локальная замена Sauce Demo")
+class TestStandIn:
+    @pytest.mark.parametrize("username, password, error", [
+        ("standard_user", "secret_sauce", ""),
+        ("", "secret_sauce", EMPTY_LOGIN_ERROR),
+        ("standard_user", "", EMPTY_PASSWORD_ERROR),
+        ("standard_user", "wrong", f"Epic sadface: {BAD_PASSWORD_ERROR}"),
+        ("nobody", "secret_sauce", f"Epic sadface: {BAD_PASSWORD_ERROR}"),
+        ("locked_out_user", "secret_sauce", LOCKED_USER_ERROR),
+    ])
+    def test_authenticate(self, username, password, error):
+        """Проверки входа в том же порядке, что у Sauce Demo."""
+        assert authenticate(username, password) == error
+
+    def test_login_redirects_with_session_cookie(self, server):
+        """Успешный вход - 302 на страницу товаров и cookie сессии."""
+        response, _ = request(
+            server, "POST", "/", {"user-name": "standard_user", "password": "secret_sauce"}
+        )
+
+        assert response.status == 302
+        assert response.getheader("Location") == "/inventory.html"
+        assert response.getheader("Set-Cookie").startswith(f"{SESSION_COOKIE}=standard_user")
+
+    def test_failed_login_shows_error(self, server):
+        """Ошибка входа - страница логина с сообщением и введенным именем, без cookie."""
+        response, page = request(
+            server, "POST", "/", {"user-name": "locked_out_user", "password": "secret_sauce"}
+        )
+
+        assert response.status == 200
+        assert response.getheader("Set-Cookie") is None
+        assert f'<h3 data-test="error">{LOCKED_USER_ERROR}</h3>' in page
+        assert 'value="locked_out_user"' in page
+
+    def test_inventory_requires_session(self, server):
+        """Без cookie сессии страница товаров недоступна."""
+        _, page = request(server, "GET", "/inventory.html")
+
+        assert "Products" not in page
+        assert html.escape(NOT_LOGGED_IN_ERROR) in page
+
+    def test_inventory_with_session(self, server):
+        """С cookie сессии открывается страница товаров."""
+        _, page = request(
+            server, "GET", "/inventory.html", cookie=f"{SESSION_COOKIE}=standard_user"
+        )
+
+        assert '<span class="title" data-test="title">Products</span>' in page
+
+    def test_locked_user_cookie_is_rejected(self, server):
+        """Подделанная cookie заблокированного пользователя не дает доступа."""
+        _, page = request(
+            server, "GET", "/inventory.html", cookie=f"{SESSION_COOKIE}=locked_out_user"
+        )
+
+        assert "Products" not in page
+
+    def test_unknown_path(self, server):
+        """Неизвестный адрес - 404."""
+        response, _ = request(server, "GET", "/missing")
+
+        assert response.status == 404
+
+    def test_is_stand_in(self, server):
+        """Работающий сервер узнается по заголовку Server."""
+        assert is_stand_in(server.url)
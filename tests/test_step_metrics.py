@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from utils.step_metrics import (
+    StepMetrics,
+    StepRecord,
+    install,
+    load_steps,
+    save_run,
+    step_stats,
+)
+
+
+class FakeDriver:
+    """Драйвер, считающий скрипты; объем загруженных данных всегда 2 КБ."""
+
+    def __init__(self):
+        self.scripts = 0
+
+    def execute(self, command, params=None):
+        return None
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        self.execute("executeScript")
+        return 2048
+
+    def click(self):
+        self.execute("elementClick")
+
+
+def run_step(metrics, driver):
+    """Выполняет один шаг allure с одной командой драйвера внутри теста."""
+    item = SimpleNamespace(
+        nodeid="tests/test_x.py::test_x",
+        funcargs={"chromedriver": driver},
+    )
+    call = metrics.pytest_runtest_call(item)
+    next(call)
+    metrics.start_step("uuid", "1. Нажать кнопку", {})
+    driver.click()
+    metrics.stop_step("uuid", None, None, None)
+    with pytest.raises(StopIteration):
+        next(call)
+    return metrics.records[-1]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Время шагов")
+class TestStepMetrics:
+    def test_fast_step_does_not_query_browser(self, tmp_path):
+        """Для быстрого шага объем данных не запрашивается - лишней команды нет."""
+        driver = FakeDriver()
+
+        record = run_step(StepMetrics(tmp_path / "steps.sqlite", slow_step=60), driver)
+
+        assert driver.scripts == 0
+        assert (record.commands, record.bytes) == (1, None)
+
+    def test_slow_step_reports_transferred_bytes(self, tmp_path):
+        """Для медленного шага объем считается скриптом, который не входит в число команд."""
+        driver = FakeDriver()
+
+        record = run_step(StepMetrics(tmp_path / "steps.sqlite", slow_step=0), driver)
+
+        assert driver.scripts == 1
+        assert (record.commands, record.bytes) == (1, 2048)
+
+    def test_disabled_by_default(self):
+        """Без пути к базе плагин не регистрируется."""
+        assert install(SimpleNamespace(), "") is None
+
+    def test_saved_steps_are_summarized(self, tmp_path):
+        """Записанные прогоны читаются и сводятся по заголовкам шагов."""
+        path = tmp_path / "steps.sqlite"
+        for duration in (1.0, 3.0):
+            save_run(path, [StepRecord("t", "шаг", 0, 0.0, duration, 2, None, False)], 0.0)
+
+        stats = step_stats(load_steps(path))
+
+        assert len(stats) == 1
+        assert stats[0]["count"] == 2
+        assert (stats[0]["mean"], stats[0]["max"], stats[0]["commands"]) == (2.0, 3.0, 2)
+        assert stats[0]["bytes"] is None
@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import allure
+
+from conf.config import MAIN_URL
+from utils.timeouts import CACHE_KEY, CalibrationStore, TimeoutModel
+
+
+class SlowCache:
+    """
+    Кэш pytest в каталоге с той же раскладкой, что .pytest_cache
+    (значения в v/, каталоги плагинов в d/), и медленным чтением.
+
+    Пауза между чтением и записью делает одновременное сохранение
+    двумя воркерами воспроизводимым.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def mkdir(self, name):
+        path = self.root / "d" / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get(self, key, default):
+        path = self.root / "v" / key
+        value = json.loads(path.read_text()) if path.exists() else default
+        time.sleep(0.1)
+        return value
+
+    def set(self, key, value):
+        path = self.root / "v" / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(value))
+
+
+def worker_store(cache, condition):
+    model = TimeoutModel("learn")
+    store = CalibrationStore(SimpleNamespace(cache=cache), model)
+    model.observe(condition, 0.5, ready=True)
+    return store
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Ожидания")
+class TestCalibrationStore:
+    def test_concurrent_workers_keep_each_others_samples(self, tmp_path):
+        """Воркеры, сохраняющие модель одновременно, не затирают замеры друг друга."""
+        cache = SlowCache(tmp_path)
+        stores = [worker_store(cache, f"условие {index}") for index in range(2)]
+
+        threads = [threading.Thread(target=store.pytest_sessionfinish) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert cache.get(CACHE_KEY, {})[MAIN_URL] == {
+            "условие 0": [0.5],
+            "условие 1": [0.5],
+        }
+
+    def test_next_run_loads_saved_samples(self, tmp_path):
+        """Следующий прогон начинает с сохраненных замеров."""
+        cache = SlowCache(tmp_path)
+        worker_store(cache, "условие").pytest_sessionfinish()
+
+        model = TimeoutModel("on")
+        CalibrationStore(SimpleNamespace(cache=cache), model)
+
+        assert model.samples == {"условие": [0.5]}
@@ -0,0 +1,143 @@
+import asyncio
+
+import allure
+import pytest
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    InvalidSessionIdException,
+    JavascriptException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+
+from utils.timeouts import TimeoutModel
+from utils.waits import AsyncWaiter, Waiter, css_escape
+
+LOCATOR = (By.ID, "user-name")
+
+
+class ScriptedDriver:
+    """Драйвер, отвечающий на execute_async_script заданной последовательностью."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def execute_async_script(self, script, *args):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class AsyncScriptedDriver(ScriptedDriver):
+    async def execute_async_script(self, script, *args):
+        return super().execute_async_script(script, *args)
+
+
+def waiter(driver):
+    return Waiter(driver, poll_interval=0.01, calibration=TimeoutModel("off"))
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Ожидания")
+class TestWaiterElements:
+    def test_retries_after_document_unload(self):
+        """Переход на другую страницу во время ожидания - повтор на новой странице."""
+        driver = ScriptedDriver(
+            JavascriptException("javascript error: document unloaded while waiting for result"),
+            TimeoutException("script timeout"),
+            ["element"],
+        )
+
+        assert waiter(driver).element(LOCATOR, timeout=5) == "element"
+        assert driver.calls == 3
+
+    @pytest.mark.parametrize("error", [
+        InvalidSelectorException("invalid selector"),
+        JavascriptException("javascript error: x is not defined"),
+        InvalidSessionIdException("invalid session id"),
+    ])
+    def test_other_errors_are_raised_immediately(self, error):
+        """Ошибка, не связанная с навигацией, не превращается в таймаут."""
+        driver = ScriptedDriver(error)
+
+        with pytest.raises(type(error)):
+            waiter(driver).element(LOCATOR, timeout=5)
+        assert driver.calls == 1
+
+    def test_timeout(self):
+        """Элемент так и не появился - TimeoutException по истечении таймаута."""
+        with pytest.raises(TimeoutException):
+            waiter(ScriptedDriver()).element(LOCATOR, timeout=0.05)
+
+    def test_context_separates_calibration_samples(self):
+        """Замеры разных пользователей калибруются отдельно."""
+        model = TimeoutModel("learn")
+        for user in ("standard_user", "performance_glitch_user", ""):
+            Waiter(ScriptedDriver(["element"]), calibration=model, context=user).element(
+                LOCATOR, timeout=5
+            )
+
+        assert sorted(model.samples) == [
+            "default: performance_glitch_user: visible: user-name",
+            "default: standard_user: visible: user-name",
+            "default: visible: user-name",
+        ]
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Ожидания")
+class TestCssEscape:
+    @pytest.mark.parametrize("value, escaped", [
+        ("user-name", "user-name"),
+        ('a"b', 'a\\"b'),
+        ("a\\b", "a\\\\b"),
+        ("a b", "a\\ b"),
+        ("1st", "\\31 st"),
+        ("-1", "-\\31 "),
+        ("-", "\\-"),
+        ("a\nb", "a\\a b"),
+        ("товар", "товар"),
+    ])
+    def test_matches_browser_css_escape(self, value, escaped):
+        """Экранирование совпадает с CSS.escape() браузера."""
+        assert css_escape(value) == escaped
+
+    def test_locator_value_is_escaped(self):
+        """Кавычка в id не закрывает значение атрибута в селекторе ожидания."""
+        driver = ScriptedDriver(["element"])
+        driver.execute_async_script = lambda script, targets, *args: targets
+
+        selector = waiter(driver).element((By.ID, 'a"b'), timeout=5)
+
+        assert selector == ["css", '[id="a\\"b"]']
+
+
+@allure.epic("Инфраструктура тестов")
+@allure.feature("Ожидания")
+class TestAsyncWaiter:
+    def test_retries_after_document_unload(self):
+        """AsyncWaiter повторяет ожидание после ухода со страницы так же, как Waiter."""
+        driver = AsyncScriptedDriver(
+            JavascriptException("javascript error: document unloaded while waiting for result"),
+            ["element"],
+        )
+        waiter = AsyncWaiter(driver, poll_interval=0.01, calibration=TimeoutModel("off"))
+
+        assert asyncio.run(waiter.element(LOCATOR, timeout=5)) == "element"
+        assert [r.round_trips for r in waiter.history] == [2]
+
+    def test_until_timeout(self):
+        """Невыполненное условие - TimeoutException с откалиброванным таймаутом."""
+        async def never(driver):
+            return None
+
+        waiter = AsyncWaiter(
+            AsyncScriptedDriver(), poll_interval=0.01, calibration=TimeoutModel("off")
+        )
+
+        with pytest.raises(TimeoutException, match="Условие 'никогда' не выполнилось за 0.2 с"):
+            asyncio.run(waiter.until(never, 0.2, "никогда"))
+        assert not waiter.history[0].ready
@@ -0,0 +1,328 @@
+"""
+Потоковая запись результатов Allure в сжатые блоки и выгрузка в allure-results.
+
+Пример:
+    pytest tests/ --allure-stream=allure-stream
+    python -m utils.allure_stream export allure-stream allure-results
+    python -m utils.allure_stream stats allure-stream
+
+Вместо отдельного JSON-файла на каждый тест и контейнер результаты
+дописываются строками в сжатые блоки allure-stream/chunks/*.jsonl.gz
+(новый блок - каждые ALLURE_STREAM_CHUNK_RECORDS записей). Вложения
+хранятся один раз по sha256 содержимого в allure-stream/blobs/.
+Память процесса не растет с числом тестов: в памяти только текущий блок.
+export собирает из блоков обычный каталог результатов Allure.
+"""
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+import allure_commons
+import pytest
+from allure_commons.logger import AllureFileLogger
+from attr import asdict
+
+from conf.config import ALLURE_RESULTS_DIR, ALLURE_STREAM_CHUNK_RECORDS
+from utils.workers import worker_id
+
+CHUNKS_DIR = "chunks"
+BLOBS_DIR = "blobs"
+
+
+class AllureStreamLogger:
+    """
+    Логгер Allure, дописывающий результаты в сжатые блоки.
+
+    Заменяет AllureFileLogger: получает те же хуки allure_commons.
+    Каждый логгер пишет свои блоки (имя включает воркер, pid и случайный
+    суффикс), поэтому параллельные воркеры делят один каталог без
+    объединения шардов. После каждого результата теста блок сбрасывается на диск,
+    и прерванный прогон теряет не больше одного теста.
+
+    Attributes:
+        directory: Каталог потока результатов
+        chunk_records: Записей в одном блоке
+        records: Сколько записей результатов и контейнеров записано
+        blobs: Сколько уникальных вложений записано
+    """
+
+    def __init__(self, directory, chunk_records=ALLURE_STREAM_CHUNK_RECORDS):
+        self.directory = directory
+        self.chunk_records = chunk_records
+        self.records = 0
+        self.blobs = 0
+        self._prefix = (
+            f"{worker_id()}-{os.getpid()}-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        )
+        self._chunk = None
+        self._chunk_index = 0
+        self._chunk_size = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, CHUNKS_DIR), exist_ok=True)
+        os.makedirs(os.path.join(directory, BLOBS_DIR), exist_ok=True)
+
+    @allure_commons.hookimpl
+    def report_result(self, result):
+        self._report_item(result)
+        with self._lock:
+            if self._chunk is not None:
+                self._chunk.flush()
+
+    @allure_commons.hookimpl
+    def report_container(self, container):
+        self._report_item(container)
+
+    @allure_commons.hookimpl
+    def report_attached_file(self, source, file_name):
+        with open(source, "rb") as f:
+            self._report_attachment(f.read(), file_name)
+
+    @allure_commons.hookimpl
+    def report_attached_data(self, body, file_name):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self._report_attachment(body, file_name)
+
+    def close(self):
+        """Закрывает текущий блок."""
+        with self._lock:
+            if self._chunk is not None:
+                self._chunk.close()
+                self._chunk = None
+
+    def _report_item(self, item):
+        # Те же имя и содержимое, что пишет AllureFileLogger
+        file_name = item.file_pattern.format(prefix=item.uuid)
+        data = asdict(item, filter=lambda _, v: v or v is False)
+        self._append({"file": file_name, "item": data})
+        with self._lock:
+            self.records += 1
+
+    def _report_attachment(self, body, file_name):
+        digest = hashlib.sha256(body).hexdigest()
+        path = blob_path(self.directory, digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Атомарная запись: тот же blob может писать другой воркер
+            fd, temp = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(temp, path)
+            with self._lock:
+                self.blobs += 1
+        self._append({"attachment": file_name, "sha256": digest})
+
+    def _append(self, record):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._chunk is None or self._chunk_size >= self.chunk_records:
+                if self._chunk is not None:
+                    self._chunk.close()
+                self._chunk_index += 1
+                name = f"{self._prefix}-{self._chunk_index:05d}.jsonl.gz"
+                self._chunk = gzip.open(
+                    os.path.join(self.directory, CHUNKS_DIR, name), "ab"
+                )
+                self._chunk_size = 0
+            self._chunk.write(line)
+            self._chunk_size += 1
+
+
+class AllureStream:
+    """
+    Плагин pytest, направляющий результаты Allure в AllureStreamLogger.
+
+    allure-pytest создает AllureFileLogger при --alluredir; на время сессии
+    он отключается, а после нее возвращается, чтобы allure-pytest
+    штатно снял его с регистрации.
+
+    Attributes:
+        logger: AllureStreamLogger
+    """
+
+    def __init__(self, directory):
+        self.logger = AllureStreamLogger(directory)
+        self._file_loggers = []
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self):
+        manager = allure_commons.plugin_manager
+        for plugin in manager.get_plugins():
+            if isinstance(plugin, AllureFileLogger):
+                self._file_loggers.append((plugin, manager.get_name(plugin)))
+                manager.unregister(plugin)
+        manager.register(self.logger)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        self.logger.close()
+
+    def pytest_unconfigure(self):
+        manager = allure_commons.plugin_manager
+        if manager.is_registered(self.logger):
+            manager.unregister(self.logger)
+        for plugin, name in self._file_loggers:
+            manager.register(plugin, name)
+        self.logger.close()
+
+
+def blob_path(directory, digest):
+    """
+    Args:
+        directory: Каталог потока результатов
+        digest: sha256 содержимого вложения
+
+    Returns:
+        str: Путь к файлу вложения.
+    """
+    return os.path.join(directory, BLOBS_DIR, digest[:2], digest)
+
+
+def read_records(directory):
+    """
+    Читает записи всех блоков потока.
+
+    Блок, который не был закрыт (прерванный прогон), читается
+    до последней целиком сброшенной записи.
+
+    Args:
+        directory: Каталог потока результатов
+
+    Yields:
+        dict: Запись результата ({"file", "item"}) или вложения
+        ({"attachment", "sha256"}).
+    """
+    for chunk in sorted(glob.glob(os.path.join(directory, CHUNKS_DIR, "*.jsonl.gz"))):
+        with gzip.open(chunk, "rb") as f:
+            try:
+                for line in f:
+                    if line.endswith(b"\n"):
+                        yield json.loads(line)
+            except EOFError:
+                pass
+
+
+def export(directory, target=ALLURE_RESULTS_DIR, clean=True):
+    """
+    Выгружает поток в обычный каталог результатов Allure.
+
+    Вложения связываются жесткими ссылками (копируются, если каталоги
+    на разных файловых системах).
+
+    Args:
+        directory: Каталог потока результатов
+        target: Каталог результатов Allure
+        clean: Очистить target перед выгрузкой
+
+    Returns:
+        tuple: (число результатов и контейнеров, число вложений).
+    """
+    if clean:
+        shutil.rmtree(target, ignore_errors=True)
+    os.makedirs(target, exist_ok=True)
+    items = attachments = 0
+    for record in read_records(directory):
+        if "attachment" in record:
+            source = blob_path(directory, record["sha256"])
+            destination = os.path.join(target, record["attachment"])
+            if not os.path.exists(destination):
+                try:
+                    os.link(source, destination)
+                except OSError:
+                    shutil.copyfile(source, destination)
+            attachments += 1
+        else:
+            with open(os.path.join(target, record["file"]), "w", encoding="utf-8") as f:
+                json.dump(record["item"], f, ensure_ascii=False)
+            items += 1
+    return items, attachments
+
+
+def stats(directory):
+    """
+    Args:
+        directory: Каталог потока результатов
+
+    Returns:
+        dict: Число блоков, записей, вложений и объем на диске в байтах.
+    """
+    chunks = glob.glob(os.path.join(directory, CHUNKS_DIR, "*.jsonl.gz"))
+    blobs = glob.glob(os.path.join(directory, BLOBS_DIR, "*", "*"))
+    records = attachments = 0
+    for record in read_records(directory):
+        if "attachment" in record:
+            attachments += 1
+        else:
+            records += 1
+    return {
+        "chunks": len(chunks),
+        "records": records,
+        "attachments": attachments,
+        "blobs": len(blobs),
+        "chunk_bytes": sum(map(os.path.getsize, chunks)),
+        "blob_bytes": sum(map(os.path.getsize, blobs)),
+    }
+
+
+def install(config, directory):
+    """
+    Регистрирует AllureStream, если задан каталог потока и Allure пишет результаты.
+
+    Args:
+        config: Конфигурация pytest
+        directory: Каталог потока результатов (пустая строка - не использовать)
+
+    Returns:
+        AllureStream | None: Зарегистрированный плагин или None.
+    """
+    if not directory or not getattr(config.option, "allure_report_dir", None):
+        return None
+    if config.option.collectonly:
+        return None
+    stream = AllureStream(os.path.abspath(directory))
+    config.pluginmanager.register(stream, "allure_stream")
+    return stream
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Выгрузить в каталог Allure")
+    export_parser.add_argument("stream")
+    export_parser.add_argument("target", nargs="?", default=ALLURE_RESULTS_DIR)
+    export_parser.add_argument(
+        "--keep", action="store_true", help="Не очищать каталог результатов"
+    )
+    stats_parser = commands.add_parser("stats", help="Размер потока результатов")
+    stats_parser.add_argument("stream")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(os.path.join(args.stream, CHUNKS_DIR)):
+        parser.error(f"{args.stream} - не каталог потока результатов")
+
+    if args.command == "export":
+        items, attachments = export(args.stream, args.target, clean=not args.keep)
+        print(f"{args.target}: результатов и контейнеров {items}, вложений {attachments}")
+        return 0
+
+    data = stats(args.stream)
+    print(
+        f"блоков: {data['chunks']} ({data['chunk_bytes'] / 1024:.1f} КБ), "
+        f"записей: {data['records']}, вложений: {data['attachments']} "
+        f"(уникальных {data['blobs']}, {data['blob_bytes'] / 1024:.1f} КБ)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
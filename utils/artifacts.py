@@ -0,0 +1,258 @@
+import base64
+import hashlib
+import logging
+import random
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import allure_commons
+import pytest
+from allure_commons.model2 import Attachment, ExecutableItem
+from allure_commons.types import AttachmentType
+
+from conf.config import (
+    ARTIFACT_PNG_COMPRESSION,
+    ARTIFACT_SAMPLE_RATE,
+    ARTIFACT_WRITERS,
+)
+from utils.http_browser import HttpBrowser
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("failure", "always", "sampled")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class ArtifactCapture:
+    """
+    Плагин pytest, снимающий скриншоты и исходный код страницы для Allure.
+
+    На потоке теста выполняется только обращение к WebDriver и вычисление
+    хэша содержимого; декодирование base64, сжатие скриншота и передача
+    вложения логгеру Allure (файл в каталоге результатов или
+    utils.allure_stream) выполняются в пуле фоновых потоков. Одинаковые
+    артефакты записываются один раз: имя файла строится из sha256 содержимого,
+    и все вложения ссылаются на один и тот же файл.
+
+    Политики:
+        failure - артефакты снимаются только при падении теста (по умолчанию)
+        always - при падении и во всех контрольных точках теста
+        sampled - при падении и в контрольных точках доли sample_rate тестов
+
+    Attributes:
+        config: Конфигурация pytest
+        policy: Политика съемки артефактов
+        sample_rate: Доля тестов, для которых снимаются контрольные точки
+                     при политике sampled
+        captured: Сколько артефактов прикреплено к отчету
+        written: Сколько уникальных файлов записано на диск
+    """
+
+    def __init__(
+        self,
+        config,
+        policy="failure",
+        sample_rate=ARTIFACT_SAMPLE_RATE,
+        writers=ARTIFACT_WRITERS,
+    ):
+        self.config = config
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.captured = 0
+        self.written = 0
+        self._digests = set()
+        self._sampled = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=writers, thread_name_prefix="artifacts"
+        )
+        self._futures = []
+
+    def wants_checkpoint(self, item):
+        """
+        Проверяет, нужно ли снимать контрольные точки в тесте.
+
+        Решение для политики sampled принимается один раз на тест.
+
+        Args:
+            item: Тест pytest
+
+        Returns:
+            bool: True если контрольные точки теста нужно сохранять.
+        """
+        if self.policy == "always":
+            return True
+        if self.policy == "sampled":
+            if item.nodeid not in self._sampled:
+                self._sampled[item.nodeid] = random.random() < self.sample_rate
+            return self._sampled[item.nodeid]
+        return False
+
+    def screenshot(self, driver, name):
+        """
+        Снимает скриншот и прикрепляет его к текущему шагу Allure.
+
+        Args:
+            driver: Экземпляр WebDriver
+            name: Имя вложения в отчете
+        """
+        encoded = driver.get_screenshot_as_base64()
+        self._attach(encoded.encode("ascii"), name, AttachmentType.PNG, _encode_png)
+
+    def page_source(self, driver, name):
+        """
+        Сохраняет исходный код страницы и прикрепляет его к текущему шагу Allure.
+
+        Args:
+            driver: Экземпляр WebDriver
+            name: Имя вложения в отчете
+        """
+        self._attach(
+            driver.page_source.encode("utf-8"), name, AttachmentType.HTML, None
+        )
+
+    def flush(self):
+        """Дожидается записи всех поставленных в очередь артефактов."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            try:
+                future.result()
+            except OSError as e:
+                logger.warning("Не удалось записать артефакт: %s", e)
+
+    def close(self):
+        """Записывает оставшиеся артефакты и останавливает пул потоков."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = (yield).get_result()
+        if report.when != "call" or not report.failed:
+            return
+        driver = item.funcargs.get("chromedriver")
+        if driver is None:
+            return
+        try:
+            # У HttpBrowser нет отрисованной страницы - только ее исходный код
+            if not isinstance(driver, HttpBrowser):
+                self.screenshot(driver, "failure_screenshot")
+            self.page_source(driver, "failure_page_source")
+        except Exception as e:
+            logger.warning("Не удалось снять артефакты падения: %s", e)
+
+    def pytest_sessionfinish(self):
+        self.close()
+
+    def _attach(self, payload, name, attachment_type, transform):
+        digest = hashlib.sha256(payload).hexdigest()
+        file_name = f"{digest}-attachment.{attachment_type.extension}"
+        if not self._register(file_name, name, attachment_type):
+            return
+
+        with self._lock:
+            self.captured += 1
+            if digest in self._digests:
+                return
+            self._digests.add(digest)
+            self._futures.append(
+                self._executor.submit(self._write, file_name, payload, transform)
+            )
+
+    def _register(self, file_name, name, attachment_type):
+        # Вложение добавляется в текущий тест или шаг на потоке теста:
+        # состояние Allure хранится отдельно для каждого потока.
+        listener = self.config.pluginmanager.getplugin("allure_listener")
+        if listener is None:
+            return False
+        executable = listener.allure_logger.get_last_item(ExecutableItem)
+        if executable is None:
+            return False
+        executable.attachments.append(
+            Attachment(source=file_name, name=name, type=attachment_type.mime_type)
+        )
+        return True
+
+    def _write(self, file_name, payload, transform):
+        body = transform(payload) if transform else payload
+        allure_commons.plugin_manager.hook.report_attached_data(
+            body=body, file_name=file_name
+        )
+        with self._lock:
+            self.written += 1
+
+
+def _encode_png(payload):
+    return recompress_png(base64.b64decode(payload))
+
+
+def recompress_png(png, level=ARTIFACT_PNG_COMPRESSION):
+    """
+    Пересжимает данные изображения PNG без потерь.
+
+    Chrome отдает скриншоты с быстрым слабым сжатием; данные всех
+    блоков IDAT распаковываются и сжимаются заново одним блоком.
+
+    Args:
+        png: Содержимое файла PNG
+        level: Уровень сжатия zlib (0-9)
+
+    Returns:
+        bytes: Пересжатый PNG или исходные данные, если они не PNG
+        или пересжатие не уменьшило размер.
+    """
+    if not png.startswith(PNG_SIGNATURE):
+        return png
+    chunks, image = [], []
+    position = len(PNG_SIGNATURE)
+    while position + 8 <= len(png):
+        length, kind = struct.unpack(">I4s", png[position:position + 8])
+        data = png[position + 8:position + 8 + length]
+        position += 12 + length
+        if kind == b"IDAT":
+            if not image:
+                chunks.append(None)
+            image.append(data)
+        else:
+            chunks.append((kind, data))
+    try:
+        packed = zlib.compress(zlib.decompress(b"".join(image)), level)
+    except zlib.error:
+        return png
+
+    result = PNG_SIGNATURE + b"".join(
+        _png_chunk(*(chunk or (b"IDAT", packed))) for chunk in chunks
+    )
+    return result if len(result) < len(png) else png
+
+
+def _png_chunk(kind, data):
+    return (
+        struct.pack(">I", len(data)) + kind + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+    )
+
+
+def install(config, policy, sample_rate=ARTIFACT_SAMPLE_RATE):
+    """
+    Регистрирует ArtifactCapture, если включена запись результатов Allure.
+
+    Args:
+        config: Конфигурация pytest
+        policy: Политика съемки артефактов
+        sample_rate: Доля тестов для политики sampled
+
+    Returns:
+        ArtifactCapture | None: Зарегистрированный плагин или None,
+        если Allure не пишет результаты (запуск без --alluredir).
+    """
+    if not getattr(config.option, "allure_report_dir", None):
+        return None
+
+    capture = ArtifactCapture(config, policy, sample_rate)
+    config.pluginmanager.register(capture, "artifact_capture")
+    return capture
@@ -0,0 +1,374 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+
+from conf.config import (
+    ASYNC_COMMAND_TIMEOUT,
+    ASYNC_SCRIPT_TIMEOUT,
+    SELENIUM_REMOTE_URL,
+)
+from utils.driver_factory import build_chrome_options, find_chromedriver
+from utils.waits import CSS_LOCATORS
+
+# Ключ ссылки на элемент в протоколе W3C WebDriver
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+_ERRORS = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "timeout": TimeoutException,
+    "script timeout": TimeoutException,
+    "javascript error": JavascriptException,
+    "invalid session id": InvalidSessionIdException,
+}
+
+
+class AsyncHttpClient:
+    """
+    Асинхронный HTTP/1.1-клиент для команд WebDriver с пулом соединений keep-alive.
+
+    Один клиент обслуживает все браузеры цикла событий: простаивающие
+    соединения хранятся по адресу сервера и переиспользуются следующими
+    командами, поэтому команда обычно не открывает новое TCP-соединение.
+    К одному серверу (хабу Grid) может быть открыто несколько соединений
+    для одновременных команд разных сессий.
+
+    Attributes:
+        timeout: Таймаут одной команды в секундах
+        requests: Сколько команд выполнено
+        connections: Сколько соединений было открыто
+    """
+
+    def __init__(self, timeout=ASYNC_COMMAND_TIMEOUT):
+        self.timeout = timeout
+        self.requests = 0
+        self.connections = 0
+        self._idle = {}
+
+    async def request(self, method, url, payload=None):
+        """
+        Выполняет команду WebDriver.
+
+        Args:
+            method: HTTP-метод
+            url: Адрес команды
+            payload: Тело команды (сериализуется в JSON)
+
+        Returns:
+            Значение value из ответа.
+
+        Raises:
+            WebDriverException: Ошибка WebDriver (подкласс по коду W3C)
+                                или сбой соединения
+        """
+        parts = urlsplit(url)
+        key = (parts.hostname, parts.port or 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+
+        # Сервер мог закрыть простаивающее соединение - повторяем на новом
+        for attempt in range(2):
+            try:
+                reused, (reader, writer) = await self._connection(key)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise WebDriverException(f"{method} {url}: {e!r}") from e
+            try:
+                status, data, keep_alive = await asyncio.wait_for(
+                    self._exchange(reader, writer, head + body), self.timeout
+                )
+            except asyncio.TimeoutError as e:
+                writer.close()
+                raise TimeoutException(
+                    f"{method} {url}: нет ответа за {self.timeout} с"
+                ) from e
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                writer.close()
+                if attempt or not reused:
+                    raise WebDriverException(f"{method} {url}: {e}") from e
+                continue
+            break
+        if keep_alive:
+            self._idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+        self.requests += 1
+
+        value = json.loads(data).get("value") if data else None
+        if status >= 400 or (isinstance(value, dict) and "error" in value):
+            error = value.get("error", "") if isinstance(value, dict) else ""
+            message = value.get("message", "") if isinstance(value, dict) else data
+            raise _ERRORS.get(error, WebDriverException)(f"{error}: {message}")
+        return value
+
+    async def close(self):
+        """Закрывает все простаивающие соединения."""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+    async def _connection(self, key):
+        idle = self._idle.get(key)
+        if idle:
+            return True, idle.pop()
+        connection = await asyncio.wait_for(
+            asyncio.open_connection(*key), self.timeout
+        )
+        self.connections += 1
+        return False, connection
+
+    @staticmethod
+    async def _exchange(reader, writer, request):
+        writer.write(request)
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("сервер закрыл соединение")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        keep_alive = headers.get("connection") != "close"
+        if headers.get("transfer-encoding") == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if not size:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return status, data, keep_alive
+
+
+class AsyncElement:
+    """
+    Ссылка на элемент страницы для AsyncWebDriver.
+
+    Attributes:
+        driver: AsyncWebDriver, которому принадлежит элемент
+        id: Идентификатор элемента в сессии WebDriver
+    """
+
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    async def click(self):
+        await self._execute("POST", "/click", {})
+
+    async def send_keys(self, *values):
+        await self._execute("POST", "/value", {"text": "".join(values)})
+
+    async def text(self):
+        return await self._execute("GET", "/text")
+
+    async def is_displayed(self):
+        return await self._execute("GET", "/displayed")
+
+    def _execute(self, method, command, payload=None):
+        return self.driver.execute(method, f"/element/{self.id}{command}", payload)
+
+
+class AsyncWebDriver:
+    """
+    Сессия WebDriver, управляемая из цикла событий asyncio.
+
+    Команды W3C WebDriver отправляются через общий AsyncHttpClient,
+    поэтому один поток может одновременно вести много браузеров:
+    пока одна сессия ждет ответа chromedriver, выполняются команды других.
+    Свойства синхронного WebDriver (title, current_url) здесь - корутины.
+
+    Attributes:
+        executor: Адрес chromedriver или узла Selenium
+        session_id: Идентификатор сессии
+        http: AsyncHttpClient
+        service: Локальный процесс chromedriver (None для удаленного узла)
+    """
+
+    def __init__(self, executor, session_id, http, service=None):
+        self.executor = executor
+        self.session_id = session_id
+        self.http = http
+        self.service = service
+
+    @classmethod
+    async def start(cls, executor, options, http, service=None):
+        """
+        Создает новую сессию WebDriver.
+
+        Args:
+            executor: Адрес chromedriver или узла Selenium
+            options: Опции Chrome
+            http: AsyncHttpClient
+            service: Процесс chromedriver, который закрывается вместе с сессией
+
+        Returns:
+            AsyncWebDriver: Драйвер новой сессии.
+        """
+        executor = executor.rstrip("/")
+        value = await http.request("POST", f"{executor}/session", {
+            "capabilities": {
+                "firstMatch": [{}],
+                "alwaysMatch": options.to_capabilities(),
+            },
+        })
+        return cls(executor, value["sessionId"], http, service)
+
+    async def execute(self, method, command, payload=None):
+        """
+        Args:
+            method: HTTP-метод
+            command: Путь команды относительно сессии
+            payload: Тело команды
+
+        Returns:
+            Значение ответа; ссылки на элементы заменены на AsyncElement.
+        """
+        value = await self.http.request(
+            method, f"{self.executor}/session/{self.session_id}{command}",
+            payload if payload is None else _wrap(payload),
+        )
+        return self._unwrap(value)
+
+    async def get(self, url):
+        await self.execute("POST", "/url", {"url": url})
+
+    async def title(self):
+        return await self.execute("GET", "/title")
+
+    async def current_url(self):
+        return await self.execute("GET", "/url")
+
+    async def find_element(self, by, value):
+        """
+        Raises:
+            NoSuchElementException: Если элемента нет на странице
+        """
+        # W3C WebDriver ищет элементы только по CSS, XPath, тегу и тексту ссылки
+        if by in CSS_LOCATORS:
+            by, value = By.CSS_SELECTOR, CSS_LOCATORS[by](value)
+        return await self.execute("POST", "/element", {"using": by, "value": value})
+
+    async def execute_script(self, script, *args):
+        return await self.execute(
+            "POST", "/execute/sync", {"script": script, "args": list(args)}
+        )
+
+    async def execute_async_script(self, script, *args):
+        return await self.execute(
+            "POST", "/execute/async", {"script": script, "args": list(args)}
+        )
+
+    async def set_script_timeout(self, seconds):
+        await self.execute("POST", "/timeouts", {"script": int(seconds * 1000)})
+
+    async def delete_all_cookies(self):
+        await self.execute("DELETE", "/cookie")
+
+    async def window_handles(self):
+        return await self.execute("GET", "/window/handles")
+
+    async def switch_to_window(self, handle):
+        await self.execute("POST", "/window", {"handle": handle})
+
+    async def close(self):
+        """Закрывает текущую вкладку."""
+        await self.execute("DELETE", "/window")
+
+    async def set_window_size(self, width, height):
+        await self.execute("POST", "/window/rect", {"width": width, "height": height})
+
+    async def quit(self):
+        """Закрывает сессию и локальный процесс chromedriver."""
+        try:
+            await self.http.request(
+                "DELETE", f"{self.executor}/session/{self.session_id}"
+            )
+        finally:
+            if self.service is not None:
+                await asyncio.to_thread(self.service.stop)
+
+    def _unwrap(self, value):
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+
+def _wrap(value):
+    if isinstance(value, AsyncElement):
+        return {ELEMENT_KEY: value.id}
+    if isinstance(value, (list, tuple)):
+        return [_wrap(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _wrap(item) for key, item in value.items()}
+    return value
+
+
+async def create_async_driver(http, remote_url=SELENIUM_REMOTE_URL):
+    """
+    Запускает Chrome локально или на узле Selenium Grid для AsyncWebDriver.
+
+    Процесс chromedriver запускается в отдельном потоке, чтобы не
+    блокировать цикл событий; остальные команды асинхронные.
+
+    Args:
+        http: AsyncHttpClient, общий для драйверов цикла событий
+        remote_url: Адрес узла или хаба Selenium. Пустая строка - локальный Chrome.
+
+    Returns:
+        AsyncWebDriver: Готовый к работе драйвер, уже выполнивший первую навигацию.
+    """
+    if remote_url:
+        driver = await AsyncWebDriver.start(
+            remote_url, build_chrome_options(remote=True), http
+        )
+    else:
+        service = Service(executable_path=find_chromedriver())
+        await asyncio.to_thread(service.start)
+        try:
+            driver = await AsyncWebDriver.start(
+                service.service_url, build_chrome_options(), http, service
+            )
+        except Exception:
+            await asyncio.to_thread(service.stop)
+            raise
+
+    await driver.set_script_timeout(ASYNC_SCRIPT_TIMEOUT)
+    await driver.get("about:blank")
+    return driver
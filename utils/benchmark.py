@@ -0,0 +1,331 @@
+"""
+Замер скорости входа для каждого типа пользователя и проверка регрессий.
+
+Пример:
+    python -m utils.benchmark -k 10
+    python -m utils.benchmark -k 10 --threshold 0.3
+    python -m utils.benchmark -k 20 --update-baseline
+
+Каждый сценарий входа выполняется K раз в одном браузере (со сбросом
+состояния между повторами). Для каждого повтора собираются Navigation
+Timing, Resource Timing и paint-метрики браузера, а также время каждого
+шага LoginPage. По повторам считаются p50/p95/p99; результат сравнивается
+с базовой линией из JSON-файла, и запуск завершается с ошибкой, если
+p95 какой-либо метрики вырос больше допустимого.
+"""
+import argparse
+import contextlib
+import json
+import math
+import sys
+import time
+from collections import namedtuple
+
+from conf.config import (
+    BENCHMARK_BASELINE_FILE,
+    BENCHMARK_MIN_DELTA,
+    BENCHMARK_MIN_ROUND_TRIPS_DELTA,
+    BENCHMARK_RUNS,
+    BENCHMARK_THRESHOLD,
+    MAIN_URL,
+    STAND_IN,
+    TIME_TO_WAIT,
+)
+from pages.login_page import LoginPage
+from utils import stand_in
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+from utils.round_trips import count_round_trips
+
+PERCENTILES = (50, 95, 99)
+
+# Метрики-счетчики и их минимальный абсолютный рост для регрессии.
+# Остальные метрики измеряются в секундах и сравниваются с BENCHMARK_MIN_DELTA.
+COUNT_METRICS = {"round_trips": BENCHMARK_MIN_ROUND_TRIPS_DELTA}
+
+Scenario = namedtuple("Scenario", "name username password succeeds")
+Scenario.__doc__ = """
+Сценарий входа для замера.
+
+Attributes:
+    name: Имя сценария в отчете и базовой линии
+    username: Имя пользователя (пустая строка - поле не заполняется)
+    password: Пароль
+    succeeds: Ожидается ли переход на страницу товаров
+"""
+
+SCENARIOS = (
+    Scenario("standard_user", "standard_user", "secret_sauce", True),
+    Scenario("wrong_password", "standard_user", "wrong_password_123", False),
+    Scenario("locked_out_user", "locked_out_user", "secret_sauce", False),
+    Scenario("empty_login", "", "secret_sauce", False),
+    Scenario("performance_glitch_user", "performance_glitch_user", "secret_sauce", True),
+)
+
+# Метрики текущего документа в миллисекундах от начала навигации.
+_PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = {};
+for (const entry of performance.getEntriesByType('paint')) {
+    paint[entry.name] = entry.startTime;
+}
+const resources = performance.getEntriesByType('resource');
+return {
+    ttfb: nav ? nav.responseStart - nav.requestStart : null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav ? nav.loadEventEnd : null,
+    first_paint: paint['first-paint'] ?? null,
+    first_contentful_paint: paint['first-contentful-paint'] ?? null,
+    resources_done: resources.reduce((end, r) => Math.max(end, r.responseEnd), 0),
+};
+"""
+
+
+def percentile(values, p):
+    """
+    Вычисляет перцентиль с линейной интерполяцией.
+
+    Args:
+        values: Непустой список значений
+        p: Перцентиль от 0 до 100
+
+    Returns:
+        float: Значение перцентиля.
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples):
+    """
+    Сводит повторы сценария к перцентилям.
+
+    Args:
+        samples: Список словарей {метрика: значение} по одному на повтор
+
+    Returns:
+        dict: {метрика: {"p50": .., "p95": .., "p99": ..}}. Метрики,
+        которые браузер не сообщил ни в одном повторе, пропускаются.
+    """
+    summary = {}
+    for metric in sorted({name for sample in samples for name in sample}):
+        values = [s[metric] for s in samples if s.get(metric) is not None]
+        if values:
+            summary[metric] = {
+                f"p{p}": round(percentile(values, p), 4) for p in PERCENTILES
+            }
+    return summary
+
+
+def find_regressions(
+    results, baseline, threshold, min_delta=BENCHMARK_MIN_DELTA, count_metrics=COUNT_METRICS
+):
+    """
+    Сравнивает p95 метрик с базовой линией.
+
+    Регрессией считается рост p95 больше чем на threshold (доля)
+    и одновременно больше минимального абсолютного роста метрики - второе
+    условие отсекает шум на метриках в единицы миллисекунд или обращений.
+
+    Args:
+        results: {сценарий: {метрика: перцентили}} текущего запуска
+        baseline: То же для базовой линии
+        threshold: Допустимый относительный рост
+        min_delta: Минимальный абсолютный рост метрик времени в секундах
+        count_metrics: {метрика: минимальный абсолютный рост} для метрик-счетчиков
+
+    Returns:
+        list: Строки с описанием регрессий.
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric, current in metrics.items():
+            stored = baseline.get(scenario, {}).get(metric)
+            if not stored:
+                continue
+            before, after = stored["p95"], current["p95"]
+            if after <= before * (1 + threshold):
+                continue
+            if metric in count_metrics:
+                if after - before > count_metrics[metric]:
+                    regressions.append(f"{scenario}.{metric}: p95 {before:g} -> {after:g}")
+            elif after - before > min_delta:
+                regressions.append(
+                    f"{scenario}.{metric}: p95 {before:.3f} с -> {after:.3f} с"
+                )
+    return regressions
+
+
+def load_baseline(path=BENCHMARK_BASELINE_FILE):
+    """
+    Загружает базовую линию предыдущих замеров.
+
+    Args:
+        path: Путь к JSON-файлу вида {сценарий: {метрика: перцентили}}
+
+    Returns:
+        dict: Базовая линия или пустой словарь, если файла нет.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(results, path=BENCHMARK_BASELINE_FILE):
+    """
+    Записывает результаты замеров как базовую линию.
+
+    Args:
+        results: {сценарий: {метрика: перцентили}}
+        path: Путь к JSON-файлу базовой линии
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+@contextlib.contextmanager
+def _timed(sample, step):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        sample[step] = time.perf_counter() - started
+
+
+def run_scenario(driver, scenario, base_url=MAIN_URL, timeout=TIME_TO_WAIT):
+    """
+    Выполняет один повтор сценария входа.
+
+    Args:
+        driver: Экземпляр WebDriver в чистом состоянии
+        scenario: Сценарий входа
+        base_url: Адрес страницы логина
+        timeout: Таймаут ожидания результата входа в секундах
+
+    Returns:
+        dict: {метрика: значение} - время шагов LoginPage (step_*),
+        общее время, метрики браузера (page_*) для итоговой страницы
+        в секундах и количество обращений к WebDriver (round_trips).
+
+    Raises:
+        AssertionError: Если результат входа не совпал с ожидаемым
+    """
+    sample = {}
+    started = time.perf_counter()
+    with count_round_trips(driver) as round_trips:
+        with _timed(sample, "step_open"):
+            driver.get(base_url)
+            login_page = LoginPage(driver)
+        with _timed(sample, "step_fill"):
+            if scenario.username:
+                login_page.send_text(scenario.username, scenario.password)
+            else:
+                login_page.send_text_only_password(scenario.password)
+        with _timed(sample, "step_submit"):
+            login_page.click_login_button()
+        with _timed(sample, "step_result"):
+            if scenario.succeeds:
+                ok = login_page.is_products_displayed(timeout)
+            else:
+                ok = login_page.is_error_displayed(timeout)
+    sample["total"] = time.perf_counter() - started
+    sample["round_trips"] = round_trips.total
+    assert ok, f"Сценарий {scenario.name} завершился не так, как ожидалось"
+
+    for metric, value in driver.execute_script(_PAGE_METRICS_SCRIPT).items():
+        sample[f"page_{metric}"] = value / 1000 if value is not None else None
+    return sample
+
+
+def run(scenarios, runs, factory=create_driver):
+    """
+    Выполняет каждый сценарий runs раз в одном браузере.
+
+    Args:
+        scenarios: Сценарии входа
+        runs: Количество повторов каждого сценария
+        factory: Функция, создающая драйвер
+
+    Returns:
+        dict: {сценарий: {метрика: перцентили}}.
+    """
+    pool = DriverPool(factory, max_size=1)
+    results = {}
+    try:
+        for scenario in scenarios:
+            samples = []
+            for _ in range(runs):
+                driver = pool.acquire()
+                try:
+                    samples.append(run_scenario(driver, scenario))
+                finally:
+                    pool.release(driver)
+            results[scenario.name] = summarize(samples)
+            total = results[scenario.name]["total"]
+            round_trips = results[scenario.name]["round_trips"]
+            print(
+                f"{scenario.name}: p50 {total['p50']:.3f} с, "
+                f"p95 {total['p95']:.3f} с, p99 {total['p99']:.3f} с, "
+                f"обращений к WebDriver: {round_trips['p50']:.0f}"
+            )
+    finally:
+        pool.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-k", "--runs", type=int, default=BENCHMARK_RUNS,
+        help="Количество повторов каждого сценария",
+    )
+    parser.add_argument(
+        "--baseline", default=BENCHMARK_BASELINE_FILE,
+        help="JSON-файл базовой линии",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=BENCHMARK_THRESHOLD,
+        help="Допустимый относительный рост p95 (0.2 - на 20%%)",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="Записать результаты как новую базовую линию",
+    )
+    parser.add_argument(
+        "-s", "--scenario", action="append", choices=[s.name for s in SCENARIOS],
+        help="Запустить только указанные сценарии",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        s for s in SCENARIOS if not args.scenario or s.name in args.scenario
+    ]
+    server = stand_in.start_or_reuse() if STAND_IN else None
+    try:
+        results = run(scenarios, max(1, args.runs))
+    finally:
+        if server:
+            server.stop()
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline or not baseline:
+        save_baseline({**baseline, **results}, args.baseline)
+        print(f"Базовая линия сохранена в {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print("Регрессии относительно базовой линии:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("Регрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
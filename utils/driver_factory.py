@@ -0,0 +1,148 @@
+import functools
+import shutil
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from conf.config import (
+    ASYNC_SCRIPT_TIMEOUT,
+    CHROME_PROFILE_SNAPSHOT,
+    SELENIUM_REMOTE_URL,
+    WINDOW_SIZE,
+)
+from utils.startup import StartupTiming, startup_profiler
+from utils.workers import debug_ports, new_profile_dir
+
+
+def build_chrome_options(profile_dir=None, remote=False):
+    """
+    Собирает набор опций запуска Chrome для тестов.
+
+    Каждый локальный экземпляр получает собственный каталог профиля и
+    отладочный порт из диапазона текущего воркера, чтобы параллельные браузеры
+    не конфликтовали. Для удаленного узла ими управляет сам узел.
+
+    Args:
+        profile_dir: Каталог профиля (None - новый пустой каталог)
+        remote: Опции для браузера на удаленном узле Selenium
+
+    Returns:
+        Options: Опции Chrome для headless-запуска в контейнере.
+    """
+    chrome_options = Options()
+
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-software-rasterizer')
+    chrome_options.add_argument('--disable-extensions')
+    # Повторный --disable-features заменяет предыдущий, поэтому одним списком
+    chrome_options.add_argument(
+        '--disable-features=VizDisplayCompositor,IsolateOrigins,site-per-process'
+    )
+    if not remote:
+        chrome_options.add_argument(f'--remote-debugging-port={debug_ports.next_port()}')
+        chrome_options.add_argument(f'--user-data-dir={profile_dir or new_profile_dir()}')
+    chrome_options.add_argument(f'--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}')
+
+    chrome_options.add_argument('--ignore-certificate-errors-spki-list')
+    chrome_options.add_argument('--ignore-ssl-errors')
+
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-default-apps')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--metrics-recording-only')
+    chrome_options.add_argument('--disable-client-side-phishing-detection')
+    chrome_options.add_argument('--disable-popup-blocking')
+    chrome_options.add_argument('--disable-hang-monitor')
+    chrome_options.add_argument('--disable-prompt-on-repost')
+    chrome_options.add_argument('--disable-web-resources')
+
+    chrome_options.add_experimental_option(
+        'excludeSwitches', ['enable-logging', 'enable-automation']
+    )
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    chrome_options.add_argument(
+        'user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36')
+
+    return chrome_options
+
+
+@functools.lru_cache(maxsize=None)
+def find_chromedriver():
+    """
+    Ищет chromedriver в PATH один раз за процесс.
+
+    Если путь известен, Selenium не запускает Selenium Manager
+    при каждом создании драйвера.
+
+    Returns:
+        str | None: Путь к chromedriver или None, если его нет в PATH.
+    """
+    return shutil.which("chromedriver")
+
+
+class _TimedService(Service):
+    """Service, замеряющий время запуска процесса chromedriver."""
+
+    spawn_time = 0.0
+
+    def start(self):
+        started = time.perf_counter()
+        super().start()
+        self.spawn_time = time.perf_counter() - started
+
+
+def create_driver(snapshot=CHROME_PROFILE_SNAPSHOT, remote_url=SELENIUM_REMOTE_URL):
+    """
+    Запускает новый экземпляр Chrome локально или на узле Selenium Grid.
+
+    Implicit wait не используется: все ожидания выполняются через
+    utils.waits.Waiter, которому нужен увеличенный таймаут асинхронных скриптов.
+    Время каждой фазы запуска записывается в utils.startup.startup_profiler.
+
+    Args:
+        snapshot: Каталог снимка профиля (utils/profile_snapshot.py), копия которого
+                  используется вместо пустого профиля. Пустая строка - без снимка.
+        remote_url: Адрес узла или хаба Selenium (webdriver.Remote).
+                    Пустая строка - локальный Chrome. Снимок профиля
+                    для удаленного узла не используется.
+
+    Returns:
+        WebDriver: Готовый к работе драйвер, уже выполнивший первую навигацию.
+    """
+    started = time.perf_counter()
+    if remote_url:
+        snapshot = ""
+        spawn_time = 0.0
+        options = build_chrome_options(remote=True)
+        prepared = time.perf_counter()
+        driver = webdriver.Remote(command_executor=remote_url, options=options)
+    else:
+        service = _TimedService(executable_path=find_chromedriver())
+        profile_dir = new_profile_dir(snapshot) if snapshot else None
+        options = build_chrome_options(profile_dir)
+        prepared = time.perf_counter()
+        driver = webdriver.Chrome(options=options, service=service)
+        spawn_time = service.spawn_time
+    launched = time.perf_counter()
+
+    driver.set_script_timeout(ASYNC_SCRIPT_TIMEOUT)
+    # Первая навигация запускает процесс рендерера - платим за нее здесь,
+    # чтобы она не попадала во время первого теста.
+    driver.get("about:blank")
+    finished = time.perf_counter()
+
+    startup_profiler.record(StartupTiming(
+        prepare=prepared - started,
+        spawn=spawn_time,
+        launch=launched - prepared - spawn_time,
+        first_navigation=finished - launched,
+        total=finished - started,
+        snapshot=bool(snapshot),
+    ))
+    return driver
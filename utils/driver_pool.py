@@ -0,0 +1,370 @@
+import asyncio
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import WINDOW_SIZE
+
+
+class _PoolAccounting:
+    """
+    Учет драйверов, общий для DriverPool и AsyncDriverPool.
+
+    Методы с подчеркиванием не блокируют: пул вызывает их под своим
+    условием (threading.Condition или asyncio.Condition), поэтому оба пула
+    одинаково считают живые драйверы и ведут счетчики.
+
+    Attributes:
+        factory: Функция без аргументов, создающая новый драйвер
+        max_size: Максимальное число одновременно живых драйверов
+                  (None - без ограничения)
+        created: Сколько драйверов было создано
+        reused: Сколько раз тесту был выдан уже существующий драйвер
+        recycled: Сколько драйверов было закрыто из-за неисправности
+    """
+
+    def __init__(self, factory, max_size=None):
+        self.factory = factory
+        self.max_size = max_size
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+        self._idle = []
+        self._alive = 0
+        self._closed = False
+
+    def _can_take(self):
+        return (
+            bool(self._idle)
+            or self.max_size is None
+            or self._alive < self.max_size
+            or self._closed
+        )
+
+    def _take(self):
+        """
+        Returns:
+            Простаивающий драйвер или None, если нужно создать новый
+            (место под него уже учтено).
+
+        Raises:
+            RuntimeError: Если пул закрыт
+        """
+        if self._closed:
+            raise RuntimeError("Пул драйверов уже закрыт")
+        if self._idle:
+            return self._idle.pop()
+        self._alive += 1
+        return None
+
+    def _put(self, driver):
+        """
+        Returns:
+            bool: True если драйвер оставлен в пуле, False если пул закрыт
+            и драйвер нужно закрыть.
+        """
+        if self._closed:
+            self._alive -= 1
+            return False
+        self._idle.append(driver)
+        return True
+
+    def _drain(self):
+        """
+        Returns:
+            list: Простаивающие драйверы закрываемого пула.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        self._alive -= len(idle)
+        return idle
+
+
+class DriverPool(_PoolAccounting):
+    """
+    Пул «тёплых» экземпляров WebDriver.
+
+    Вместо запуска нового браузера на каждый тест драйверы создаются один раз
+    за сессию (в каждом процессе-воркере своя сессия и свой пул), выдаются
+    тестам и сбрасываются в исходное состояние после каждого теста.
+    Драйвер, не прошедший проверку работоспособности, пересоздаётся.
+
+    Attributes:
+        factory: Функция без аргументов, создающая новый драйвер
+        max_size: Максимальное число одновременно живых драйверов
+                  (None - без ограничения)
+        created: Сколько драйверов было создано
+        reused: Сколько раз тесту был выдан уже существующий драйвер
+        recycled: Сколько драйверов было закрыто из-за неисправности
+    """
+
+    def __init__(self, factory, max_size=None):
+        super().__init__(factory, max_size)
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Выдаёт исправный драйвер из пула или создаёт новый.
+
+        Если пул ограничен и все драйверы заняты, ожидает освобождения.
+
+        Returns:
+            WebDriver: Драйвер в чистом состоянии (about:blank)
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._can_take)
+                driver = self._take()
+
+            if driver is None:
+                try:
+                    driver = self.factory()
+                except Exception:
+                    self._forget()
+                    raise
+                with self._condition:
+                    self.created += 1
+                return driver
+
+            if self.is_healthy(driver):
+                with self._condition:
+                    self.reused += 1
+                return driver
+
+            self._recycle(driver)
+
+    def release(self, driver):
+        """
+        Возвращает драйвер в пул, предварительно сбросив его состояние.
+
+        Args:
+            driver: Драйвер, полученный через acquire()
+        """
+        try:
+            self.reset(driver)
+        except Exception:
+            # Упавший chromedriver дает не только WebDriverException,
+            # но и ошибки соединения urllib3 - драйвер в любом случае заменяется
+            self._recycle(driver)
+            return
+
+        with self._condition:
+            kept = self._put(driver)
+            self._condition.notify()
+        if not kept:
+            self._quit(driver)
+
+    def close(self):
+        """Закрывает все простаивающие драйверы пула."""
+        with self._condition:
+            idle = self._drain()
+            self._condition.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+    @staticmethod
+    def reset(driver):
+        """
+        Сбрасывает состояние браузера между тестами.
+
+        Закрывает лишние вкладки, очищает localStorage/sessionStorage
+        текущего origin и все cookies, загружает about:blank
+        и восстанавливает размер окна.
+
+        Args:
+            driver: Драйвер для сброса
+
+        Raises:
+            WebDriverException: Если браузер не отвечает
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except WebDriverException:
+            # about:blank и data: URL не имеют доступа к storage
+            pass
+
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+        driver.set_window_size(*WINDOW_SIZE)
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Проверяет, что браузер жив и отвечает на команды.
+
+        Args:
+            driver: Проверяемый драйвер
+
+        Returns:
+            bool: True если драйвер исправен, False в противном случае.
+        """
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _recycle(self, driver):
+        self._quit(driver)
+        with self._condition:
+            self.recycled += 1
+            self._alive -= 1
+            self._condition.notify()
+
+    def _forget(self):
+        with self._condition:
+            self._alive -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+class AsyncDriverPool(_PoolAccounting):
+    """
+    Пул браузеров utils.async_webdriver.AsyncWebDriver для одного цикла событий.
+
+    Учет драйверов и сброс состояния - те же, что у DriverPool, но создание,
+    сброс и закрытие драйверов - корутины, а ожидание свободного драйвера
+    не блокирует поток.
+
+    Attributes:
+        factory: Корутина-функция без аргументов, создающая новый драйвер
+        max_size: Максимальное число одновременно живых драйверов
+                  (None - без ограничения)
+        created: Сколько драйверов было создано
+        reused: Сколько раз был выдан уже существующий драйвер
+        recycled: Сколько драйверов было закрыто из-за неисправности
+    """
+
+    def __init__(self, factory, max_size=None):
+        super().__init__(factory, max_size)
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        """
+        Returns:
+            AsyncWebDriver: Драйвер в чистом состоянии (about:blank)
+        """
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(self._can_take)
+                driver = self._take()
+
+            if driver is None:
+                try:
+                    driver = await self.factory()
+                except Exception:
+                    await self._forget()
+                    raise
+                async with self._condition:
+                    self.created += 1
+                return driver
+
+            if await self.is_healthy(driver):
+                async with self._condition:
+                    self.reused += 1
+                return driver
+
+            await self._recycle(driver)
+
+    async def release(self, driver):
+        """
+        Возвращает драйвер в пул, предварительно сбросив его состояние.
+
+        Args:
+            driver: Драйвер, полученный через acquire()
+        """
+        try:
+            await self.reset(driver)
+        except Exception:
+            # Как в DriverPool: при любом сбое сброса драйвер заменяется
+            await self._recycle(driver)
+            return
+
+        async with self._condition:
+            kept = self._put(driver)
+            self._condition.notify()
+        if not kept:
+            await self._quit(driver)
+
+    async def close(self):
+        """Закрывает все простаивающие драйверы пула одновременно."""
+        async with self._condition:
+            idle = self._drain()
+            self._condition.notify_all()
+        await asyncio.gather(*(self._quit(driver) for driver in idle))
+
+    @staticmethod
+    async def reset(driver):
+        """
+        Сбрасывает состояние браузера так же, как DriverPool.reset.
+
+        Закрывает лишние вкладки, очищает localStorage/sessionStorage
+        текущего origin и все cookies, загружает about:blank
+        и восстанавливает размер окна.
+
+        Raises:
+            WebDriverException: Если браузер не отвечает
+        """
+        handles = await driver.window_handles()
+        for handle in handles[1:]:
+            await driver.switch_to_window(handle)
+            await driver.close()
+        await driver.switch_to_window(handles[0])
+
+        try:
+            await driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except WebDriverException:
+            # about:blank и data: URL не имеют доступа к storage
+            pass
+        await driver.delete_all_cookies()
+        await driver.get("about:blank")
+        await driver.set_window_size(*WINDOW_SIZE)
+
+    @staticmethod
+    async def is_healthy(driver):
+        """
+        Returns:
+            bool: True если браузер жив и отвечает на команды.
+        """
+        try:
+            return await driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    async def _recycle(self, driver):
+        await self._quit(driver)
+        async with self._condition:
+            self.recycled += 1
+            self._alive -= 1
+            self._condition.notify()
+
+    async def _forget(self):
+        async with self._condition:
+            self._alive -= 1
+            self._condition.notify()
+
+    @staticmethod
+    async def _quit(driver):
+        try:
+            await driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,210 @@
+"""
+Распределенный запуск тестов на нескольких узлах Selenium с локальным координатором.
+
+Пример:
+    python -m utils.grid --node http://agent1:4444 --node http://agent2:4444 tests/
+    python -m utils.grid --node http://agent1:4444 --slots 4 tests/ -m "not slow"
+    python -m utils.grid --node http://agent1:4444=4 --node http://agent2:4444=1 tests/
+    STAND_IN=true python -m utils.grid --local-nodes 2 --slots 2 tests/
+
+Координатор собирает список тестов, проверяет готовность узлов (/status),
+распределяет тесты по слотам всех узлов по длительности прошлых прогонов
+(как utils.parallel) и запускает на своей машине по процессу pytest на слот.
+Браузеры процесса создаются на его узле через webdriver.Remote
+(SELENIUM_REMOTE_URL). Результаты Allure всех слотов объединяются в общий
+каталог, длительности - в .test_durations.json. Узел 'local' - локальный
+Chrome без Grid; --local-nodes N запускает N локальных chromedriver как
+удаленные узлы, чтобы проверить распределение на одной машине.
+"""
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+
+from selenium.webdriver.chrome.service import Service
+
+from conf.config import SELENIUM_NODES, STAND_IN, STAND_IN_HOST
+from utils import stand_in
+from utils.driver_factory import find_chromedriver
+from utils.parallel import (
+    collect,
+    load_durations,
+    merge_allure_shards,
+    run_shards,
+    save_durations,
+    schedule,
+)
+
+LOCAL_NODE = "local"
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+_NODE_SLOTS = re.compile(r"^(?P<node>.+)=(?P<slots>\d+)$")
+
+
+def node_ready(url, timeout=5):
+    """
+    Проверяет готовность узла или хаба Selenium.
+
+    Args:
+        url: Адрес узла (тот же, что для webdriver.Remote)
+        timeout: Таймаут запроса в секундах
+
+    Returns:
+        bool: True если узел отвечает на /status и готов принимать сессии.
+    """
+    if url == LOCAL_NODE:
+        return True
+    try:
+        with urllib.request.urlopen(f"{url.rstrip('/')}/status", timeout=timeout) as response:
+            status = json.load(response)
+    except (OSError, ValueError, urllib.error.URLError):
+        return False
+    return bool(status.get("value", {}).get("ready"))
+
+
+def start_local_nodes(count):
+    """
+    Запускает локальные chromedriver, принимающие сессии как удаленные узлы.
+
+    Args:
+        count: Количество узлов
+
+    Returns:
+        list: Запущенные службы chromedriver (Service) с адресами service_url.
+    """
+    services = []
+    for _ in range(count):
+        service = Service(executable_path=find_chromedriver())
+        service.start()
+        services.append(service)
+    return services
+
+
+def parse_node(spec, slots):
+    """
+    Args:
+        spec: Адрес узла, возможно с числом слотов: 'http://agent1:4444=4'
+        slots: Число слотов, если в spec оно не указано
+
+    Returns:
+        tuple: (адрес узла, число слотов)
+    """
+    match = _NODE_SLOTS.match(spec)
+    if match:
+        return match["node"], int(match["slots"])
+    return spec, slots
+
+
+def assign_slots(nodes, slots):
+    """
+    Args:
+        nodes: Адреса узлов
+        slots: Процессов pytest на узел - одно число для всех узлов
+               или словарь {адрес: число слотов}
+
+    Returns:
+        list: Адрес узла для каждого слота. Слоты узлов чередуются:
+        schedule заполняет первые слоты, и при малом числе тестов
+        заняты все узлы. Повторенный адрес получает вдвое больше слотов.
+    """
+    counts = slots if isinstance(slots, dict) else dict.fromkeys(nodes, slots)
+    rounds = max((counts.get(node, 0) for node in nodes), default=0)
+    return [
+        node for round_index in range(rounds) for node in nodes
+        if counts.get(node, 0) > round_index
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0], allow_abbrev=False
+    )
+    parser.add_argument(
+        "--node", action="append", default=[],
+        help="Адрес узла или хаба Selenium ('local' - локальный Chrome), "
+             "'адрес=N' - N слотов на узле; можно указать несколько раз, "
+             "по умолчанию - SELENIUM_NODES",
+    )
+    parser.add_argument(
+        "--local-nodes", type=int, default=0,
+        help="Запустить N локальных chromedriver и использовать их как узлы",
+    )
+    parser.add_argument(
+        "--slots", type=int, default=1,
+        help="Процессов pytest (одновременных браузеров) на каждый узел, "
+             "для которого число слотов не указано в --node",
+    )
+    args, pytest_args = parser.parse_known_args(argv)
+
+    specs = args.node or [node for node in SELENIUM_NODES.split(",") if node]
+    slots = dict(parse_node(spec, max(1, args.slots)) for spec in specs)
+    nodes = [parse_node(spec, 0)[0] for spec in specs]
+    services = start_local_nodes(args.local_nodes)
+    for service in services:
+        nodes.append(service.service_url)
+        slots[service.service_url] = max(1, args.slots)
+    try:
+        if not nodes:
+            parser.error("Не заданы узлы: --node, --local-nodes или SELENIUM_NODES")
+        return _run(nodes, slots, pytest_args)
+    finally:
+        for service in services:
+            service.stop()
+
+
+def _run(nodes, slots, pytest_args):
+    ready = [node for node in nodes if node_ready(node)]
+    for node in sorted(set(nodes) - set(ready)):
+        print(f"Узел {node} не готов и пропущен")
+    if not ready:
+        print("Нет готовых узлов")
+        return 1
+    remote = [node for node in ready if node != LOCAL_NODE]
+    if STAND_IN and remote and STAND_IN_HOST in LOOPBACK_HOSTS:
+        print(
+            f"Внимание: локальная замена Sauce Demo слушает {STAND_IN_HOST} - "
+            "браузеры на других машинах ее не увидят (задайте STAND_IN_HOST)"
+        )
+
+    nodeids, options, results_dir = collect(pytest_args)
+    if not nodeids:
+        print("Тесты не найдены")
+        return 0
+
+    slot_nodes = assign_slots(ready, slots)
+    shards = schedule(nodeids, load_durations(), len(slot_nodes))
+    per_node = Counter()
+    for index, shard in enumerate(shards):
+        per_node[slot_nodes[index]] += len(shard)
+    print(f"Тестов: {len(nodeids)}, узлов: {len(ready)}, слотов: {len(shards)}")
+    for node in per_node:
+        print(f"  {node}: {per_node[node]} тестов")
+
+    def node_env(index):
+        node = slot_nodes[index]
+        return {"SELENIUM_REMOTE_URL": "" if node == LOCAL_NODE else node}
+
+    started = time.perf_counter()
+    server = stand_in.start_or_reuse() if STAND_IN else None
+    try:
+        with tempfile.TemporaryDirectory(prefix="grid-") as workdir:
+            code, shard_dirs, duration_files = run_shards(
+                shards, options, workdir, env_for_shard=node_env
+            )
+            merge_allure_shards(shard_dirs, results_dir)
+            for path in duration_files:
+                save_durations(load_durations(path))
+    finally:
+        if server:
+            server.stop()
+
+    print(f"Общее время: {time.perf_counter() - started:.1f} с")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
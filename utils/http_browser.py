@@ -0,0 +1,350 @@
+import http.client
+from html.parser import HTMLParser
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import TIME_TO_WAIT
+
+VOID_ELEMENTS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img",
+    "input", "link", "meta", "source", "track", "wbr",
+))
+SUBMIT_TYPES = frozenset(("submit", "image", "button", "reset"))
+REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+MAX_REDIRECTS = 5
+BLANK_URL = "about:blank"
+
+
+class Element:
+    """
+    Узел минимальной модели DOM.
+
+    Attributes:
+        tag: Имя тега в нижнем регистре
+        attrs: Атрибуты элемента
+        children: Дочерние элементы и текстовые узлы (str)
+        parent: Родительский элемент (None у корня документа)
+    """
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+        self.parent = parent
+
+    @property
+    def text(self):
+        """str: Текст элемента и его потомков с нормализованными пробелами."""
+        return " ".join("".join(self._strings()).split())
+
+    def iter(self):
+        """Обходит элемент и всех его потомков в порядке документа."""
+        pending = [self]
+        while pending:
+            element = pending.pop()
+            yield element
+            pending.extend(
+                child for child in reversed(element.children)
+                if isinstance(child, Element)
+            )
+
+    def find_all(self, tag=None, attrs=None, text=None):
+        """
+        Args:
+            tag: Имя тега (None - любой)
+            attrs: Атрибуты, которые должны совпадать
+            text: Текст элемента, который должен совпадать
+
+        Returns:
+            list: Подходящие элементы в порядке документа.
+        """
+        return [
+            element for element in self.iter()
+            if (tag is None or element.tag == tag)
+            and all(element.attrs.get(k) == v for k, v in (attrs or {}).items())
+            and (text is None or element.text == text)
+        ]
+
+    def find(self, tag=None, attrs=None, text=None):
+        """
+        Returns:
+            Element | None: Первый подходящий элемент (аргументы как у find_all).
+        """
+        found = self.find_all(tag, attrs, text)
+        return found[0] if found else None
+
+    def _strings(self):
+        for child in self.children:
+            if isinstance(child, Element):
+                yield from child._strings()
+            else:
+                yield child
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {})
+        self._current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        element = self._append(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._current = element
+
+    def handle_startendtag(self, tag, attrs):
+        self._append(tag, attrs)
+
+    def handle_endtag(self, tag):
+        # Незакрытые вложенные элементы закрываются вместе с родителем
+        element = self._current
+        while element is not self.root:
+            if element.tag == tag:
+                self._current = element.parent
+                return
+            element = element.parent
+
+    def handle_data(self, data):
+        self._current.children.append(data)
+
+    def _append(self, tag, attrs):
+        element = Element(
+            tag, {name: value or "" for name, value in attrs}, self._current
+        )
+        self._current.children.append(element)
+        return element
+
+
+def parse_html(source):
+    """
+    Строит минимальную модель DOM без выполнения скриптов и стилей.
+
+    Args:
+        source: HTML-код страницы
+
+    Returns:
+        Element: Корень документа.
+    """
+    builder = _TreeBuilder()
+    builder.feed(source)
+    builder.close()
+    return builder.root
+
+
+class Form:
+    """
+    HTML-форма страницы с текущими значениями полей.
+
+    Attributes:
+        element: Элемент <form>
+        action: Абсолютный адрес отправки
+        method: GET или POST
+        values: {имя поля: значение} для полей, отправляемых с формой
+    """
+
+    def __init__(self, element, base_url):
+        self.element = element
+        self.action = urljoin(base_url, element.attrs.get("action", ""))
+        self.method = element.attrs.get("method", "get").upper()
+        self.values = {
+            field.attrs["name"]: field.attrs.get("value", "")
+            for field in element.find_all("input")
+            if field.attrs.get("name")
+            and field.attrs.get("type", "text") not in SUBMIT_TYPES
+        }
+
+    def field(self, element_id):
+        """
+        Args:
+            element_id: id поля или кнопки формы
+
+        Returns:
+            Element | None: Элемент формы с этим id.
+        """
+        return self.element.find(attrs={"id": element_id})
+
+    def fill(self, field, value):
+        """
+        Задает значение поля, как при вводе текста пользователем.
+
+        Args:
+            field: Элемент поля (из field())
+            value: Новое значение
+        """
+        self.values[field.attrs["name"]] = value
+
+    def data(self, submitter=None):
+        """
+        Args:
+            submitter: Кнопка, которой отправлена форма
+
+        Returns:
+            list: Пары (имя, значение) для отправки.
+        """
+        data = list(self.values.items())
+        if submitter is not None and submitter.attrs.get("name"):
+            data.append((submitter.attrs["name"], submitter.attrs.get("value", "")))
+        return data
+
+
+class HttpBrowser:
+    """
+    Браузер без рендеринга и JavaScript поверх постоянных HTTP-соединений.
+
+    Загружает страницы, следует перенаправлениям, хранит cookies и
+    отправляет HTML-формы. Свойства current_url, title и page_source
+    совпадают по смыслу со свойствами WebDriver, поэтому тесты могут
+    проверять их одинаково на обоих видах браузера. Подходит только для
+    сайтов, где вход - обычная отправка формы (utils/stand_in.py).
+
+    Attributes:
+        timeout: Таймаут HTTP-запроса в секундах
+        current_url: Адрес текущей страницы
+        page_source: HTML-код текущей страницы
+        document: Модель DOM текущей страницы (Element)
+        cookies: {имя: значение} cookies сессии
+        requests: Сколько HTTP-запросов выполнено
+        bytes_received: Сколько байт тел ответов получено
+    """
+
+    def __init__(self, timeout=TIME_TO_WAIT):
+        self.timeout = timeout
+        self.cookies = {}
+        self.requests = 0
+        self.bytes_received = 0
+        self._connections = {}
+        self._show_blank()
+
+    @property
+    def title(self):
+        """str: Заголовок текущей страницы."""
+        element = self.document.find("title")
+        return element.text if element is not None else ""
+
+    def get(self, url):
+        """
+        Открывает страницу.
+
+        Args:
+            url: Абсолютный адрес или about:blank
+
+        Raises:
+            WebDriverException: Если сервер недоступен
+        """
+        if url == BLANK_URL:
+            self._show_blank()
+            return
+        self._navigate("GET", url)
+
+    def forms(self):
+        """
+        Returns:
+            list: Формы текущей страницы (Form).
+        """
+        return [
+            Form(element, self.current_url)
+            for element in self.document.find_all("form")
+        ]
+
+    def submit(self, form, submitter=None):
+        """
+        Отправляет форму и открывает страницу из ответа.
+
+        Args:
+            form: Форма текущей страницы
+            submitter: Кнопка, которой отправлена форма
+
+        Raises:
+            WebDriverException: Если сервер недоступен
+        """
+        query = urlencode(form.data(submitter))
+        if form.method == "POST":
+            # bytes уходят одним send() с заголовками - без задержки от Nagle
+            self._navigate("POST", form.action, query.encode("utf-8"))
+        else:
+            self._navigate("GET", f"{form.action.split('?', 1)[0]}?{query}")
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def reset(self):
+        """Сбрасывает состояние между тестами: cookies и текущую страницу."""
+        self.delete_all_cookies()
+        self._show_blank()
+
+    def quit(self):
+        """Закрывает все HTTP-соединения."""
+        connections, self._connections = self._connections, {}
+        for connection in connections.values():
+            connection.close()
+
+    def _show_blank(self):
+        self.current_url = BLANK_URL
+        self.page_source = "<html><head></head><body></body></html>"
+        self.document = parse_html(self.page_source)
+
+    def _navigate(self, method, url, body=None):
+        for _ in range(MAX_REDIRECTS + 1):
+            response, payload = self._request(method, url, body)
+            location = response.getheader("Location")
+            if response.status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                if response.status in (301, 302, 303):
+                    method, body = "GET", None
+                continue
+            charset = response.msg.get_content_charset() or "utf-8"
+            self.current_url = url
+            self.page_source = payload.decode(charset, errors="replace")
+            self.document = parse_html(self.page_source)
+            return
+        raise WebDriverException(f"Слишком много перенаправлений: {url}")
+
+    def _request(self, method, url, body):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = {"Accept": "text/html"}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        if body is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        # Сервер мог закрыть простаивающее соединение - повторяем на новом
+        for attempt in range(2):
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                payload = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                self._connections.pop((parts.scheme, parts.netloc)).close()
+                if attempt:
+                    raise WebDriverException(f"{method} {url}: {e}") from e
+        self.requests += 1
+        self.bytes_received += len(payload)
+
+        for header in response.msg.get_all("Set-Cookie") or ():
+            for name, morsel in SimpleCookie(header).items():
+                if morsel.value:
+                    self.cookies[name] = morsel.value
+                else:
+                    self.cookies.pop(name, None)
+        return response, payload
+
+    def _connection(self, scheme, netloc):
+        key = (scheme, netloc)
+        if key not in self._connections:
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                connection = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise WebDriverException(f"Неподдерживаемая схема адреса: {scheme}")
+            self._connections[key] = connection
+        return self._connections[key]
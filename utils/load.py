@@ -0,0 +1,338 @@
+"""
+Нагрузочный режим: одновременные входы разных пользователей через LoginPage.
+
+Пример:
+    python -m utils.load -c 8 -d 60
+    python -m utils.load -c 4 -d 30 --rate 2 --ramp 10
+    python -m utils.load --mix standard_user=5,performance_glitch_user=1 --json load.json
+    python -m utils.load --remote -c 2 -d 20
+
+По умолчанию нагрузка подается на локальную замену Sauce Demo
+(utils/stand_in.py), поэтому режим работает без сети. Каждый из
+concurrency потоков берет браузер из общего ограниченного пула и выполняет
+сценарии входа, выбранные случайно с весами из --mix. С --rate старты
+входов выравниваются по общему расписанию (входов в секунду), с --ramp
+потоки подключаются постепенно. В конце выводятся пропускная способность,
+перцентили и гистограмма времени входа.
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from conf.config import (
+    LOAD_CONCURRENCY,
+    LOAD_DURATION,
+    LOAD_MIX,
+    MAIN_URL,
+    STAND_IN_URL,
+    TIME_TO_WAIT,
+)
+from utils import stand_in
+from utils.benchmark import PERCENTILES, SCENARIOS, percentile, run_scenario
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+
+HISTOGRAM_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, float("inf"))
+HISTOGRAM_WIDTH = 40
+
+LoadResult = namedtuple("LoadResult", "scenario started latency ok error")
+LoadResult.__doc__ = """
+Результат одного входа под нагрузкой.
+
+Attributes:
+    scenario: Имя сценария
+    started: Момент старта относительно начала нагрузки в секундах
+    latency: Длительность входа в секундах
+    ok: Завершился ли вход ожидаемым результатом
+    error: Текст ошибки или пустая строка
+"""
+
+
+def parse_mix(text):
+    """
+    Разбирает смесь сценариев вида 'standard_user=5,locked_out_user=1'.
+
+    Args:
+        text: Строка с весами сценариев
+
+    Returns:
+        dict: {имя сценария: вес}.
+
+    Raises:
+        ValueError: Если сценарий неизвестен или вес не положительный
+    """
+    known = {scenario.name for scenario in SCENARIOS}
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in known:
+            raise ValueError(
+                f"Неизвестный сценарий {name!r}, доступны: {', '.join(sorted(known))}"
+            )
+        mix[name] = float(weight or 1)
+        if mix[name] <= 0:
+            raise ValueError(f"Вес сценария {name!r} должен быть положительным")
+    if not mix:
+        raise ValueError("Смесь сценариев пуста")
+    return mix
+
+
+class LoadRunner:
+    """
+    Подает нагрузку входами из нескольких потоков на ограниченный пул браузеров.
+
+    Attributes:
+        mix: {имя сценария: вес}
+        concurrency: Количество потоков и максимальное число браузеров
+        duration: Длительность нагрузки в секундах
+        rate: Целевое число стартов входа в секунду (None - без ограничения)
+        ramp: Время, за которое подключаются все потоки, в секундах
+        base_url: Адрес страницы логина
+        results: Результаты всех выполненных входов
+        wall_time: Фактическая длительность нагрузки в секундах
+    """
+
+    def __init__(
+        self,
+        mix,
+        concurrency=LOAD_CONCURRENCY,
+        duration=LOAD_DURATION,
+        rate=None,
+        ramp=0.0,
+        base_url=MAIN_URL,
+        factory=create_driver,
+    ):
+        self.mix = mix
+        self.concurrency = concurrency
+        self.duration = duration
+        self.rate = rate
+        self.ramp = ramp
+        self.base_url = base_url
+        self.results = []
+        self.wall_time = 0.0
+        self._scenarios = {scenario.name: scenario for scenario in SCENARIOS}
+        self._pool = DriverPool(factory, max_size=concurrency)
+        self._lock = threading.Lock()
+        self._slot = 0
+        self._started = None
+
+    def run(self):
+        """
+        Выполняет нагрузку и закрывает браузеры.
+
+        Returns:
+            list: Результаты входов (LoadResult).
+        """
+        self._started = time.monotonic()
+        threads = [
+            threading.Thread(target=self._worker, args=(index,), name=f"load-{index}")
+            for index in range(self.concurrency)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.wall_time = self.elapsed
+        finally:
+            self._pool.close()
+        return self.results
+
+    @property
+    def elapsed(self):
+        """float: Время с начала нагрузки в секундах."""
+        return time.monotonic() - self._started
+
+    def _worker(self, index):
+        delay = self.ramp * index / self.concurrency
+        if delay:
+            time.sleep(delay)
+        names, weights = zip(*self.mix.items())
+        while True:
+            start_at = self._next_start()
+            if start_at is None:
+                return
+            pause = start_at - self.elapsed
+            if pause > 0:
+                time.sleep(pause)
+
+            scenario = self._scenarios[random.choices(names, weights)[0]]
+            started = self.elapsed
+            error = ""
+            try:
+                driver = self._pool.acquire()
+            except Exception as e:
+                self._record(LoadResult(scenario.name, started, 0.0, False, str(e)))
+                return
+            try:
+                run_scenario(driver, scenario, self.base_url, TIME_TO_WAIT)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}".splitlines()[0]
+            finally:
+                self._pool.release(driver)
+            self._record(LoadResult(
+                scenario.name, started, self.elapsed - started, not error, error
+            ))
+
+    def _next_start(self):
+        """
+        Returns:
+            float | None: Момент старта следующего входа или None,
+            если время нагрузки вышло.
+        """
+        with self._lock:
+            if self.rate:
+                start_at = self._slot / self.rate
+                self._slot += 1
+            else:
+                start_at = self.elapsed
+        return start_at if start_at < self.duration else None
+
+    def _record(self, result):
+        with self._lock:
+            self.results.append(result)
+
+
+def build_report(results, elapsed):
+    """
+    Сводит результаты нагрузки в отчет.
+
+    Args:
+        results: Результаты входов (LoadResult)
+        elapsed: Фактическая длительность нагрузки в секундах
+
+    Returns:
+        dict: Пропускная способность, перцентили и гистограмма времени
+        входа - в целом и по каждому сценарию.
+    """
+    def summary(group):
+        latencies = [r.latency for r in group if r.ok]
+        data = {
+            "count": len(group),
+            "errors": sum(not r.ok for r in group),
+            "throughput": round(len(group) / elapsed, 3) if elapsed else 0.0,
+        }
+        if latencies:
+            data.update({
+                f"p{p}": round(percentile(latencies, p), 4) for p in PERCENTILES
+            })
+        data["histogram"] = histogram(latencies)
+        return data
+
+    report = {"elapsed": round(elapsed, 3), "total": summary(results), "scenarios": {}}
+    for name in sorted({r.scenario for r in results}):
+        report["scenarios"][name] = summary([r for r in results if r.scenario == name])
+    errors = sorted({r.error for r in results if r.error})
+    if errors:
+        report["errors"] = errors
+    return report
+
+
+def histogram(latencies):
+    """
+    Раскладывает время входа по корзинам HISTOGRAM_BUCKETS.
+
+    Args:
+        latencies: Время входов в секундах
+
+    Returns:
+        dict: {"<= граница": количество} в порядке корзин.
+    """
+    counts = dict.fromkeys(HISTOGRAM_BUCKETS, 0)
+    for latency in latencies:
+        bucket = next(b for b in HISTOGRAM_BUCKETS if latency <= b)
+        counts[bucket] += 1
+    labels = [f"<= {bound:g} с" for bound in HISTOGRAM_BUCKETS[:-1]]
+    labels.append(f"> {HISTOGRAM_BUCKETS[-2]:g} с")
+    return dict(zip(labels, counts.values()))
+
+
+def print_report(report):
+    total = report["total"]
+    print(
+        f"Входов: {total['count']}, ошибок: {total['errors']}, "
+        f"за {report['elapsed']:.1f} с ({total['throughput']:.2f} входов/с)"
+    )
+    for name, data in report["scenarios"].items():
+        line = f"  {name}: {data['count']} входов, ошибок {data['errors']}"
+        if "p50" in data:
+            line += (
+                f", p50 {data['p50']:.3f} с, p95 {data['p95']:.3f} с, "
+                f"p99 {data['p99']:.3f} с"
+            )
+        print(line)
+
+    print("Гистограмма времени входа:")
+    peak = max(total["histogram"].values()) or 1
+    for bucket, count in total["histogram"].items():
+        bar = "#" * round(HISTOGRAM_WIDTH * count / peak)
+        print(f"  {bucket:>10} | {bar} {count}")
+
+    for error in report.get("errors", []):
+        print(f"Ошибка: {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=LOAD_CONCURRENCY,
+        help="Количество одновременных пользователей (и браузеров)",
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, default=LOAD_DURATION,
+        help="Длительность нагрузки в секундах",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=None,
+        help="Целевое число стартов входа в секунду (по умолчанию - без пауз)",
+    )
+    parser.add_argument(
+        "--ramp", type=float, default=0.0,
+        help="За сколько секунд подключаются все пользователи",
+    )
+    parser.add_argument(
+        "--mix", default=LOAD_MIX,
+        help="Веса сценариев, например standard_user=5,locked_out_user=1",
+    )
+    parser.add_argument(
+        "--remote", action="store_true",
+        help=f"Нагружать {MAIN_URL} вместо локальной замены Sauce Demo",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Сохранить отчет в JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None if args.remote else stand_in.start_or_reuse()
+    base_url = MAIN_URL if args.remote else STAND_IN_URL
+    try:
+        runner = LoadRunner(
+            mix,
+            concurrency=max(1, args.concurrency),
+            duration=args.duration,
+            rate=args.rate,
+            ramp=args.ramp,
+            base_url=base_url,
+        )
+        results = runner.run()
+        report = build_report(results, runner.wall_time)
+    finally:
+        if server:
+            server.stop()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 1 if report["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import logging
+import weakref
+from collections import namedtuple
+
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import SLOW_NETWORK_LATENCY_MS, SLOW_NETWORK_THROUGHPUT
+
+logger = logging.getLogger(__name__)
+
+NetworkProfile = namedtuple(
+    "NetworkProfile", "name blocked_urls latency throughput cache_disabled"
+)
+NetworkProfile.__doc__ = """
+Сетевой профиль браузера, применяемый через Chrome DevTools Protocol.
+
+Attributes:
+    name: Имя профиля (для опции --network-profile и маркера network_profile)
+    blocked_urls: Шаблоны URL, запросы к которым блокируются
+    latency: Добавочная задержка каждого запроса в миллисекундах
+    throughput: Пропускная способность в байтах в секунду (-1 - без ограничения)
+    cache_disabled: Отключен ли HTTP-кэш браузера
+"""
+
+HEAVY_RESOURCES = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+)
+THIRD_PARTY_HOSTS = (
+    "*backtrace.io*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+)
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        # Поведение браузера по умолчанию, также сбрасывает остальные профили
+        NetworkProfile("default", (), 0, -1, False),
+        # Без картинок, шрифтов и сторонних сервисов
+        NetworkProfile("lean", HEAVY_RESOURCES + THIRD_PARTY_HOSTS, 0, -1, False),
+        # Каждый запрос идет в сеть, как при первом открытии сайта
+        # (в default повторные ресурсы отдаются из кэша браузера из пула)
+        NetworkProfile("no-cache", (), 0, -1, True),
+        # Медленная сеть с постоянной задержкой для воспроизводимых замедлений
+        NetworkProfile(
+            "slow", (), SLOW_NETWORK_LATENCY_MS, SLOW_NETWORK_THROUGHPUT, True
+        ),
+        # Та же медленная сеть, но ресурсы из HTTP-кэша браузера отдаются
+        # без обращения к ней: замедляются только запросы, которых нет в кэше
+        NetworkProfile(
+            "cached", (), SLOW_NETWORK_LATENCY_MS, SLOW_NETWORK_THROUGHPUT, False
+        ),
+    )
+}
+
+# Профиль, действующий у каждого драйвера
+_applied = weakref.WeakKeyDictionary()
+
+
+def get_profile(name):
+    """
+    Args:
+        name: Имя профиля
+
+    Returns:
+        NetworkProfile: Профиль с указанным именем.
+
+    Raises:
+        ValueError: Если профиль неизвестен
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Неизвестный сетевой профиль {name!r}, доступны: {', '.join(PROFILES)}"
+        ) from None
+
+
+def applied_profile(driver):
+    """
+    Args:
+        driver: Экземпляр WebDriver
+
+    Returns:
+        str: Имя сетевого профиля, действующего у драйвера.
+    """
+    return _applied.get(driver, "default")
+
+
+def apply_profile(driver, profile):
+    """
+    Применяет сетевой профиль к браузеру.
+
+    Все параметры выставляются явно, поэтому применение профиля
+    полностью заменяет предыдущий - это важно для драйверов из пула.
+    Если у драйвера уже действует этот профиль (для нового браузера -
+    default), команды CDP не отправляются.
+
+    Args:
+        driver: Экземпляр Chrome WebDriver
+        profile: NetworkProfile
+
+    Returns:
+        bool: True если профиль применен, False если браузер
+        не поддерживает CDP (тогда действует поведение по умолчанию).
+    """
+    if applied_profile(driver) == profile.name:
+        return True
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": list(profile.blocked_urls)}
+        )
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile.latency,
+            "downloadThroughput": profile.throughput,
+            "uploadThroughput": profile.throughput,
+        })
+        driver.execute_cdp_cmd(
+            "Network.setCacheDisabled", {"cacheDisabled": profile.cache_disabled}
+        )
+    except (AttributeError, WebDriverException) as e:
+        logger.warning("Сетевой профиль '%s' не применен: %s", profile.name, e)
+        return False
+    _applied[driver] = profile.name
+    return True
+
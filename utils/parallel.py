@@ -0,0 +1,288 @@
+"""
+Параллельный запуск тестов в нескольких процессах-воркерах.
+
+Пример:
+    python -m utils.parallel -n 8 tests/ -m "not slow"
+
+Каждый воркер получает собственные WORKER_ID, диапазон отладочных портов,
+каталоги профилей Chrome и шард результатов Allure. Тесты распределяются
+по воркерам по измеренной длительности предыдущих прогонов (жадный LPT),
+после завершения шарды Allure объединяются в общий каталог.
+"""
+import argparse
+import heapq
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+from conf.config import ALLURE_RESULTS_DIR, DURATIONS_FILE, STAND_IN
+from utils import stand_in
+
+DEFAULT_DURATION = 1.0
+
+
+def load_durations(path=DURATIONS_FILE):
+    """
+    Загружает длительности тестов из предыдущих прогонов.
+
+    Args:
+        path: Путь к JSON-файлу вида {nodeid: секунды}
+
+    Returns:
+        dict: Длительности тестов или пустой словарь, если файла нет.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations, path=DURATIONS_FILE):
+    """
+    Дописывает новые измерения в файл длительностей.
+
+    Args:
+        durations: Словарь {nodeid: секунды} с новыми измерениями
+        path: Путь к JSON-файлу длительностей
+    """
+    stored = load_durations(path)
+    stored.update(durations)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stored, f, indent=2, sort_keys=True)
+
+
+def schedule(nodeids, durations, workers):
+    """
+    Распределяет тесты по воркерам по известной длительности.
+
+    Самые долгие тесты раздаются первыми, каждый - наименее загруженному
+    воркеру. Для тестов без истории берется медиана известных длительностей.
+
+    Args:
+        nodeids: Идентификаторы тестов
+        durations: Словарь {nodeid: секунды}
+        workers: Количество воркеров
+
+    Returns:
+        list: Списки nodeid для каждого воркера.
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+
+    shards = [[] for _ in range(workers)]
+    heap = [(0.0, index) for index in range(workers)]
+    ordered = sorted(nodeids, key=lambda n: durations.get(n, fallback), reverse=True)
+    for nodeid in ordered:
+        load, index = heapq.heappop(heap)
+        shards[index].append(nodeid)
+        heapq.heappush(heap, (load + durations.get(nodeid, fallback), index))
+    return [shard for shard in shards if shard]
+
+
+class DurationRecorder:
+    """
+    Плагин pytest, записывающий длительности тестов текущего прогона.
+
+    Длительность теста - сумма фаз setup, call и teardown.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
+
+    def pytest_sessionfinish(self):
+        save_durations(self.durations, self.path)
+
+
+class _Collector:
+    def __init__(self):
+        self.nodeids = []
+        self.parser = None
+        self.alluredir = None
+
+    def pytest_addoption(self, parser):
+        # Парсер со всеми опциями pytest, плагинов и conftest.py
+        self.parser = parser
+
+    def pytest_configure(self, config):
+        self.alluredir = getattr(config.option, "allure_report_dir", None)
+
+    def pytest_collection_finish(self, session):
+        # После отбора по -m и -k
+        self.nodeids = [item.nodeid for item in session.items]
+
+
+def collect(pytest_args):
+    """
+    Собирает список тестов без их запуска.
+
+    Args:
+        pytest_args: Аргументы pytest (пути, -m, -k и т.д.)
+
+    Returns:
+        tuple: (идентификаторы собранных тестов, аргументы без путей
+        к тестам для воркеров - см. option_args, каталог результатов
+        Allure из --alluredir или ALLURE_RESULTS_DIR).
+    """
+    collector = _Collector()
+    with tempfile.TemporaryDirectory() as alluredir:
+        code = pytest.main(
+            ["--collect-only", "-qq", f"--alluredir={alluredir}", *pytest_args],
+            plugins=[collector],
+        )
+    if code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+        raise SystemExit(code)
+    # Свой --alluredir из аргументов перекрывает временный каталог сбора
+    results_dir = collector.alluredir
+    if not results_dir or results_dir == alluredir:
+        results_dir = ALLURE_RESULTS_DIR
+    return collector.nodeids, option_args(pytest_args, collector.parser), results_dir
+
+
+def option_args(pytest_args, parser):
+    """
+    Убирает из аргументов pytest пути к тестам, оставляя только опции.
+
+    Воркеры получают явный список nodeid, поэтому исходные пути
+    им передавать нельзя - иначе каждый воркер запустит все тесты.
+    Позиционный аргумент отличается от значения опции (--basetemp /tmp/x)
+    парсером pytest: аргумент считается путем, только если без него
+    остальные опции разбираются так же, а путей становится на один меньше.
+
+    Args:
+        pytest_args: Аргументы pytest
+        parser: Парсер аргументов pytest (pytest.Parser)
+
+    Returns:
+        list: Аргументы без путей к тестам.
+    """
+    def parse(args):
+        try:
+            namespace = vars(parser.parse(args))
+        except pytest.UsageError:
+            return None
+        return namespace.pop("file_or_dir"), namespace
+
+    paths, options = parse(pytest_args)
+    result = list(pytest_args)
+    for index in reversed(range(len(result))):
+        if result[index].startswith("-") or result[index] not in paths:
+            continue
+        parsed = parse(result[:index] + result[index + 1:])
+        if parsed and parsed[1] == options and len(parsed[0]) == len(paths) - 1:
+            paths = parsed[0]
+            del result[index]
+    return result
+
+
+def merge_allure_shards(shard_dirs, target=ALLURE_RESULTS_DIR):
+    """
+    Объединяет шарды результатов Allure в один каталог.
+
+    Имена файлов Allure уникальны (uuid), поэтому достаточно копирования.
+
+    Args:
+        shard_dirs: Каталоги шардов
+        target: Итоговый каталог результатов
+    """
+    shutil.rmtree(target, ignore_errors=True)
+    os.makedirs(target)
+    for shard in shard_dirs:
+        if not os.path.isdir(shard):
+            continue
+        for name in os.listdir(shard):
+            shutil.copy2(os.path.join(shard, name), os.path.join(target, name))
+
+
+def run_shards(shards, options, workdir, env_for_shard=None):
+    """
+    Запускает по одному процессу pytest на каждый шард и ждет завершения.
+
+    Args:
+        shards: Списки nodeid для каждого процесса
+        options: Опции pytest без путей к тестам (см. collect)
+        workdir: Каталог для служебных файлов шардов
+        env_for_shard: Функция (index) -> dict с доп. переменными окружения
+
+    Returns:
+        tuple: (код возврата, каталоги шардов Allure, файлы длительностей)
+    """
+    processes = []
+    shard_dirs = []
+    duration_files = []
+    for index, shard in enumerate(shards):
+        ids_file = os.path.join(workdir, f"shard-{index}.txt")
+        with open(ids_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(shard))
+        alluredir = os.path.join(workdir, f"allure-{index}")
+        durations_file = os.path.join(workdir, f"durations-{index}.json")
+        shard_dirs.append(alluredir)
+        duration_files.append(durations_file)
+
+        env = dict(os.environ, WORKER_ID=f"gw{index}", WORKER_COUNT=str(len(shards)))
+        if env_for_shard:
+            env.update(env_for_shard(index))
+        # Опции шарда - последними: при повторе опции действует последнее
+        # значение, и --alluredir пользователя не сводит шарды в один каталог
+        command = [
+            sys.executable, "-m", "pytest", f"@{ids_file}",
+            *options,
+            f"--alluredir={alluredir}",
+            f"--record-durations={durations_file}",
+        ]
+        processes.append(subprocess.Popen(command, env=env))
+
+    codes = [process.wait() for process in processes]
+    failed = [code for code in codes if code != pytest.ExitCode.OK]
+    return (failed[0] if failed else 0), shard_dirs, duration_files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0], allow_abbrev=False
+    )
+    parser.add_argument(
+        "-n", "--workers", type=int, default=os.cpu_count(),
+        help="Количество процессов-воркеров (по умолчанию - число ядер)",
+    )
+    args, pytest_args = parser.parse_known_args(argv)
+
+    nodeids, options, results_dir = collect(pytest_args)
+    if not nodeids:
+        print("Тесты не найдены")
+        return 0
+
+    shards = schedule(nodeids, load_durations(), max(1, args.workers))
+    print(f"Тестов: {len(nodeids)}, воркеров: {len(shards)}")
+
+    started = time.perf_counter()
+    server = stand_in.start_or_reuse() if STAND_IN else None
+    try:
+        with tempfile.TemporaryDirectory(prefix="parallel-") as workdir:
+            code, shard_dirs, duration_files = run_shards(shards, options, workdir)
+            merge_allure_shards(shard_dirs, results_dir)
+            for path in duration_files:
+                save_durations(load_durations(path))
+    finally:
+        if server:
+            server.stop()
+
+    print(f"Общее время: {time.perf_counter() - started:.1f} с")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Проверка доступности тестируемого сайта перед запуском браузеров.
+
+Пример:
+    python -m utils.preflight
+    python -m utils.preflight https://www.saucedemo.com/ --max-ttfb 1
+
+Один запрос к сайту с замером фаз: разрешение имени, TCP-соединение,
+TLS-рукопожатие и время до первого байта ответа. Второй запрос по тому же
+соединению keep-alive показывает время ответа сервера без затрат на
+соединение. Сайт считается недоступным, если запрос не выполнен за
+PREFLIGHT_TIMEOUT секунд, ответ - ошибка HTTP или первый байт пришел
+позже PREFLIGHT_MAX_TTFB секунд.
+"""
+import argparse
+import http.client
+import socket
+import ssl
+import sys
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from conf.config import MAIN_URL, PREFLIGHT_MAX_TTFB, PREFLIGHT_TIMEOUT
+
+ProbeResult = namedtuple(
+    "ProbeResult", "url status dns connect tls ttfb warm_ttfb total error"
+)
+ProbeResult.__doc__ = """
+Результат проверки сайта. Время фаз - в секундах, None - фаза не выполнялась.
+
+Attributes:
+    url: Адрес проверки
+    status: Код ответа HTTP (None - ответа нет)
+    dns: Разрешение имени хоста
+    connect: Установка TCP-соединения
+    tls: TLS-рукопожатие (None для http)
+    ttfb: От отправки запроса до первого байта ответа
+    warm_ttfb: То же для повторного запроса по открытому соединению
+    total: Общее время проверки
+    error: Описание ошибки (None - запрос выполнен)
+"""
+
+PHASES = ("dns", "connect", "tls", "ttfb", "warm_ttfb", "total")
+
+
+def probe(url=MAIN_URL, timeout=PREFLIGHT_TIMEOUT):
+    """
+    Проверяет сайт одним запросом с замером фаз.
+
+    Args:
+        url: Адрес страницы
+        timeout: Время на всю проверку в секундах (кроме разрешения имени,
+                 для которого ОС не поддерживает таймаут)
+
+    Returns:
+        ProbeResult: Результат проверки; ошибки не выбрасываются.
+    """
+    parts = urlsplit(url)
+    https = parts.scheme == "https"
+    port = parts.port or (443 if https else 80)
+    path = parts.path or "/"
+    timings = dict.fromkeys(PHASES)
+    status = error = None
+    connection = None
+    started = time.perf_counter()
+    deadline = started + timeout
+
+    def remaining():
+        left = deadline - time.perf_counter()
+        if left <= 0:
+            raise socket.timeout(f"превышено время проверки {timeout} с")
+        return left
+
+    mark = started
+    try:
+        family, kind, proto, _, address = socket.getaddrinfo(
+            parts.hostname, port, type=socket.SOCK_STREAM
+        )[0]
+        now = time.perf_counter()
+        timings["dns"], mark = now - mark, now
+
+        sock = socket.socket(family, kind, proto)
+        sock.settimeout(remaining())
+        connection = (
+            http.client.HTTPSConnection if https else http.client.HTTPConnection
+        )(parts.hostname, port)
+        connection.sock = sock
+        sock.connect(address)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        now = time.perf_counter()
+        timings["connect"], mark = now - mark, now
+
+        if https:
+            sock.settimeout(remaining())
+            connection.sock = ssl.create_default_context().wrap_socket(
+                sock, server_hostname=parts.hostname
+            )
+            now = time.perf_counter()
+            timings["tls"], mark = now - mark, now
+
+        connection.sock.settimeout(remaining())
+        connection.request("GET", path, headers={"Accept": "text/html"})
+        response = connection.getresponse()
+        timings["ttfb"] = time.perf_counter() - mark
+        status = response.status
+        response.read()
+        if not response.will_close and status < 400:
+            timings["warm_ttfb"] = _warm_ttfb(connection, path, remaining)
+    except (OSError, http.client.HTTPException) as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        if connection is not None:
+            connection.close()
+    timings["total"] = time.perf_counter() - started
+    return ProbeResult(url=url, status=status, error=error, **timings)
+
+
+def _warm_ttfb(connection, path, remaining):
+    # Повторный запрос только дополняет отчет: его ошибка не делает сайт недоступным
+    try:
+        connection.sock.settimeout(remaining())
+        started = time.perf_counter()
+        connection.request("GET", path, headers={"Accept": "text/html"})
+        connection.getresponse().read()
+        return time.perf_counter() - started
+    except (OSError, http.client.HTTPException):
+        return None
+
+
+def problem(result, max_ttfb=PREFLIGHT_MAX_TTFB):
+    """
+    Args:
+        result: ProbeResult
+        max_ttfb: Допустимое время до первого байта в секундах
+
+    Returns:
+        str | None: Почему сайт не готов к тестам, или None, если готов.
+    """
+    if result.error:
+        return f"{result.url} недоступен: {result.error}"
+    if result.status >= 400:
+        return f"{result.url} ответил HTTP {result.status}"
+    if result.ttfb > max_ttfb:
+        return (
+            f"{result.url} отвечает слишком медленно: первый байт через "
+            f"{result.ttfb:.2f} с (допустимо {max_ttfb:.2f} с)"
+        )
+    return None
+
+
+def describe(result):
+    """
+    Args:
+        result: ProbeResult
+
+    Returns:
+        str: Строка с кодом ответа и временем фаз в миллисекундах.
+    """
+    phases = ", ".join(
+        f"{phase}: {getattr(result, phase) * 1000:.0f} мс"
+        for phase in PHASES if getattr(result, phase) is not None
+    )
+    return f"{result.url} HTTP {result.status or '-'}, {phases}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("url", nargs="?", default=MAIN_URL)
+    parser.add_argument("--timeout", type=float, default=PREFLIGHT_TIMEOUT)
+    parser.add_argument("--max-ttfb", type=float, default=PREFLIGHT_MAX_TTFB)
+    args = parser.parse_args(argv)
+
+    result = probe(args.url, args.timeout)
+    print(describe(result))
+    reason = problem(result, args.max_ttfb)
+    if reason:
+        print(reason)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
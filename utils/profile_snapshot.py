@@ -0,0 +1,144 @@
+"""
+Снимок прогретого профиля Chrome и сравнение времени запуска браузера.
+
+Пример:
+    python -m utils.profile_snapshot build .chrome-snapshot
+    python -m utils.profile_snapshot compare .chrome-snapshot -n 5
+    CHROME_PROFILE_SNAPSHOT=.chrome-snapshot pytest tests/
+
+build запускает Chrome с новым профилем, открывает сайт (первый запуск,
+HTTP-кэш, кэш скриптов), закрывает браузер и удаляет из профиля то, что
+не нужно тестам. Снимок только читается: каждый браузер получает его копию
+в tmpfs. compare запускает браузеры с пустым профилем и из снимка
+и выводит среднее время каждой фазы запуска.
+"""
+import argparse
+import os
+import shutil
+import sys
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from conf.config import MAIN_URL
+from utils.driver_factory import build_chrome_options, create_driver, find_chromedriver
+from utils.startup import PHASES, StartupProfiler, startup_profiler
+
+DEFAULT_SNAPSHOT_DIR = ".chrome-snapshot"
+
+# Содержимое профиля, которое не ускоряет запуск и только увеличивает копию
+TRIMMED = (
+    "BrowserMetrics",
+    "Crash Reports",
+    "Crashpad",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+    "Safe Browsing",
+    "component_crx_cache",
+    "extensions_crx_cache",
+    "optimization_guide_model_store",
+    os.path.join("Default", "GPUCache"),
+    os.path.join("Default", "History"),
+    os.path.join("Default", "History-journal"),
+)
+
+
+def build_snapshot(path, url=MAIN_URL):
+    """
+    Создает снимок прогретого профиля.
+
+    Args:
+        path: Каталог снимка (пересоздается)
+        url: Страница, которую нужно открыть для прогрева
+
+    Returns:
+        int: Размер снимка в байтах.
+    """
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    driver = webdriver.Chrome(
+        options=build_chrome_options(os.path.abspath(path)),
+        service=Service(executable_path=find_chromedriver()),
+    )
+    try:
+        driver.get(url)
+    finally:
+        driver.quit()
+
+    trim_profile(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def trim_profile(path):
+    """
+    Удаляет из профиля Chrome каталоги и файлы TRIMMED.
+
+    Args:
+        path: Каталог профиля
+    """
+    for name in TRIMMED:
+        target = os.path.join(path, name)
+        if os.path.isdir(target):
+            shutil.rmtree(target, ignore_errors=True)
+        elif os.path.exists(target):
+            os.remove(target)
+
+
+def measure(runs, snapshot):
+    """
+    Запускает и закрывает браузер runs раз.
+
+    Args:
+        runs: Количество запусков
+        snapshot: Каталог снимка или пустая строка для пустого профиля
+
+    Returns:
+        dict: {фаза: среднее время в секундах}.
+    """
+    profiler = StartupProfiler()
+    for _ in range(runs):
+        first = len(startup_profiler.timings)
+        driver = create_driver(snapshot=snapshot)
+        driver.quit()
+        for timing in startup_profiler.timings[first:]:
+            profiler.record(timing)
+    return profiler.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Создать снимок профиля")
+    build.add_argument("path", nargs="?", default=DEFAULT_SNAPSHOT_DIR)
+    build.add_argument("--url", default=MAIN_URL, help="Страница для прогрева")
+
+    compare = commands.add_parser("compare", help="Сравнить время запуска")
+    compare.add_argument("path", nargs="?", default=DEFAULT_SNAPSHOT_DIR)
+    compare.add_argument("-n", "--runs", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        size = build_snapshot(args.path, args.url)
+        print(f"Снимок профиля: {args.path} ({size / 1024 / 1024:.1f} МБ)")
+        return 0
+
+    if not os.path.isdir(args.path):
+        parser.error(f"Снимок {args.path} не найден, создайте его командой build")
+    cold = measure(args.runs, "")
+    warm = measure(args.runs, args.path)
+    print(f"{'фаза':<18}{'пустой профиль':>16}{'снимок':>10}{'разница':>10}")
+    for phase in PHASES:
+        change = (warm[phase] - cold[phase]) / cold[phase] * 100 if cold[phase] else 0.0
+        print(f"{phase:<18}{cold[phase]:>15.3f}с{warm[phase]:>9.3f}с{change:>9.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
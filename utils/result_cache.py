@@ -0,0 +1,210 @@
+import ast
+import hashlib
+import os
+import time
+
+import pytest
+
+from conf.config import MAIN_URL, RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL
+
+CACHE_KEY = "sauce-demo/result-cache"
+
+
+class ImportGraph:
+    """
+    Хэши исходного кода модулей проекта с учетом их импортов.
+
+    Отпечаток файла включает содержимое самого файла и всех модулей проекта,
+    которые он импортирует (транзитивно). Сторонние пакеты не учитываются.
+
+    Attributes:
+        root: Корневой каталог проекта
+    """
+
+    def __init__(self, root):
+        self.root = str(root)
+        self._fingerprints = {}
+
+    def fingerprint(self, path):
+        """
+        Args:
+            path: Путь к файлу Python внутри проекта
+
+        Returns:
+            str: sha256 файла и всех его локальных зависимостей.
+        """
+        path = os.path.abspath(path)
+        if path not in self._fingerprints:
+            digest = hashlib.sha256()
+            for dependency in sorted(self._closure(path)):
+                digest.update(os.path.relpath(dependency, self.root).encode())
+                with open(dependency, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+            self._fingerprints[path] = digest.hexdigest()
+        return self._fingerprints[path]
+
+    def _closure(self, path):
+        seen = set()
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            pending.extend(self._local_imports(current))
+        return seen
+
+    def _local_imports(self, path):
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names.append(node.module)
+                # from utils import stand_in - stand_in может быть модулем
+                names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+        # Импорт модуля выполняет и __init__.py всех родительских пакетов
+        names.extend(
+            name.rsplit(".", depth)[0]
+            for name in list(names)
+            for depth in range(1, name.count(".") + 1)
+        )
+        return [file for file in map(self._module_file, set(names)) if file]
+
+    def _module_file(self, name):
+        base = os.path.join(self.root, *name.split("."))
+        for candidate in (f"{base}.py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+
+class ResultCache:
+    """
+    Плагин pytest, пропускающий тесты, входные данные которых не менялись
+    (включается опцией --result-cache).
+
+    Ключ теста - хэш nodeid, параметров, исходного кода тестового модуля
+    и всех модулей проекта, которые он импортирует (pages/, conf/, utils/),
+    файлов conftest.py и целевого окружения (адрес сайта, сетевой профиль,
+    выполнение без браузера).
+    Если тест с таким ключом прошел не раньше ttl секунд назад, он
+    пропускается с пометкой о результате из кэша. Кэш хранится в
+    .pytest_cache и ограничен max_entries записями: при переполнении
+    удаляются самые старые.
+
+    Attributes:
+        ttl: Сколько секунд результат считается свежим
+        max_entries: Максимальное число записей
+        hits: Сколько тестов пропущено по кэшу
+    """
+
+    def __init__(
+        self,
+        config,
+        ttl=RESULT_CACHE_TTL,
+        max_entries=RESULT_CACHE_MAX_ENTRIES,
+    ):
+        self.config = config
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self._graph = ImportGraph(config.rootpath)
+        self._keys = {}
+        self._passed = {}
+        self._failed = set()
+
+    def key(self, item):
+        """
+        Args:
+            item: Тест pytest
+
+        Returns:
+            str: Ключ входных данных теста.
+        """
+        digest = hashlib.sha256()
+        digest.update(item.nodeid.encode())
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None:
+            digest.update(repr(sorted(callspec.params.items())).encode())
+        digest.update(self._graph.fingerprint(item.path).encode())
+        for conftest in self._conftests(item):
+            digest.update(self._graph.fingerprint(conftest).encode())
+        digest.update(repr(self._environment()).encode())
+        return digest.hexdigest()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items):
+        entries = self._load()
+        now = time.time()
+        for item in items:
+            key = self._keys[item.nodeid] = self.key(item)
+            passed_at = entries.get(key)
+            if passed_at and now - passed_at <= self.ttl:
+                self.hits += 1
+                item.add_marker(pytest.mark.skip(reason=(
+                    "результат из кэша: прошел "
+                    f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(passed_at))}"
+                )))
+
+    def pytest_runtest_logreport(self, report):
+        key = self._keys.get(report.nodeid)
+        if key is None:
+            return
+        if report.failed:
+            self._failed.add(key)
+            self._passed.pop(key, None)
+        elif report.when == "call" and report.passed and key not in self._failed:
+            self._passed[key] = time.time()
+
+    def pytest_sessionfinish(self):
+        if not (self._passed or self._failed):
+            return
+        # Перечитываем кэш: параллельные воркеры пишут в него же
+        entries = self._load()
+        entries.update(self._passed)
+        for key in self._failed:
+            entries.pop(key, None)
+        newest = sorted(entries.items(), key=lambda entry: entry[1], reverse=True)
+        self.config.cache.set(CACHE_KEY, dict(newest[:self.max_entries]))
+
+    def _load(self):
+        return self.config.cache.get(CACHE_KEY, {})
+
+    def _environment(self):
+        return (
+            MAIN_URL,
+            self.config.getoption("--network-profile"),
+            self.config.getoption("--protocol-tier"),
+        )
+
+    def _conftests(self, item):
+        root = self.config.rootpath
+        directory = item.path.parent
+        found = []
+        while True:
+            conftest = directory / "conftest.py"
+            if conftest.is_file():
+                found.append(conftest)
+            if directory == root or directory.parent == directory:
+                return found
+            directory = directory.parent
+
+
+def install(config):
+    """
+    Регистрирует ResultCache, если в pytest доступен кэш (.pytest_cache).
+
+    Args:
+        config: Конфигурация pytest
+
+    Returns:
+        ResultCache | None: Зарегистрированный плагин или None.
+    """
+    if getattr(config, "cache", None) is None:
+        return None
+    cache = ResultCache(config)
+    config.pluginmanager.register(cache, "result_cache")
+    return cache
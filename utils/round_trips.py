@@ -0,0 +1,55 @@
+import contextlib
+from collections import Counter
+
+
+class RoundTripCounter:
+    """
+    Счетчик команд, отправленных драйвером в браузер.
+
+    Attributes:
+        total: Общее количество команд
+        commands: Количество команд по именам (например, 'executeAsyncScript')
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.commands = Counter()
+
+    def record(self, command):
+        self.total += 1
+        self.commands[command] += 1
+
+
+@contextlib.contextmanager
+def count_round_trips(driver):
+    """
+    Считает обращения к WebDriver внутри блока with.
+
+    Пример:
+        with count_round_trips(driver) as counter:
+            login_page.send_text(username, password)
+        print(counter.total)
+
+    Args:
+        driver: Экземпляр WebDriver
+
+    Yields:
+        RoundTripCounter: Счетчик, заполняемый по мере выполнения блока.
+    """
+    counter = RoundTripCounter()
+    wrapped = vars(driver).get("execute")
+    execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counter.record(driver_command)
+        return execute(driver_command, params)
+
+    driver.execute = counting_execute
+    try:
+        yield counter
+    finally:
+        # Драйвер может вернуться в пул - снимаем обертку с экземпляра.
+        if wrapped is None:
+            del driver.execute
+        else:
+            driver.execute = wrapped
@@ -0,0 +1,235 @@
+"""
+Таблица сценариев входа и ее компиляция в параметры pytest.
+
+Сценарии описываются в JSON-файле списком объектов:
+
+    {
+        "id": "locked_out_user",
+        "title": "3. Авторизация заблокированного пользователя",
+        "severity": "critical",
+        "description": "Ожидается сообщение об ошибке блокировки.",
+        "username": "locked_out_user",
+        "password": "secret_sauce",
+        "outcome": "error",
+        "error": "$LOCKED_USER_ERROR",
+        "url": "$MAIN_URL"
+    }
+
+outcome - 'success' (переход на страницу товаров) или 'error'. fill -
+'both' (по умолчанию, оба поля заполняются send_text) или 'password_only'
+(вводится только пароль через send_text_only_password, username должен
+быть пустым). Сценарии с "non_visual": true проверяют только ответ сервера и получают маркер
+non_visual (см. ProtocolLoginPage). Значения
+вида $ИМЯ берутся из conf.config. Если username или password - список,
+строка разворачивается в сценарии для всех сочетаний значений.
+"""
+import itertools
+import json
+from collections import namedtuple
+
+import pytest
+
+from conf import config
+from pages.login_page import LoginPage
+from utils.driver_pool import DriverPool
+
+OUTCOMES = ("success", "error")
+FILLS = ("both", "password_only")
+SEVERITIES = ("blocker", "critical", "normal", "minor", "trivial")
+
+LoginScenario = namedtuple(
+    "LoginScenario",
+    "id title severity description username password fill outcome error url non_visual",
+)
+LoginScenario.__doc__ = """
+Один сценарий входа из таблицы.
+
+Attributes:
+    id: Идентификатор сценария (часть nodeid теста)
+    title: Заголовок теста в Allure
+    severity: Важность теста в Allure
+    description: Описание теста в Allure
+    username: Имя пользователя (пустая строка - поле остается пустым)
+    password: Пароль
+    fill: 'both' - ввести логин и пароль, 'password_only' - только пароль
+          на только что открытой форме
+    outcome: 'success' или 'error'
+    error: Ожидаемый фрагмент сообщения об ошибке (для outcome='error')
+    url: Ожидаемый адрес страницы после входа
+    non_visual: Проверяется ли только ответ сервера (можно выполнять без браузера)
+"""
+
+
+def _resolve(value):
+    if isinstance(value, str) and value.startswith("$"):
+        try:
+            return getattr(config, value[1:])
+        except AttributeError:
+            raise ValueError(f"В conf.config нет значения {value[1:]!r}") from None
+    return value
+
+
+def _expand(row):
+    usernames = row.get("username", "")
+    passwords = row.get("password", "")
+    expanded = isinstance(usernames, list) or isinstance(passwords, list)
+    usernames = usernames if isinstance(usernames, list) else [usernames]
+    passwords = passwords if isinstance(passwords, list) else [passwords]
+    for username, password in itertools.product(usernames, passwords):
+        scenario_id = row["id"]
+        title = row.get("title", scenario_id)
+        if expanded:
+            scenario_id = f"{scenario_id}-{username or 'empty'}-{password or 'empty'}"
+            title = f"{title} ({username or '<пусто>'} / {password or '<пусто>'})"
+        yield scenario_id, title, _resolve(username), _resolve(password)
+
+
+def load_scenarios(path):
+    """
+    Загружает и проверяет таблицу сценариев.
+
+    Args:
+        path: Путь к JSON-файлу со списком сценариев
+
+    Returns:
+        list: Сценарии (LoginScenario) в порядке таблицы.
+
+    Raises:
+        ValueError: Если строка таблицы некорректна или id повторяется
+    """
+    with open(path, encoding="utf-8") as f:
+        rows = json.load(f)
+
+    scenarios = []
+    seen = set()
+    for number, row in enumerate(rows, start=1):
+        if "id" not in row:
+            raise ValueError(f"{path}: у строки {number} нет id")
+        outcome = row.get("outcome", "success")
+        if outcome not in OUTCOMES:
+            raise ValueError(f"{path}: {row['id']}: неизвестный outcome {outcome!r}")
+        severity = row.get("severity", "normal")
+        if severity not in SEVERITIES:
+            raise ValueError(f"{path}: {row['id']}: неизвестный severity {severity!r}")
+        if outcome == "error" and not row.get("error"):
+            raise ValueError(f"{path}: {row['id']}: для outcome 'error' нужен error")
+        fill = row.get("fill", "both")
+        if fill not in FILLS:
+            raise ValueError(f"{path}: {row['id']}: неизвестный fill {fill!r}")
+        if fill == "password_only" and row.get("username"):
+            raise ValueError(f"{path}: {row['id']}: для fill 'password_only' username не вводится")
+
+        default_url = "$URL_AFTER_LOGIN" if outcome == "success" else "$MAIN_URL"
+        for scenario_id, title, username, password in _expand(row):
+            if scenario_id in seen:
+                raise ValueError(f"{path}: повторяется id {scenario_id!r}")
+            seen.add(scenario_id)
+            scenarios.append(LoginScenario(
+                id=scenario_id,
+                title=title,
+                severity=severity,
+                description=row.get("description", ""),
+                username=username,
+                password=password,
+                fill=fill,
+                outcome=outcome,
+                error=_resolve(row.get("error", "")),
+                url=_resolve(row.get("url", default_url)),
+                non_visual=bool(row.get("non_visual", False)),
+            ))
+    return scenarios
+
+
+def compile_matrix(scenarios):
+    """
+    Превращает сценарии в параметры pytest, сгруппированные по состоянию браузера.
+
+    Сценарии с ошибкой оставляют браузер на странице логина, поэтому
+    они идут подряд и выполняются на одной загруженной странице (сообщение
+    об ошибке предыдущего сценария закрывается, см. ScenarioBrowser);
+    успешные входы идут после них - первый из них тоже использует уже
+    открытую форму. Сценарии fill='password_only' нуждаются в чистой форме
+    и идут первыми в своей группе.
+    Сценарии non_visual получают маркер non_visual.
+
+    Args:
+        scenarios: Сценарии (LoginScenario)
+
+    Returns:
+        list: pytest.param для parametrize("scenario", ...).
+    """
+    ordered = sorted(
+        scenarios, key=lambda s: (s.outcome == "success", s.fill != "password_only")
+    )
+    return [
+        pytest.param(
+            scenario,
+            id=scenario.id,
+            marks=[pytest.mark.non_visual] if scenario.non_visual else [],
+        )
+        for scenario in ordered
+    ]
+
+
+class ScenarioBrowser:
+    """
+    Браузер, общий для сценариев входа.
+
+    Перед сценарием страница логина открывается заново только если
+    предыдущий сценарий не оставил браузер на форме входа; сообщение
+    об ошибке, оставшееся на форме, перед сценарием закрывается. Если браузер
+    мог быть в любом другом состоянии (успешный вход, упавший тест),
+    его состояние сбрасывается так же, как при возврате в пул.
+
+    Attributes:
+        driver: Экземпляр WebDriver или HttpBrowser
+        base_url: Адрес страницы логина
+        page_class: Класс страницы логина (LoginPage или ProtocolLoginPage)
+        reset: Функция сброса состояния браузера
+        navigations: Сколько раз страница логина открывалась заново
+        reused: Сколько сценариев выполнено на уже открытой форме
+    """
+
+    def __init__(
+        self,
+        driver,
+        base_url=config.MAIN_URL,
+        page_class=LoginPage,
+        reset=DriverPool.reset,
+    ):
+        self.driver = driver
+        self.base_url = base_url
+        self.page_class = page_class
+        self.reset = reset
+        self.navigations = 0
+        self.reused = 0
+        self._state = "clean"
+
+    def login_page(self, fresh=False):
+        """
+        Args:
+            fresh: Открыть страницу заново, даже если форма осталась от
+                   предыдущего сценария (в ее полях - введенные им значения)
+
+        Returns:
+            LoginPage | ProtocolLoginPage: Страница логина, готовая к вводу данных.
+        """
+        reuse = self._state == "login_form" and not fresh
+        if reuse:
+            self.reused += 1
+        else:
+            if self._state == "dirty":
+                self.reset(self.driver)
+            self.driver.get(self.base_url)
+            self.navigations += 1
+        # До успешного завершения сценария состояние браузера неизвестно
+        self._state = "dirty"
+        page = self.page_class(self.driver)
+        if reuse:
+            # Иначе сообщение предыдущего сценария засчиталось бы этому
+            page.dismiss_error()
+        return page
+
+    def keep_login_form(self):
+        """Отмечает, что сценарий завершился на форме входа и ее можно переиспользовать."""
+        self._state = "login_form"
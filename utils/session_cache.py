@@ -0,0 +1,258 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import (
+    MAIN_URL,
+    SESSION_PROBE_TIMEOUT,
+    SESSION_TTL,
+    TIME_TO_WAIT,
+    URL_AFTER_LOGIN,
+)
+from pages.login_page import LoginPage
+
+logger = logging.getLogger(__name__)
+
+SessionEntry = namedtuple("SessionEntry", "cookies storage password_hash expires_at")
+SessionEntry.__doc__ = """
+Сохраненная авторизованная сессия.
+
+Attributes:
+    cookies: Cookies браузера после входа (формат driver.get_cookies())
+    storage: Содержимое localStorage и sessionStorage после входа
+             ({"localStorage": {...}, "sessionStorage": {...}})
+    password_hash: SHA-256 пароля, с которым выполнен вход
+    expires_at: Момент (time.monotonic()), после которого запись устарела
+"""
+
+# Восстанавливает localStorage и sessionStorage до выполнения скриптов страницы.
+_RESTORE_STORAGE_SCRIPT = """
+const storage = %s;
+for (const [area, entries] of Object.entries(storage)) {
+    for (const [key, value] of Object.entries(entries)) {
+        window[area].setItem(key, value);
+    }
+}
+"""
+
+_READ_STORAGE_SCRIPT = """
+const result = {};
+for (const area of ['localStorage', 'sessionStorage']) {
+    const entries = {};
+    for (let i = 0; i < window[area].length; i++) {
+        const key = window[area].key(i);
+        entries[key] = window[area].getItem(key);
+    }
+    result[area] = entries;
+}
+return result;
+"""
+
+
+class SessionCache:
+    """
+    Кэш авторизованных сессий для тестов, которым нужен вошедший пользователь.
+
+    Первый вход выполняется через интерфейс (LoginPage), после чего cookies,
+    localStorage и sessionStorage сохраняются под ключом (имя пользователя,
+    базовый URL). Следующие входы с тем же паролем восстанавливают их
+    напрямую и сразу открывают страницу товаров; вход с другим паролем
+    выполняется через форму, как без кэша. Запись удаляется по истечении ttl (или раньше, если истекает
+    одна из cookies) и при неудачной проверке страницы товаров.
+
+    Тесты, проверяющие сам вход, должны использовать LoginPage напрямую.
+
+    Attributes:
+        ttl: Время жизни записи в секундах
+        hits: Сколько входов выполнено из кэша
+        misses: Сколько входов выполнено через интерфейс
+        invalidated: Сколько записей удалено после неудачной проверки
+    """
+
+    def __init__(self, ttl=SESSION_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def login(
+        self,
+        driver,
+        username,
+        password,
+        base_url=MAIN_URL,
+        after_login_url=URL_AFTER_LOGIN,
+        timeout=TIME_TO_WAIT,
+        probe_timeout=SESSION_PROBE_TIMEOUT,
+    ):
+        """
+        Открывает страницу товаров от имени пользователя.
+
+        Args:
+            driver: Экземпляр WebDriver
+            username: Имя пользователя
+            password: Пароль
+            base_url: Адрес страницы логина
+            after_login_url: Адрес страницы товаров
+            timeout: Таймаут ожидания страницы товаров после входа через форму
+            probe_timeout: Таймаут проверки восстановленной сессии в секундах.
+                           Страница товаров открывается сразу после
+                           восстановления, поэтому недействительная сессия
+                           определяется за этот срок, а не за timeout.
+
+        Returns:
+            bool: True если пользователь вошел и видит страницу товаров.
+        """
+        key = (username, base_url)
+        entry = self.get(key)
+        if entry is not None and entry.password_hash != _password_hash(password):
+            logger.debug("Пароль %s не совпадает с сохраненным, вход через форму", key)
+            entry = None
+        if entry is not None:
+            self._restore(driver, entry, after_login_url)
+            page = LoginPage(driver)
+            page.waiter.context = username
+            if page.is_products_displayed(probe_timeout):
+                with self._lock:
+                    self.hits += 1
+                return True
+            logger.debug("Сессия %s из кэша недействительна", key)
+            self.invalidate(key)
+
+        with self._lock:
+            self.misses += 1
+        driver.get(base_url)
+        login_page = LoginPage(driver)
+        login_page.send_text(username, password)
+        login_page.click_login_button()
+        if not login_page.is_products_displayed(timeout):
+            return False
+
+        self.put(key, driver, password)
+        return True
+
+    def get(self, key):
+        """
+        Returns:
+            SessionEntry | None: Действующая запись или None, если записи нет
+            или она устарела.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            return entry
+
+    def put(self, key, driver, password):
+        """
+        Сохраняет сессию, открытую в браузере.
+
+        Args:
+            key: Кортеж (имя пользователя, базовый URL)
+            driver: Драйвер на странице после входа
+            password: Пароль, с которым выполнен вход
+        """
+        cookies = driver.get_cookies()
+        storage = driver.execute_script(_READ_STORAGE_SCRIPT)
+        expires_at = time.monotonic() + self.ttl
+        now = time.time()
+        for cookie in cookies:
+            if "expiry" in cookie:
+                expires_at = min(
+                    expires_at, time.monotonic() + cookie["expiry"] - now
+                )
+        with self._lock:
+            self._entries[key] = SessionEntry(
+                cookies, storage, _password_hash(password), expires_at
+            )
+
+    def invalidate(self, key):
+        """
+        Удаляет запись из кэша.
+
+        Args:
+            key: Кортеж (имя пользователя, базовый URL)
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidated += 1
+
+    def clear(self):
+        """Удаляет все записи кэша."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _restore(driver, entry, after_login_url):
+        """
+        Восстанавливает cookies и хранилища и открывает страницу товаров.
+
+        Через CDP cookies выставляются до первой загрузки страницы, а
+        localStorage и sessionStorage - скриптом, выполняемым до скриптов страницы, так что
+        переход выполняется один раз. Без CDP сначала открывается страница
+        нужного origin.
+        """
+        try:
+            _restore_with_cdp(driver, entry, after_login_url)
+        except (AttributeError, WebDriverException) as e:
+            logger.debug("Восстановление сессии через CDP недоступно: %s", e)
+            _restore_with_webdriver(driver, entry, after_login_url)
+
+
+def _password_hash(password):
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def _has_storage(entry):
+    return any((entry.storage or {}).values())
+
+
+def _restore_with_cdp(driver, entry, after_login_url):
+    cookies = []
+    for cookie in entry.cookies:
+        cdp_cookie = {
+            key: cookie[key]
+            for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+            if key in cookie
+        }
+        if "expiry" in cookie:
+            cdp_cookie["expires"] = cookie["expiry"]
+        cookies.append(cdp_cookie)
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    if not _has_storage(entry):
+        driver.get(after_login_url)
+        return
+
+    script = driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {"source": _RESTORE_STORAGE_SCRIPT % json.dumps(entry.storage)},
+    )
+    try:
+        driver.get(after_login_url)
+    finally:
+        # Драйвер возвращается в пул - скрипт не должен пережить тест.
+        driver.execute_cdp_cmd(
+            "Page.removeScriptToEvaluateOnNewDocument",
+            {"identifier": script["identifier"]},
+        )
+
+
+def _restore_with_webdriver(driver, entry, after_login_url):
+    driver.get(after_login_url)
+    for cookie in entry.cookies:
+        driver.add_cookie(cookie)
+    if _has_storage(entry):
+        driver.execute_script(
+            _RESTORE_STORAGE_SCRIPT % "arguments[0]", entry.storage
+        )
+    driver.get(after_login_url)
+
@@ -0,0 +1,312 @@
+"""
+Локальная замена сайта Sauce Demo для запуска тестов без сети.
+
+Пример:
+    STAND_IN=true pytest tests/
+    python -m utils.stand_in --port 8765 --delay 0.2
+
+Сервер отдает страницу логина и страницу товаров с той же DOM-структурой,
+на которую опираются локаторы LoginPage, и повторяет поведение
+пользователей standard_user, locked_out_user и performance_glitch_user.
+"""
+import argparse
+import html
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from conf.config import (
+    BAD_PASSWORD_ERROR,
+    EMPTY_LOGIN_ERROR,
+    LOCKED_USER_ERROR,
+    PAGE_TITLE,
+    STAND_IN_DELAY,
+    STAND_IN_GLITCH_DELAY,
+    STAND_IN_HOST,
+    STAND_IN_PORT,
+)
+
+PASSWORD = "secret_sauce"
+USERS = {
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+}
+LOCKED_USERS = {"locked_out_user"}
+GLITCH_USERS = {"performance_glitch_user"}
+SESSION_COOKIE = "session-username"
+
+EMPTY_PASSWORD_ERROR = "Epic sadface: Password is required"
+NOT_LOGGED_IN_ERROR = (
+    "Epic sadface: You can only access '/inventory.html' when you are logged in."
+)
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<div class="login_logo">{title}</div>
+<form method="post" action="/">
+  <input class="input_error form_input" placeholder="Username" type="text"
+         data-test="username" id="user-name" name="user-name" value="{username}">
+  <input class="input_error form_input" placeholder="Password" type="password"
+         data-test="password" id="password" name="password" value="">
+  <div class="error-message-container{error_class}">{error}</div>
+  <input type="submit" class="submit-button btn_action" data-test="login-button"
+         id="login-button" name="login-button" value="Login">
+</form>
+</body>
+</html>
+"""
+
+INVENTORY_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<div class="header_secondary_container" data-test="secondary-header">
+  <span class="title" data-test="title">Products</span>
+</div>
+<div class="inventory_list" data-test="inventory-list">
+  <div class="inventory_item" data-test="inventory-item">
+    <div class="inventory_item_name" data-test="inventory-item-name">Sauce Labs Backpack</div>
+    <div class="inventory_item_price" data-test="inventory-item-price">$29.99</div>
+  </div>
+  <div class="inventory_item" data-test="inventory-item">
+    <div class="inventory_item_name" data-test="inventory-item-name">Sauce Labs Bike Light</div>
+    <div class="inventory_item_price" data-test="inventory-item-price">$9.99</div>
+  </div>
+</div>
+</body>
+</html>
+"""
+
+
+def authenticate(username, password):
+    """
+    Проверяет учетные данные так же, как это делает Sauce Demo.
+
+    Args:
+        username: Имя пользователя
+        password: Пароль
+
+    Returns:
+        str: Текст ошибки или пустая строка при успешном входе.
+    """
+    if not username:
+        return EMPTY_LOGIN_ERROR
+    if not password:
+        return EMPTY_PASSWORD_ERROR
+    if username not in USERS or password != PASSWORD:
+        return f"Epic sadface: {BAD_PASSWORD_ERROR}"
+    if username in LOCKED_USERS:
+        return LOCKED_USER_ERROR
+    return ""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "SauceDemoStandIn/1.0"
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело пишутся отдельно - без TCP_NODELAY тело ждет
+    # отложенного ACK клиента (~40 мс на каждый ответ keep-alive)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._delay()
+        path = self.path.split("?", 1)[0]
+        if path in ("/", "/index.html"):
+            self._send_login_page()
+        elif path == "/inventory.html":
+            username = self._session_user()
+            if not username:
+                self._send_login_page(error=NOT_LOGGED_IN_ERROR)
+                return
+            if username in GLITCH_USERS:
+                time.sleep(self.server.glitch_delay)
+            self._send_html(INVENTORY_PAGE.format(title=PAGE_TITLE))
+        else:
+            self._send_html("<h1>Not Found</h1>", status=404)
+
+    def do_POST(self):
+        self._delay()
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        username = form.get("user-name", [""])[0]
+        password = form.get("password", [""])[0]
+
+        error = authenticate(username, password)
+        if error:
+            self._send_login_page(error=error, username=username)
+            return
+
+        self.send_response(302)
+        self.send_header("Location", "/inventory.html")
+        self.send_header("Set-Cookie", f"{SESSION_COOKIE}={username}; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _delay(self):
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+    def _session_user(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        if morsel and morsel.value in USERS - LOCKED_USERS:
+            return morsel.value
+        return ""
+
+    def _send_login_page(self, error="", username=""):
+        self._send_html(LOGIN_PAGE.format(
+            title=PAGE_TITLE,
+            username=html.escape(username),
+            error_class=" error" if error else "",
+            error=f'<h3 data-test="error">{html.escape(error)}</h3>' if error else "",
+        ))
+
+    def _send_html(self, body, status=200):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StandInServer:
+    """
+    Многопоточный HTTP-сервер, имитирующий Sauce Demo.
+
+    Attributes:
+        host: Адрес, на котором слушает сервер
+        port: Порт сервера (0 - выбрать свободный)
+        delay: Искусственная задержка каждого ответа в секундах
+        glitch_delay: Задержка загрузки страницы товаров
+                      для performance_glitch_user в секундах
+    """
+
+    def __init__(
+        self,
+        host=STAND_IN_HOST,
+        port=STAND_IN_PORT,
+        delay=STAND_IN_DELAY,
+        glitch_delay=STAND_IN_GLITCH_DELAY,
+    ):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.glitch_delay = glitch_delay
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """str: Базовый URL сервера со слешем на конце."""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """
+        Запускает сервер в фоновом потоке.
+
+        Returns:
+            StandInServer: Этот же объект для цепочки вызовов.
+
+        Raises:
+            OSError: Если порт уже занят
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.delay = self.delay
+        self._httpd.glitch_delay = self.glitch_delay
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="stand-in", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Останавливает сервер."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def is_stand_in(url, timeout=2):
+    """
+    Проверяет, что по адресу уже отвечает stand-in сервер.
+
+    Args:
+        url: Базовый URL
+        timeout: Таймаут запроса в секундах
+
+    Returns:
+        bool: True если по адресу работает StandInServer.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.headers.get("Server", "").startswith(
+                _Handler.server_version
+            )
+    except (OSError, urllib.error.URLError):
+        return False
+
+
+def start_or_reuse(**kwargs):
+    """
+    Запускает stand-in сервер или переиспользует уже запущенный.
+
+    Сервер, запущенный родительским процессом (например, параллельным
+    запуском), разделяется всеми воркерами.
+
+    Returns:
+        StandInServer | None: Запущенный сервер или None, если используется
+        уже работающий сервер другого процесса.
+
+    Raises:
+        OSError: Если порт занят чем-то, кроме stand-in сервера
+    """
+    server = StandInServer(**kwargs)
+    try:
+        return server.start()
+    except OSError:
+        if is_stand_in(server.url):
+            return None
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default=STAND_IN_HOST)
+    parser.add_argument("--port", type=int, default=STAND_IN_PORT)
+    parser.add_argument("--delay", type=float, default=STAND_IN_DELAY)
+    parser.add_argument("--glitch-delay", type=float, default=STAND_IN_GLITCH_DELAY)
+    args = parser.parse_args(argv)
+
+    server = StandInServer(args.host, args.port, args.delay, args.glitch_delay).start()
+    print(f"Stand-in Sauce Demo: {server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import statistics
+import threading
+from collections import namedtuple
+
+StartupTiming = namedtuple(
+    "StartupTiming", "prepare spawn launch first_navigation total snapshot"
+)
+StartupTiming.__doc__ = """
+Время фаз запуска одного браузера в секундах.
+
+Attributes:
+    prepare: Поиск chromedriver, подготовка профиля и опций
+    spawn: Запуск процесса chromedriver
+    launch: Запуск Chrome и создание сессии WebDriver
+    first_navigation: Первая навигация (запуск процесса рендерера)
+    total: Общее время создания драйвера
+    snapshot: Запущен ли браузер из снимка профиля
+"""
+
+PHASES = ("prepare", "spawn", "launch", "first_navigation", "total")
+
+
+class StartupProfiler:
+    """
+    Собирает время запуска браузеров за прогон.
+
+    Attributes:
+        timings: Замеры (StartupTiming) в порядке запуска
+    """
+
+    def __init__(self):
+        self.timings = []
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        with self._lock:
+            self.timings.append(timing)
+
+    def summary(self):
+        """
+        Returns:
+            dict: {фаза: среднее время в секундах} по всем запускам
+            или пустой словарь, если браузеры не запускались.
+        """
+        with self._lock:
+            timings = list(self.timings)
+        if not timings:
+            return {}
+        return {
+            phase: statistics.mean(getattr(t, phase) for t in timings)
+            for phase in PHASES
+        }
+
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,405 @@
+"""
+Время шагов allure.step по всем прогонам: запись в SQLite и отчеты.
+
+Пример:
+    pytest tests/ --step-metrics=.step_metrics.sqlite
+    python -m utils.step_metrics slowest -n 10
+    python -m utils.step_metrics trend "Проверить успешную авторизацию"
+    python -m utils.step_metrics variance --runs 20
+
+Для каждого шага теста записываются время выполнения, число команд
+WebDriver (для HttpBrowser - HTTP-запросов) и, для медленных шагов, объем
+данных, загруженных страницей за время шага. slowest выводит самые медленные шаги по p95,
+trend - среднее время шага по прогонам, variance - шаги с наибольшим
+разбросом времени (коэффициент вариации).
+"""
+import argparse
+import contextlib
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+import allure_commons
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from conf.config import MAIN_URL, STEP_METRICS_REPORT_DB, STEP_METRICS_SLOW_STEP
+from utils.benchmark import percentile
+from utils.http_browser import HttpBrowser
+from utils.round_trips import count_round_trips
+from utils.workers import worker_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    base_url TEXT NOT NULL,
+    network_profile TEXT NOT NULL,
+    worker TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    nodeid TEXT NOT NULL,
+    step TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    started REAL NOT NULL,
+    duration REAL NOT NULL,
+    commands INTEGER,
+    bytes INTEGER,
+    failed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_step ON steps (step);
+CREATE INDEX IF NOT EXISTS steps_run ON steps (run_id);
+"""
+
+# Объем ресурсов и документов, загрузка которых началась после момента
+# arguments[0] (мс с начала эпохи): transferSize из Resource/Navigation Timing.
+_TRANSFERRED_SCRIPT = """
+const since = arguments[0];
+return performance.getEntries()
+    .filter(e => 'transferSize' in e && performance.timeOrigin + e.startTime >= since)
+    .reduce((sum, e) => sum + e.transferSize, 0);
+"""
+
+StepRecord = namedtuple(
+    "StepRecord", "nodeid step depth started duration commands bytes failed"
+)
+StepRecord.__doc__ = """
+Один выполненный шаг allure.step.
+
+Attributes:
+    nodeid: Тест, в котором выполнялся шаг
+    step: Заголовок шага
+    depth: Уровень вложенности (0 - шаг верхнего уровня)
+    started: Момент начала (секунды с начала эпохи)
+    duration: Длительность в секундах
+    commands: Число команд WebDriver или HTTP-запросов (None - без драйвера)
+    bytes: Загружено байт за время шага (None - неизвестно или шаг быстрый)
+    failed: Завершился ли шаг исключением
+"""
+
+_OpenStep = namedtuple("_OpenStep", "title depth started clock commands bytes")
+
+
+class StepMetrics:
+    """
+    Плагин pytest и allure, записывающий время каждого шага allure.step.
+
+    Шаги собираются в памяти и записываются в SQLite одним прогоном
+    (строка в runs) в конце сессии; параллельные воркеры пишут в ту же
+    базу свои прогоны. Команды WebDriver считаются через
+    utils.round_trips.count_round_trips для драйвера из фикстуры chromedriver.
+    Объем данных в браузере считается по Resource Timing страницы отдельным
+    скриптом в конце шага (в число команд он не входит), поэтому только
+    для шагов не быстрее slow_step: быстрым шагам лишний запрос к браузеру
+    стоил бы заметную долю их времени. Для HttpBrowser объем известен
+    без запросов и записывается для всех шагов.
+
+    Attributes:
+        path: Путь к базе SQLite
+        network_profile: Сетевой профиль прогона (для сравнения прогонов)
+        slow_step: С какой длительности шага в секундах считается объем данных
+        records: Шаги текущего прогона (StepRecord)
+    """
+
+    def __init__(self, path, network_profile="default", slow_step=STEP_METRICS_SLOW_STEP):
+        self.path = path
+        self.network_profile = network_profile
+        self.slow_step = slow_step
+        self.records = []
+        self.started = time.time()
+        self._open = {}
+        self._nodeid = None
+        self._driver = None
+        self._counter = None
+        self._probes = 0
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        driver = item.funcargs.get("chromedriver")
+        counting = (
+            count_round_trips(driver)
+            if driver is not None and not isinstance(driver, HttpBrowser)
+            else contextlib.nullcontext()
+        )
+        with counting as counter:
+            self._nodeid, self._driver, self._counter = item.nodeid, driver, counter
+            self._probes = 0
+            try:
+                yield
+            finally:
+                self._nodeid = self._driver = self._counter = None
+                self._open.clear()
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        if self._nodeid is None:
+            return
+        commands, received = self._totals()
+        self._open[uuid] = _OpenStep(
+            title, len(self._open), time.time(), time.perf_counter(), commands, received
+        )
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        step = self._open.pop(uuid, None)
+        if step is None:
+            return
+        duration = time.perf_counter() - step.clock
+        commands, received = self._totals()
+        if isinstance(self._driver, HttpBrowser):
+            transferred = received - step.bytes
+        elif duration >= self.slow_step:
+            transferred = self._transferred_since(step.started)
+        else:
+            transferred = None
+        self.records.append(StepRecord(
+            nodeid=self._nodeid,
+            step=step.title,
+            depth=step.depth,
+            started=step.started,
+            duration=duration,
+            commands=None if commands is None else commands - step.commands,
+            bytes=transferred,
+            failed=exc_type is not None,
+        ))
+
+    def pytest_sessionfinish(self):
+        allure_commons.plugin_manager.unregister(self)
+        if self.records:
+            save_run(self.path, self.records, self.started, self.network_profile)
+
+    def _totals(self):
+        if isinstance(self._driver, HttpBrowser):
+            return self._driver.requests, self._driver.bytes_received
+        if self._counter is not None:
+            return self._counter.total - self._probes, None
+        return None, None
+
+    def _transferred_since(self, started):
+        if self._counter is None:
+            return None
+        self._probes += 1
+        try:
+            return int(self._driver.execute_script(_TRANSFERRED_SCRIPT, started * 1000))
+        except (TypeError, ValueError, WebDriverException):
+            return None
+
+
+def connect(path):
+    """
+    Открывает базу метрик шагов, создавая таблицы при необходимости.
+
+    Args:
+        path: Путь к файлу SQLite
+
+    Returns:
+        sqlite3.Connection: Соединение с базой.
+    """
+    connection = sqlite3.connect(path, timeout=30)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def save_run(path, records, started, network_profile="default"):
+    """
+    Записывает шаги одного прогона.
+
+    Args:
+        path: Путь к файлу SQLite
+        records: Шаги прогона (StepRecord)
+        started: Момент начала прогона (секунды с начала эпохи)
+        network_profile: Сетевой профиль прогона
+
+    Returns:
+        int: id прогона.
+    """
+    with contextlib.closing(connect(path)) as connection, connection:
+        run_id = connection.execute(
+            "INSERT INTO runs (started, base_url, network_profile, worker) "
+            "VALUES (?, ?, ?, ?)",
+            (started, MAIN_URL, network_profile, worker_id()),
+        ).lastrowid
+        connection.executemany(
+            "INSERT INTO steps VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run_id, *record) for record in records],
+        )
+    return run_id
+
+
+def load_steps(path, runs=None, pattern=None):
+    """
+    Читает шаги из базы.
+
+    Args:
+        path: Путь к файлу SQLite
+        runs: Сколько последних прогонов учитывать (None - все)
+        pattern: Подстрока заголовка шага (None - все шаги)
+
+    Returns:
+        list: Строки (run_id, run_started, step, duration, commands, bytes, failed).
+    """
+    query = (
+        "SELECT steps.run_id, runs.started, step, duration, commands, bytes, failed "
+        "FROM steps JOIN runs ON runs.id = steps.run_id"
+    )
+    conditions, params = [], []
+    if runs:
+        conditions.append(
+            "steps.run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)"
+        )
+        params.append(runs)
+    if pattern:
+        conditions.append("instr(step, ?) > 0")
+        params.append(pattern)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    with contextlib.closing(connect(path)) as connection:
+        return connection.execute(query + " ORDER BY steps.run_id", params).fetchall()
+
+
+def step_stats(rows):
+    """
+    Сводит длительности шагов по заголовкам.
+
+    Args:
+        rows: Строки из load_steps
+
+    Returns:
+        list: Словари со статистикой шага: step, count, failed, mean, p50,
+        p95, max, stdev, cv, commands, bytes.
+    """
+    groups = {}
+    for _, _, step, duration, commands, transferred, failed in rows:
+        group = groups.setdefault(
+            step, {"durations": [], "commands": [], "bytes": [], "failed": 0}
+        )
+        group["durations"].append(duration)
+        group["failed"] += failed
+        if commands is not None:
+            group["commands"].append(commands)
+        if transferred is not None:
+            group["bytes"].append(transferred)
+
+    stats = []
+    for step, group in groups.items():
+        durations = group["durations"]
+        mean = statistics.mean(durations)
+        stdev = statistics.stdev(durations) if len(durations) > 1 else 0.0
+        stats.append({
+            "step": step,
+            "count": len(durations),
+            "failed": group["failed"],
+            "mean": mean,
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "max": max(durations),
+            "stdev": stdev,
+            "cv": stdev / mean if mean else 0.0,
+            "commands": statistics.mean(group["commands"]) if group["commands"] else None,
+            "bytes": statistics.mean(group["bytes"]) if group["bytes"] else None,
+        })
+    return stats
+
+
+def step_trend(rows):
+    """
+    Args:
+        rows: Строки из load_steps
+
+    Returns:
+        list: (run_id, run_started, count, mean, max) по прогонам в порядке запуска.
+    """
+    runs = {}
+    for run_id, run_started, _, duration, *_ in rows:
+        runs.setdefault((run_id, run_started), []).append(duration)
+    return [
+        (run_id, run_started, len(durations), statistics.mean(durations), max(durations))
+        for (run_id, run_started), durations in sorted(runs.items())
+    ]
+
+
+def install(config, path):
+    """
+    Регистрирует StepMetrics в pytest и в allure.
+
+    Args:
+        config: Конфигурация pytest
+        path: Путь к базе SQLite (пустая строка - не записывать метрики)
+
+    Returns:
+        StepMetrics | None: Зарегистрированный плагин или None.
+    """
+    if not path:
+        return None
+    metrics = StepMetrics(path, config.getoption("--network-profile"))
+    config.pluginmanager.register(metrics, "step_metrics")
+    allure_commons.plugin_manager.register(metrics)
+    return metrics
+
+
+def _format_bytes(value):
+    if value is None:
+        return "-"
+    return f"{value / 1024:.1f} КБ" if value >= 1024 else f"{value:.0f} Б"
+
+
+def print_stats(stats, limit):
+    print(
+        f"{'p95':>8}{'p50':>8}{'max':>8}{'cv':>6}{'n':>6}"
+        f"{'команд':>8}{'данных':>11}  шаг"
+    )
+    for row in stats[:limit]:
+        commands = "-" if row["commands"] is None else f"{row['commands']:.1f}"
+        failed = f" (упал {row['failed']})" if row["failed"] else ""
+        print(
+            f"{row['p95']:>7.3f}с{row['p50']:>7.3f}с{row['max']:>7.3f}с"
+            f"{row['cv']:>6.2f}{row['count']:>6}{commands:>8}"
+            f"{_format_bytes(row['bytes']):>11}  {row['step']}{failed}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=STEP_METRICS_REPORT_DB, help="Файл базы метрик")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    slowest = commands.add_parser("slowest", help="Самые медленные шаги по p95")
+    trend = commands.add_parser("trend", help="Время шага по прогонам")
+    trend.add_argument("step", help="Подстрока заголовка шага")
+    variance = commands.add_parser("variance", help="Шаги с наибольшим разбросом")
+    for command in (slowest, trend, variance):
+        command.add_argument(
+            "--runs", type=int, default=None, help="Сколько последних прогонов учитывать"
+        )
+    for command in (slowest, variance):
+        command.add_argument("-n", "--limit", type=int, default=10)
+        command.add_argument("-k", "--step", default=None, help="Подстрока заголовка шага")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f"База {args.db} не найдена: запустите тесты")
+
+    if args.command == "trend":
+        rows = load_steps(args.db, args.runs, args.step)
+        if not rows:
+            print(f"Шагов с '{args.step}' нет")
+            return 1
+        print(f"{'прогон':>7}  {'дата':<16}{'n':>5}{'среднее':>10}{'max':>9}")
+        for run_id, run_started, count, mean, longest in step_trend(rows):
+            date = time.strftime("%Y-%m-%d %H:%M", time.localtime(run_started))
+            print(f"{run_id:>7}  {date:<16}{count:>5}{mean:>9.3f}с{longest:>8.3f}с")
+        return 0
+
+    stats = step_stats(load_steps(args.db, args.runs, args.step))
+    key = "p95" if args.command == "slowest" else "cv"
+    stats.sort(key=lambda row: row[key], reverse=True)
+    print_stats(stats, args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import contextlib
+import statistics
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировка кэша между процессами недоступна
+    fcntl = None
+
+from conf.config import (
+    MAIN_URL,
+    WAIT_CALIBRATION_FACTOR,
+    WAIT_CALIBRATION_MARGIN,
+    WAIT_CALIBRATION_MAX_SAMPLES,
+    WAIT_CALIBRATION_MIN_SAMPLES,
+    WAIT_CALIBRATION_PERCENTILE,
+)
+
+CACHE_KEY = "sauce-demo/wait-calibration"
+LOCK_DIR = "sauce-demo-wait-calibration"
+MODES = ("on", "learn", "off")
+
+
+class TimeoutModel:
+    """
+    Таймауты ожиданий, подобранные по времени прошлых успешных ожиданий.
+
+    Для каждого условия (описание ожидания, сетевой профиль браузера
+    и контекст Waiter - пользователь, от имени которого выполнен вход)
+    хранятся последние max_samples длительностей успешных ожиданий.
+    Когда их набралось хотя бы min_samples, таймаут условия равен
+    percentile-му перцентилю, умноженному на factor, плюс margin секунд,
+    но не больше таймаута, переданного вызывающим кодом. Так отрицательная
+    проверка завершается за несколько секунд, а не за весь потолок.
+
+    Режимы:
+        on - таймауты подбираются и модель пополняется
+        learn - модель пополняется, таймауты не меняются
+        off - модель не используется
+
+    Attributes:
+        mode: Режим калибровки
+        samples: {условие: длительности успешных ожиданий в секундах}
+        shortened: Сколько ожиданий получили таймаут меньше потолка
+        expired: Сколько из них завершились по таймауту
+    """
+
+    def __init__(
+        self,
+        mode="off",
+        percentile=WAIT_CALIBRATION_PERCENTILE,
+        factor=WAIT_CALIBRATION_FACTOR,
+        margin=WAIT_CALIBRATION_MARGIN,
+        min_samples=WAIT_CALIBRATION_MIN_SAMPLES,
+        max_samples=WAIT_CALIBRATION_MAX_SAMPLES,
+    ):
+        self.mode = mode
+        self.percentile = percentile
+        self.factor = factor
+        self.margin = margin
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.samples = {}
+        self.shortened = 0
+        self.expired = 0
+        self._observed = {}
+        self._lock = threading.Lock()
+
+    def timeout(self, condition, ceiling):
+        """
+        Args:
+            condition: Ключ условия ожидания
+            ceiling: Таймаут, заданный вызывающим кодом, в секундах
+
+        Returns:
+            float: Таймаут ожидания в секундах (не больше ceiling).
+        """
+        if self.mode != "on":
+            return ceiling
+        with self._lock:
+            samples = list(self.samples.get(condition, ()))
+        if len(samples) < max(self.min_samples, 2):
+            return ceiling
+        quantiles = statistics.quantiles(samples, n=100, method="inclusive")
+        high = quantiles[self.percentile - 1]
+        calibrated = high * self.factor + self.margin
+        if calibrated >= ceiling:
+            return ceiling
+        with self._lock:
+            self.shortened += 1
+        return calibrated
+
+    def observe(self, condition, elapsed, ready, shortened=False):
+        """
+        Записывает результат ожидания.
+
+        Args:
+            condition: Ключ условия ожидания
+            elapsed: Длительность ожидания в секундах
+            ready: Выполнилось ли условие
+            shortened: Был ли таймаут уменьшен моделью
+        """
+        if self.mode == "off":
+            return
+        with self._lock:
+            if not ready:
+                self.expired += shortened
+                return
+            for samples in (self.samples, self._observed):
+                bucket = samples.setdefault(condition, [])
+                bucket.append(round(elapsed, 4))
+                del bucket[:-self.max_samples]
+
+    def load(self, samples):
+        """
+        Args:
+            samples: {условие: длительности}, сохраненные прошлыми прогонами
+        """
+        with self._lock:
+            self.samples = {
+                condition: list(values)[-self.max_samples:]
+                for condition, values in samples.items()
+            }
+
+    def merged(self, stored):
+        """
+        Добавляет длительности этого прогона к сохраненным.
+
+        Сохраненные данные нужно перечитать перед записью (под блокировкой,
+        см. CalibrationStore), тогда параллельные воркеры не затирают
+        замеры друг друга.
+
+        Args:
+            stored: {условие: длительности}, сохраненные к концу прогона
+
+        Returns:
+            dict: {условие: длительности} для сохранения.
+        """
+        result = {condition: list(values) for condition, values in stored.items()}
+        with self._lock:
+            for condition, values in self._observed.items():
+                bucket = result.setdefault(condition, [])
+                bucket.extend(values)
+                del bucket[:-self.max_samples]
+        return result
+
+
+wait_calibration = TimeoutModel()
+
+
+class CalibrationStore:
+    """
+    Плагин pytest, хранящий модель таймаутов в кэше pytest между прогонами.
+
+    Замеры разделены по адресу сайта: модель для локальной замены
+    не влияет на таймауты для настоящего Sauce Demo. Чтение и запись
+    кэша выполняются под файловой блокировкой, чтобы воркеры параллельного
+    запуска, завершающиеся одновременно, дописывали свои замеры по очереди.
+
+    Attributes:
+        config: Конфигурация pytest
+        model: TimeoutModel
+    """
+
+    def __init__(self, config, model):
+        self.config = config
+        self.model = model
+        self.model.load(self._stored())
+
+    def pytest_sessionfinish(self):
+        if self.model.mode == "off":
+            return
+        with self._locked():
+            data = self.config.cache.get(CACHE_KEY, {})
+            data[MAIN_URL] = self.model.merged(data.get(MAIN_URL, {}))
+            self.config.cache.set(CACHE_KEY, data)
+
+    def _stored(self):
+        with self._locked():
+            return self.config.cache.get(CACHE_KEY, {}).get(MAIN_URL, {})
+
+    @contextlib.contextmanager
+    def _locked(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.config.cache.mkdir(LOCK_DIR) / "lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def install(config, mode):
+    """
+    Включает калибровку таймаутов для Waiter и регистрирует CalibrationStore.
+
+    Args:
+        config: Конфигурация pytest
+        mode: Режим калибровки (on, learn, off)
+
+    Returns:
+        CalibrationStore | None: Зарегистрированный плагин или None,
+        если калибровка выключена или кэш pytest недоступен.
+    """
+    wait_calibration.mode = mode
+    if mode == "off" or getattr(config, "cache", None) is None:
+        wait_calibration.mode = "off"
+        return None
+    store = CalibrationStore(config, wait_calibration)
+    config.pluginmanager.register(store, "wait_calibration")
+    return store
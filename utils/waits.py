@@ -0,0 +1,480 @@
+import asyncio
+import logging
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from conf.config import (
+    ASYNC_SCRIPT_TIMEOUT,
+    POLL_BACKOFF,
+    POLL_INTERVAL,
+    POLL_MAX_INTERVAL,
+)
+from utils.network_profiles import applied_profile
+from utils.timeouts import wait_calibration
+
+logger = logging.getLogger(__name__)
+
+WaitReport = namedtuple("WaitReport", "description ready elapsed round_trips")
+WaitReport.__doc__ = """
+Результат одного ожидания.
+
+Attributes:
+    description: Описание ожидаемого условия
+    ready: Выполнилось ли условие до истечения таймаута
+    elapsed: Время до готовности (или до таймаута) в секундах
+    round_trips: Количество обращений к WebDriver за время ожидания
+"""
+
+# Ждет элементы одним асинхронным скриптом: сначала проверяет DOM сразу,
+# затем подписывается на изменения через MutationObserver и отвечает,
+# как только все элементы окажутся в нужном состоянии или истечет таймаут.
+_OBSERVE_SCRIPT = """
+const [targets, state, timeoutMs, done] = arguments;
+
+function findOne([kind, selector]) {
+    const el = kind === 'xpath'
+        ? document.evaluate(selector, document, null,
+              XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(selector);
+    if (!el || state === 'present') {
+        return el;
+    }
+    const style = window.getComputedStyle(el);
+    const visible = style.display !== 'none'
+        && style.visibility !== 'hidden'
+        && el.getClientRects().length > 0;
+    if (!visible || (state === 'clickable' && el.disabled)) {
+        return null;
+    }
+    return el;
+}
+
+function find() {
+    const found = targets.map(findOne);
+    return found.every(Boolean) ? found : null;
+}
+
+const found = find();
+if (found) {
+    done(found);
+    return;
+}
+
+let timer = null;
+const observer = new MutationObserver(() => {
+    const els = find();
+    if (els) {
+        finish(els);
+    }
+});
+
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+
+observer.observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true,
+});
+timer = setTimeout(() => finish(null), timeoutMs);
+"""
+
+
+def css_escape(value):
+    """
+    Экранирует строку для CSS-селектора по правилам CSS.escape() браузера.
+
+    Результат годится и как идентификатор (имя класса), и как значение
+    атрибута в кавычках: кавычки, обратная косая черта, управляющие
+    символы и ведущие цифры экранируются.
+
+    Args:
+        value: Значение локатора
+
+    Returns:
+        str: Экранированная строка
+    """
+    result = []
+    for index, char in enumerate(value):
+        code = ord(char)
+        if code == 0:
+            result.append("\ufffd")
+        elif (
+            code < 0x20 or code == 0x7F
+            or (index == 0 and char.isdigit() and char.isascii())
+            or (index == 1 and char.isdigit() and char.isascii() and value[0] == "-")
+        ):
+            result.append(f"\\{code:x} ")
+        elif index == 0 and char == "-" and len(value) == 1:
+            result.append("\\-")
+        elif code >= 0x80 or char in "-_" or (char.isascii() and char.isalnum()):
+            result.append(char)
+        else:
+            result.append(f"\\{char}")
+    return "".join(result)
+
+
+# Локаторы, которые превращаются в CSS-селектор с экранированным значением
+CSS_LOCATORS = {
+    By.ID: lambda value: f'[id="{css_escape(value)}"]',
+    By.NAME: lambda value: f'[name="{css_escape(value)}"]',
+    By.CLASS_NAME: lambda value: f".{css_escape(value)}",
+}
+
+_CSS_BUILDERS = {
+    By.CSS_SELECTOR: lambda value: value,
+    By.TAG_NAME: lambda value: value,
+    **CSS_LOCATORS,
+}
+
+
+# Сообщения chromedriver, когда скрипт прерван переходом на другую страницу
+_NAVIGATION_MESSAGES = (
+    "document unloaded",
+    "execution context was destroyed",
+    "inspected target navigated or closed",
+)
+
+
+def is_navigation_error(error):
+    """
+    Проверяет, прервана ли команда уходом со страницы.
+
+    Args:
+        error: WebDriverException
+
+    Returns:
+        bool: True для устаревших элементов, таймаута скрипта и выгрузки
+        документа - после них ожидание можно повторить на новой странице.
+    """
+    if isinstance(error, (StaleElementReferenceException, TimeoutException)):
+        return True
+    message = (error.msg or "").lower()
+    return any(text in message for text in _NAVIGATION_MESSAGES)
+
+
+def _to_selector(locator):
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", value
+    if by in _CSS_BUILDERS:
+        return "css", _CSS_BUILDERS[by](value)
+    raise ValueError(f"Локатор {by!r} не поддерживается ожиданием в браузере")
+
+
+def _can_retry(error, description):
+    # Документ выгрузился во время ожидания (переход по ссылке, отправка
+    # формы) или истек таймаут скрипта - ожидание повторяется на новой
+    # странице. Остальные ошибки (неверный селектор, мертвая сессия) - сразу наружу.
+    if not is_navigation_error(error):
+        return False
+    logger.debug("Ожидание '%s' прервано: %s", description, error.msg)
+    return True
+
+
+class _Polling:
+    """
+    Расписание попыток одного ожидания, общее для Waiter и AsyncWaiter.
+
+    Таймаут берется из модели калибровки, паузы между попытками растут
+    экспоненциально, по итогу ожидание записывается в history и в модель.
+    Сами попытки и паузы выполняет вызывающий код - синхронно или через await.
+
+    Attributes:
+        waiter: Waiter, выполняющий ожидание
+        description: Описание условия для отчета
+        key: Ключ условия в модели калибровки
+        ceiling: Таймаут, заданный вызывающим кодом, в секундах
+        timeout: Действующий таймаут в секундах (не больше ceiling)
+        started: Момент начала ожидания (time.monotonic)
+        attempts: Сколько попыток выполнено
+    """
+
+    def __init__(self, waiter, description, timeout):
+        self.waiter = waiter
+        self.description = description
+        self.key = waiter._condition_key(description)
+        self.ceiling = timeout
+        self.timeout = waiter.calibration.timeout(self.key, timeout)
+        self.started = time.monotonic()
+        self.attempts = 0
+        self._deadline = self.started + self.timeout
+        self._interval = waiter.poll_interval
+
+    def script_wait_ms(self):
+        """
+        Returns:
+            int: Сколько миллисекунд скрипту ожидания ждать в браузере -
+            остаток таймаута, но меньше таймаута асинхронных скриптов WebDriver.
+        """
+        remaining = self._deadline - time.monotonic()
+        return int(max(0.0, min(remaining, ASYNC_SCRIPT_TIMEOUT - 1)) * 1000)
+
+    def next_pause(self, result, failure):
+        """
+        Учитывает результат очередной попытки.
+
+        Args:
+            result: Результат попытки (истинный - условие выполнилось)
+            failure: Начало сообщения TimeoutException, например
+                     "Условие 'x' не выполнилось"
+
+        Returns:
+            float | None: Пауза перед следующей попыткой в секундах
+            или None, если условие выполнилось.
+
+        Raises:
+            TimeoutException: Если условие не выполнилось, а время вышло
+        """
+        self.attempts += 1
+        waiter = self.waiter
+        if result:
+            waiter._report(self.description, True, self.started, self.attempts)
+            waiter.calibration.observe(self.key, time.monotonic() - self.started, True)
+            return None
+
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            waiter._report(self.description, False, self.started, self.attempts)
+            waiter.calibration.observe(
+                self.key, self.timeout, False, self.timeout < self.ceiling
+            )
+            raise TimeoutException(f"{failure} за {self.timeout:.1f} с")
+        pause = min(self._interval, remaining)
+        self._interval = min(self._interval * waiter.backoff, waiter.max_interval)
+        return pause
+
+
+class Waiter:
+    """
+    Ожидания без implicit wait.
+
+    Ожидание элементов выполняется одним вызовом execute_async_script
+    с MutationObserver внутри страницы: условие разрешается за один
+    round-trip к WebDriver. Если во время ожидания страница перезагрузилась,
+    ожидание повторяется на новой странице с экспоненциальной задержкой.
+    Произвольные условия опрашиваются с экспоненциально растущим интервалом.
+
+    Каждое ожидание записывается в history как WaitReport с временем
+    до готовности. Таймаут, переданный в ожидание, - потолок: если модель
+    калибровки (utils.timeouts) знает типичное время этого условия
+    при текущем сетевом профиле и контексте, ожидание завершается раньше.
+
+    Attributes:
+        driver: Экземпляр WebDriver
+        poll_interval: Начальный интервал опроса в секундах
+        backoff: Множитель интервала после каждой неудачной попытки
+        max_interval: Максимальный интервал опроса в секундах
+        history: Отчеты о выполненных ожиданиях
+        calibration: Модель таймаутов (TimeoutModel)
+        context: Часть ключа калибровки, от которой зависит время условий,
+                 например имя пользователя: страница товаров у
+                 performance_glitch_user открывается дольше, чем у standard_user
+    """
+
+    def __init__(
+        self,
+        driver,
+        poll_interval=POLL_INTERVAL,
+        backoff=POLL_BACKOFF,
+        max_interval=POLL_MAX_INTERVAL,
+        calibration=wait_calibration,
+        context="",
+    ):
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.calibration = calibration
+        self.context = context
+        self.history = []
+
+    def until(self, condition, timeout, description=""):
+        """
+        Опрашивает условие, пока оно не вернет истинное значение.
+
+        Args:
+            condition: Функция (driver) -> значение
+            timeout: Максимальное время ожидания в секундах
+            description: Описание условия для отчета
+
+        Returns:
+            Первое истинное значение, которое вернуло условие.
+
+        Raises:
+            TimeoutException: Если условие не выполнилось за timeout
+                              (или за откалиброванный таймаут)
+        """
+        polling = _Polling(self, description, timeout)
+        while True:
+            try:
+                value = condition(self.driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                value = None
+            pause = polling.next_pause(value, f"Условие '{description}' не выполнилось")
+            if pause is None:
+                return value
+            time.sleep(pause)
+
+    def element(self, locator, state="visible", timeout=10):
+        """
+        Ожидает элемент в нужном состоянии одним скриптом в браузере.
+
+        Args:
+            locator: Кортеж (By, значение)
+            state: 'present', 'visible' или 'clickable'
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            WebElement: Найденный элемент.
+
+        Raises:
+            TimeoutException: Если элемент не перешел в состояние за timeout
+        """
+        return self.elements([locator], state, timeout)[0]
+
+    def elements(self, locators, state="visible", timeout=10):
+        """
+        Ожидает сразу несколько элементов одним скриптом в браузере.
+
+        Все элементы находятся за одно обращение к WebDriver, что позволяет
+        странице получить всю форму одним round-trip.
+
+        Args:
+            locators: Список кортежей (By, значение)
+            state: 'present', 'visible' или 'clickable' для всех элементов
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            list: WebElement в порядке локаторов.
+
+        Raises:
+            TimeoutException: Если не все элементы перешли в состояние за timeout
+                              (или за откалиброванный таймаут)
+        """
+        targets = [list(_to_selector(locator)) for locator in locators]
+        description = f"{state}: " + ", ".join(locator[1] for locator in locators)
+        polling = _Polling(self, description, timeout)
+        while True:
+            try:
+                found = self.driver.execute_async_script(
+                    _OBSERVE_SCRIPT, targets, state, polling.script_wait_ms()
+                )
+            except WebDriverException as e:
+                if not _can_retry(e, description):
+                    raise
+                found = None
+            pause = polling.next_pause(found, f"Элементы {locators} не стали '{state}'")
+            if pause is None:
+                return found
+            time.sleep(pause)
+
+    def _condition_key(self, description):
+        # Время одного и того же условия зависит от сетевого профиля браузера
+        # и от контекста (пользователя)
+        parts = (applied_profile(self.driver), self.context, description)
+        return ": ".join(part for part in parts if part)
+
+    def _report(self, description, ready, started, round_trips):
+        report = WaitReport(
+            description, ready, time.monotonic() - started, round_trips
+        )
+        self.history.append(report)
+        logger.debug(
+            "Ожидание '%s': %s за %.3f с (%d обращений)",
+            description,
+            "готово" if ready else "таймаут",
+            report.elapsed,
+            round_trips,
+        )
+        return report
+
+
+class AsyncWaiter(Waiter):
+    """
+    Ожидания Waiter для utils.async_webdriver.AsyncWebDriver.
+
+    Те же ожидания одним скриптом с MutationObserver и опрос условий
+    с экспоненциальной задержкой, но паузы выполняются через asyncio.sleep:
+    пока одна страница ждет элемент, цикл событий ведет другие браузеры.
+    Расписание попыток (_Polling), калибровка таймаутов и history - общие
+    с Waiter.
+    """
+
+    async def until(self, condition, timeout, description=""):
+        """
+        Опрашивает условие, пока оно не вернет истинное значение.
+
+        Args:
+            condition: Корутина-функция (driver) -> значение
+            timeout: Максимальное время ожидания в секундах
+            description: Описание условия для отчета
+
+        Returns:
+            Первое истинное значение, которое вернуло условие.
+
+        Raises:
+            TimeoutException: Если условие не выполнилось за timeout
+                              (или за откалиброванный таймаут)
+        """
+        polling = _Polling(self, description, timeout)
+        while True:
+            try:
+                value = await condition(self.driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                value = None
+            pause = polling.next_pause(value, f"Условие '{description}' не выполнилось")
+            if pause is None:
+                return value
+            await asyncio.sleep(pause)
+
+    async def element(self, locator, state="visible", timeout=10):
+        """
+        Ожидает элемент в нужном состоянии одним скриптом в браузере.
+
+        Returns:
+            AsyncElement: Найденный элемент.
+        """
+        return (await self.elements([locator], state, timeout))[0]
+
+    async def elements(self, locators, state="visible", timeout=10):
+        """
+        Ожидает сразу несколько элементов одним скриптом в браузере.
+
+        Args:
+            locators: Список кортежей (By, значение)
+            state: 'present', 'visible' или 'clickable' для всех элементов
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            list: AsyncElement в порядке локаторов.
+
+        Raises:
+            TimeoutException: Если не все элементы перешли в состояние за timeout
+                              (или за откалиброванный таймаут)
+        """
+        targets = [list(_to_selector(locator)) for locator in locators]
+        description = f"{state}: " + ", ".join(locator[1] for locator in locators)
+        polling = _Polling(self, description, timeout)
+        while True:
+            try:
+                found = await self.driver.execute_async_script(
+                    _OBSERVE_SCRIPT, targets, state, polling.script_wait_ms()
+                )
+            except WebDriverException as e:
+                if not _can_retry(e, description):
+                    raise
+                found = None
+            pause = polling.next_pause(found, f"Элементы {locators} не стали '{state}'")
+            if pause is None:
+                return found
+            await asyncio.sleep(pause)
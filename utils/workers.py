@@ -0,0 +1,129 @@
+import atexit
+import itertools
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+
+from conf.config import CHROME_PROFILE_TMPFS, DEBUG_PORT_BASE, DEBUG_PORTS_PER_WORKER
+
+
+def worker_id():
+    """
+    Возвращает идентификатор текущего процесса-воркера.
+
+    Учитывает как собственный параллельный запуск (WORKER_ID),
+    так и pytest-xdist (PYTEST_XDIST_WORKER).
+
+    Returns:
+        str: Идентификатор вида 'gw0' или 'master' для обычного запуска.
+    """
+    return (
+        os.getenv("WORKER_ID")
+        or os.getenv("PYTEST_XDIST_WORKER")
+        or "master"
+    )
+
+
+def worker_index():
+    """
+    Возвращает порядковый номер воркера.
+
+    Returns:
+        int: Номер воркера (0 для обычного запуска).
+    """
+    match = re.search(r"\d+$", worker_id())
+    return int(match.group()) if match else 0
+
+
+class PortAllocator:
+    """
+    Выдает свободные порты из диапазона, закрепленного за воркером.
+
+    Каждому воркеру достается непересекающийся диапазон
+    [base + index * size, base + (index + 1) * size), поэтому браузеры
+    разных воркеров не конфликтуют за remote-debugging-port.
+    """
+
+    def __init__(self, base=DEBUG_PORT_BASE, size=DEBUG_PORTS_PER_WORKER):
+        self.first = base + worker_index() * size
+        self.size = size
+        self._ports = itertools.cycle(range(self.first, self.first + size))
+        self._lock = threading.Lock()
+
+    def next_port(self):
+        """
+        Returns:
+            int: Свободный на момент вызова порт из диапазона воркера.
+
+        Raises:
+            RuntimeError: Если все порты диапазона заняты
+        """
+        with self._lock:
+            for _ in range(self.size):
+                port = next(self._ports)
+                if _is_port_free(port):
+                    return port
+        raise RuntimeError(
+            f"Нет свободных портов в диапазоне {self.first}-{self.first + self.size - 1}"
+        )
+
+
+def _is_port_free(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(("127.0.0.1", port))
+        except OSError:
+            return False
+    return True
+
+
+_profiles_roots = {}
+_profiles_lock = threading.Lock()
+
+# Файлы блокировки запущенного Chrome не должны попасть в копию профиля
+_PROFILE_LOCKS = ("SingletonLock", "SingletonCookie", "SingletonSocket")
+
+
+def _profiles_root(base):
+    with _profiles_lock:
+        if base not in _profiles_roots:
+            root = tempfile.mkdtemp(prefix=f"chrome-{worker_id()}-", dir=base)
+            atexit.register(shutil.rmtree, root, ignore_errors=True)
+            _profiles_roots[base] = root
+        return _profiles_roots[base]
+
+
+def new_profile_dir(snapshot=None):
+    """
+    Создает отдельный каталог профиля Chrome для текущего воркера.
+
+    Все каталоги воркера лежат в общем временном каталоге,
+    который удаляется при завершении процесса. Если указан снимок профиля,
+    каталог заполняется его копией в tmpfs (CHROME_PROFILE_TMPFS), а сам
+    снимок остается неизменным.
+
+    Args:
+        snapshot: Каталог снимка профиля или None для пустого профиля
+
+    Returns:
+        str: Путь к каталогу user-data-dir.
+    """
+    if snapshot is None:
+        return tempfile.mkdtemp(prefix="profile-", dir=_profiles_root(None))
+
+    base = CHROME_PROFILE_TMPFS if os.path.isdir(CHROME_PROFILE_TMPFS) else None
+    profile_dir = tempfile.mkdtemp(prefix="profile-", dir=_profiles_root(base))
+    shutil.copytree(
+        snapshot,
+        profile_dir,
+        ignore=shutil.ignore_patterns(*_PROFILE_LOCKS),
+        copy_function=shutil.copyfile,
+        dirs_exist_ok=True,
+    )
+    return profile_dir
+
+
+debug_ports = PortAllocator()